@@ -0,0 +1,46 @@
+import os
+import sys
+
+APP_NAME = "TicketGenerator"
+
+
+def user_data_dir():
+    """
+    Per-user folder for state the app keeps between runs (created on first use).
+
+    %LOCALAPPDATA%/TicketGenerator on Windows, ~/Library/Application Support/TicketGenerator
+    on macOS and $XDG_DATA_HOME (~/.local/share)/TicketGenerator elsewhere.
+
+    Returns:
+        str: The folder path.
+    """
+    if sys.platform == "win32":
+        base = os.getenv("LOCALAPPDATA") or os.path.expanduser("~\\AppData\\Local")
+    elif sys.platform == "darwin":
+        base = os.path.expanduser("~/Library/Application Support")
+    else:
+        base = os.getenv("XDG_DATA_HOME") or os.path.expanduser("~/.local/share")
+    path = os.path.join(base, APP_NAME)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def user_cache_dir(name=""):
+    """
+    Per-user folder for data that can be rebuilt at any time (created on first use).
+
+    Args:
+        name (str): Optional subfolder, e.g. "render_cache".
+
+    Returns:
+        str: The folder path.
+    """
+    if sys.platform == "win32":
+        base = os.path.join(os.getenv("LOCALAPPDATA") or os.path.expanduser("~\\AppData\\Local"), APP_NAME, "Cache")
+    elif sys.platform == "darwin":
+        base = os.path.join(os.path.expanduser("~/Library/Caches"), APP_NAME)
+    else:
+        base = os.path.join(os.getenv("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), APP_NAME)
+    path = os.path.join(base, name) if name else base
+    os.makedirs(path, exist_ok=True)
+    return path
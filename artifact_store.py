@@ -0,0 +1,157 @@
+import atexit
+import os
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+
+import metrics
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def default_max_bytes():
+    """
+    Memory budget of the artifact store when the caller does not say.
+
+    Reads TICKET_ARTIFACT_MEMORY_MB from the environment (or .env).
+
+    Returns:
+        int: Budget in bytes.
+    """
+    configured = os.getenv("TICKET_ARTIFACT_MEMORY_MB", "").strip()
+    if configured.isdigit():
+        return int(configured) * 1024 * 1024
+    return DEFAULT_MAX_BYTES
+
+
+class ArtifactStore:
+    """
+    Session-scoped store of rendered ticket PDFs.
+
+    Artifacts are kept in memory as bytes until they add up to max_bytes;
+    past that the least recently used ones are spilled to a private
+    directory made for this session only. Keys are unique within the
+    session, so two app instances (or two batches in one) never read each
+    other's tickets. Everything, including the spill directory, is removed
+    by close(), which runs at interpreter exit.
+
+    Attributes:
+        max_bytes (int): Memory budget before artifacts are spilled to disk.
+        memory_bytes (int): Bytes currently held in memory.
+    """
+
+    def __init__(self, max_bytes=None):
+        self.max_bytes = default_max_bytes() if max_bytes is None else max_bytes
+        self.memory_bytes = 0
+        self._memory = OrderedDict()  # key -> bytes, least recently used first
+        self._spilled = {}  # key -> file path
+        self._directory = None
+        self._next_id = 0
+        self._lock = threading.Lock()
+        atexit.register(self.close)
+
+    def _spill(self):
+        # Called with the lock held
+        while self.memory_bytes > self.max_bytes and self._memory:
+            key, data = self._memory.popitem(last=False)
+            self.memory_bytes -= len(data)
+            if self._directory is None:
+                self._directory = tempfile.mkdtemp(prefix="ticket-artifacts-")
+            path = os.path.join(self._directory, f"{key}.pdf")
+            with open(path, "wb") as f:
+                f.write(data)
+            self._spilled[key] = path
+            metrics.count("artifacts_spilled")
+
+    def add(self, data, name="artifact"):
+        """
+        Store a rendered PDF under a new key.
+
+        Args:
+            data (bytes): The PDF.
+            name (str): Prefix of the key, to tell artifacts apart when debugging.
+
+        Returns:
+            str: The artifact's key.
+        """
+        with self._lock:
+            key = f"{name}-{self._next_id}"
+            self._next_id += 1
+            self._memory[key] = data
+            self.memory_bytes += len(data)
+            self._spill()
+        return key
+
+    def get(self, key):
+        """
+        Read an artifact.
+
+        Args:
+            key (str): The artifact's key.
+
+        Returns:
+            bytes | None: The PDF, or None if there is no such artifact.
+        """
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+                return data
+            path = self._spilled.get(key)
+        if path is None:
+            return None
+        try:
+            with open(path, "rb") as f:
+                return f.read()
+        except OSError:
+            return None  # Discarded while it was being read
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._memory or key in self._spilled
+
+    def discard(self, key):
+        """
+        Drop an artifact that is no longer needed.
+
+        Args:
+            key (str): The artifact's key.
+        """
+        with self._lock:
+            data = self._memory.pop(key, None)
+            if data is not None:
+                self.memory_bytes -= len(data)
+            path = self._spilled.pop(key, None)
+        if path is not None:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def close(self):
+        """Drop every artifact and delete the spill directory."""
+        with self._lock:
+            self._memory.clear()
+            self._spilled.clear()
+            self.memory_bytes = 0
+            directory, self._directory = self._directory, None
+        if directory is not None:
+            shutil.rmtree(directory, ignore_errors=True)
+
+
+def get_artifact_store():
+    """
+    Return this session's artifact store, creating it on first use.
+
+    Returns:
+        ArtifactStore: The shared store.
+    """
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = ArtifactStore()
+        return _store
@@ -1,983 +0,0 @@
-// Copied from gunidecomp.h in GLib:
-// 	s/[G]_UNICODE_MAX_TABLE_INDEX/UNICODE_MAX_TABLE_INDEX/g
-// 	s/[g]uchar/Unicode/g
-// 	s/[g]int16/short/g
-// Can be regenerated from gen-unicode-tables.pl, also in GLib, with relevant
-// Unicode data tables from ftp.unicode.org.
-
-static const Unicode cclass_data[][256] = {
-    { /* page 3, index 0 */
-      230, 230, 230, 230, 230, 230, 230, 230, 230, 230, 230, 230, 230, 230, 230, 230, 230, 230, 230, 230, 230, 232, 220, 220, 220, 220, 232, 216, 220, 220, 220, 220, 220, 202, 202, 220, 220, 220, 220, 202, 202, 220, 220,
-      220, 220, 220, 220, 220, 220, 220, 220, 220, 1,   1,   1,   1,   1,   220, 220, 220, 220, 230, 230, 230, 230, 230, 230, 230, 230, 240, 230, 220, 220, 220, 230, 230, 230, 220, 220, 0,   230, 230, 230, 220, 220, 220,
-      220, 230, 0,   0,   0,   0,   0,   234, 234, 233, 234, 234, 233, 230, 230, 230, 230, 230, 230, 230, 230, 230, 230, 230, 230, 230, 0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,
-      0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,
-      0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,
-      0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0 },
-    { /* page 4, index 1 */
-      0, 0, 0, 0,   0,   0,   0,   0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-      0, 0, 0, 0,   0,   0,   0,   0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-      0, 0, 0, 230, 230, 230, 230, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-      0, 0, 0, 0,   0,   0,   0,   0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0 },
-    { /* page 5, index 2 */
-      0,   0,   0,   0,   0,   0,   0, 0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, 0,  0,  0,  0, 0,  0, 0,  0,  0, 0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,
-      0,   0,   0,   0,   0,   0,   0, 0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, 0,  0,  0,  0, 0,  0, 0,  0,  0, 0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,
-      0,   0,   0,   0,   0,   0,   0, 0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, 0,  0,  0,  0, 0,  0, 0,  0,  0, 0,   220, 230, 230, 230, 230, 220, 230, 230, 230, 222, 220,
-      230, 230, 230, 230, 230, 230, 0, 220, 220, 220, 220, 220, 230, 230, 220, 230, 230, 222, 228, 230, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 0, 20, 21, 22, 0, 23, 0, 24, 25, 0, 230, 0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,
-      0,   0,   0,   0,   0,   0,   0, 0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, 0,  0,  0,  0, 0,  0, 0,  0,  0, 0,   0,   0,   0,   0,   0,   0,   0 },
-    { /* page 6, index 3 */
-      0, 0, 0, 0, 0, 0, 0,   0,   0,   0,   0,   0,   0,   0, 0, 0,   230, 230, 230, 230, 230, 230, 0, 0,   0,   0,  0,   0,   0,   0,   0,  0,   0,   0,   0,   0,   0,   0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-      0, 0, 0, 0, 0, 0, 0,   0,   0,   0,   0,   0,   0,   0, 0, 0,   0,   0,   0,   0,   0,   0,   0, 27,  28,  29, 30,  31,  32,  33,  34, 230, 230, 220, 220, 230, 230, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-      0, 0, 0, 0, 0, 0, 0,   0,   35,  0,   0,   0,   0,   0, 0, 0,   0,   0,   0,   0,   0,   0,   0, 0,   0,   0,  0,   0,   0,   0,   0,  0,   0,   0,   0,   0,   0,   0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-      0, 0, 0, 0, 0, 0, 0,   0,   0,   0,   0,   0,   0,   0, 0, 0,   0,   0,   0,   0,   0,   0,   0, 0,   0,   0,  0,   0,   0,   0,   0,  0,   0,   0,   0,   0,   0,   0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-      0, 0, 0, 0, 0, 0, 230, 230, 230, 230, 230, 230, 230, 0, 0, 230, 230, 230, 230, 220, 230, 0,   0, 230, 230, 0,  220, 230, 230, 220, 0,  0,   0,   0,   0,   0,   0,   0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0 },
-    { /* page 7, index 4 */
-      0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   36,  0,   0,   0,   0,   0,   0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 230, 220, 230, 230,
-      220, 230, 230, 220, 220, 220, 230, 220, 220, 230, 220, 230, 230, 230, 220, 230, 220, 230, 220, 230, 220, 230, 230, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,   0,   0,   0,
-      0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,   0,   0,   0,
-      0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,   0,   0,   0,
-      0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0 },
-    { /* page 9, index 5 */
-      0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,   0,   0,   0,   0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 7, 0, 0, 0,
-      0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 9, 0, 0, 0, 230, 220, 230, 230, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-      0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,   0,   0,   0,   0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 7, 0, 0, 0,
-      0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 9, 0, 0, 0, 0,   0,   0,   0,   0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0 },
-    { /* page 10, index 6 */
-      0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 7, 0, 0, 0,
-      0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 9, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-      0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 7, 0, 0, 0,
-      0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 9, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0 },
-    { /* page 11, index 7 */
-      0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 7, 0, 0, 0,
-      0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 9, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-      0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-      0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 9, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0 },
-    { /* page 12, index 8 */
-      0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,  0,  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-      0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 9, 0, 0, 0, 0, 0, 0, 0, 84, 91, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-      0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,  0,  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 7, 0, 0, 0,
-      0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 9, 0, 0, 0, 0, 0, 0, 0, 0,  0,  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0 },
-    { /* page 13, index 9 */
-      0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-      0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 9, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-      0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-      0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 9, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0 },
-    { /* page 14, index 10 */
-      0, 0, 0, 0, 0, 0, 0, 0, 0,   0,   0,   0,   0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 103, 103, 9, 0, 0, 0, 0, 0,
-      0, 0, 0, 0, 0, 0, 0, 0, 107, 107, 107, 107, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,   0,   0, 0, 0, 0, 0, 0,
-      0, 0, 0, 0, 0, 0, 0, 0, 0,   0,   0,   0,   0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 118, 118, 0, 0, 0, 0, 0, 0,
-      0, 0, 0, 0, 0, 0, 0, 0, 122, 122, 122, 122, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,   0,   0, 0, 0, 0, 0, 0 },
-    { /* page 15, index 11 */
-      0,   0, 0,   0,   0, 0, 0,   0,   0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 220, 220, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,   0,   0, 0,   220, 0, 220, 0, 216, 0,   0,   0,   0,   0, 0,
-      0,   0, 0,   0,   0, 0, 0,   0,   0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,   0,   0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 129, 130, 0, 132, 0,   0, 0,   0, 0,   130, 130, 130, 130, 0, 0,
-      130, 0, 230, 230, 9, 0, 230, 230, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,   0,   0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,   0,   0, 0,   0,   0, 0,   0, 0,   0,   0,   0,   0,   0, 0,
-      0,   0, 0,   0,   0, 0, 220, 0,   0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,   0,   0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,   0,   0, 0,   0,   0, 0,   0, 0,   0,   0,   0,   0,   0, 0 },
-    { /* page 16, index 12 */
-      0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 7, 0, 9, 0, 0, 0, 0, 0, 0,
-      0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-      0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-      0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0 },
-    { /* page 23, index 13 */
-      0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 9, 0, 0, 0, 0, 0, 0, 0, 0, 0,   0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 9, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-      0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,   0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-      0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,   0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-      0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 9, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 230, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0 },
-    { /* page 24, index 14 */
-      0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,   0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-      0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,   0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-      0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 228, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-      0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,   0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0 },
-    { /* page 25, index 15 */
-      0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 222, 230, 220, 0, 0, 0, 0,
-      0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,   0,   0,   0, 0, 0, 0,
-      0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,   0,   0,   0, 0, 0, 0,
-      0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,   0,   0,   0, 0, 0, 0 },
-    { /* page 32, index 16 */
-      0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,   0,   0, 0, 0,   0,   0,   0,   0, 0, 0, 0,   0,   0, 0, 0, 0, 0,   0, 0, 0, 0, 0, 0,   0,   0,   0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-      0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,   0,   0, 0, 0,   0,   0,   0,   0, 0, 0, 0,   0,   0, 0, 0, 0, 0,   0, 0, 0, 0, 0, 0,   0,   0,   0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-      0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,   0,   0, 0, 0,   0,   0,   0,   0, 0, 0, 0,   0,   0, 0, 0, 0, 0,   0, 0, 0, 0, 0, 0,   0,   0,   0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-      0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 230, 230, 1, 1, 230, 230, 230, 230, 1, 1, 1, 230, 230, 0, 0, 0, 0, 230, 0, 0, 0, 1, 1, 230, 220, 230, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0 },
-    { /* page 48, index 17 */
-      0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 218, 228, 232, 222, 224, 224, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-      0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,   0,   0,   0,   0,   0,   0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-      0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 8, 8, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,   0,   0,   0,   0,   0,   0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-      0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,   0,   0,   0,   0,   0,   0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0 },
-    { /* page 251, index 18 */
-      0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 26, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-      0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-      0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-      0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,  0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0 },
-    { /* page 254, index 19 */
-      0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 230, 230, 230, 230, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-      0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,   0,   0,   0,   0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-      0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,   0,   0,   0,   0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-      0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,   0,   0,   0,   0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0 },
-    { /* page 465, index 20 */
-      0, 0, 0, 0, 0, 0,   0,   0,   0,   0,   0,   0, 0, 0, 0,   0,   0,   0,   0, 0,   0,   0,   0,   0,   0,   0,   0,   0, 0, 0,   0,   0,   0,   0,   0,   0,   0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,   0,   0,
-      0, 0, 0, 0, 0, 0,   0,   0,   0,   0,   0,   0, 0, 0, 0,   0,   0,   0,   0, 0,   0,   0,   0,   0,   0,   0,   0,   0, 0, 0,   0,   0,   0,   0,   0,   0,   0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 216, 216, 1,
-      1, 1, 0, 0, 0, 226, 216, 216, 216, 216, 216, 0, 0, 0, 0,   0,   0,   0,   0, 220, 220, 220, 220, 220, 220, 220, 220, 0, 0, 230, 230, 230, 230, 230, 220, 220, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,   0,   0,
-      0, 0, 0, 0, 0, 0,   0,   0,   0,   0,   0,   0, 0, 0, 230, 230, 230, 230, 0, 0,   0,   0,   0,   0,   0,   0,   0,   0, 0, 0,   0,   0,   0,   0,   0,   0,   0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,   0,   0,
-      0, 0, 0, 0, 0, 0,   0,   0,   0,   0,   0,   0, 0, 0, 0,   0,   0,   0,   0, 0,   0,   0,   0,   0,   0,   0,   0,   0, 0, 0,   0,   0,   0,   0,   0,   0,   0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0 }
-};
-
-static const short combining_class_table_part1[763] = { 0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 /* page 3 */,
-                                                        1 /* page 4 */,
-                                                        2 /* page 5 */,
-                                                        3 /* page 6 */,
-                                                        4 /* page 7 */,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        5 /* page 9 */,
-                                                        6 /* page 10 */,
-                                                        7 /* page 11 */,
-                                                        8 /* page 12 */,
-                                                        9 /* page 13 */,
-                                                        10 /* page 14 */,
-                                                        11 /* page 15 */,
-                                                        12 /* page 16 */,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        13 /* page 23 */,
-                                                        14 /* page 24 */,
-                                                        15 /* page 25 */,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        16 /* page 32 */,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        17 /* page 48 */,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        18 /* page 251 */,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        19 /* page 254 */,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        20 /* page 465 */,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX,
-                                                        0 + UNICODE_MAX_TABLE_INDEX };
-
-static const short combining_class_table_part2[768] = {
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX,
-    0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX, 0 + UNICODE_MAX_TABLE_INDEX
-};
@@ -0,0 +1,200 @@
+"""
+Times each stage of the ticket pipeline on synthetic exports of increasing size.
+
+Stages: handle_file (TSV and xlsx), group_orders, fill_pdf (per ticket),
+generate_previews, generate_tickets and preview rasterization. Results are
+written as JSON tagged with the current commit, so two runs can be compared.
+
+Usage:
+    python -m benchmarks.run_benchmarks                       # 100, 1000, 10000 tickets
+    python -m benchmarks.run_benchmarks --sizes 100 1000 --workers 4
+    python -m benchmarks.run_benchmarks --compare benchmarks/results/<older>.json
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.synthetic_export import write_export
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TEMPLATE_PATH = os.path.join(REPO_ROOT, "assets", "delivery_ticket_template.pdf")
+RESULTS_DIR = os.path.join(REPO_ROOT, "benchmarks", "results")
+STAGES = (
+    "handle_file_tsv",
+    "handle_file_xlsx",
+    "group_orders",
+    "fill_pdf",
+    "generate_previews",
+    "generate_tickets",
+    "rasterize_preview",
+)
+
+
+def git_commit():
+    """
+    Return the commit the benchmark ran on.
+
+    Returns:
+        str: The short commit hash, with "-dirty" if the tree has changes, or "unknown".
+    """
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT,
+                                capture_output=True, text=True, check=True).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=REPO_ROOT,
+                               capture_output=True, text=True, check=True).stdout.strip()
+        return f"{commit}-dirty" if dirty else commit
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def timed(function, *args, **kwargs):
+    """
+    Call a function and measure its wall time.
+
+    Returns:
+        tuple: (seconds, return value)
+    """
+    started = time.perf_counter()
+    result = function(*args, **kwargs)
+    return time.perf_counter() - started, result
+
+
+def run_size(tickets, workdir, stages, workers, seed):
+    """
+    Run the selected stages on one synthetic export size.
+
+    Args:
+        tickets (int): Number of tickets (patients) in the export.
+        workdir (str): Scratch folder for exports and output.
+        stages (tuple): Stage names to time.
+        workers (int | None): Render processes for the render stages.
+        seed (int): Random seed for the export.
+
+    Returns:
+        dict: Seconds per stage, plus row and ticket counts.
+    """
+    from artifact_store import get_artifact_store
+    from fill_pdf import fill_pdf
+    from pdf_handler import (create_ticket_from_group, generate_previews, generate_tickets, group_orders,
+                             render_preview_image)
+    from tsv_handler import handle_file
+
+    tsv_path = os.path.join(workdir, f"export_{tickets}.tsv")
+    xlsx_path = os.path.join(workdir, f"export_{tickets}.xlsx")
+    line_items = write_export(tsv_path, tickets, duplicate_rate=0.05, seed=seed)
+    result = {"tickets": tickets, "line_items": line_items, "seconds": {}}
+    seconds = result["seconds"]
+
+    if "handle_file_xlsx" in stages:
+        write_export(xlsx_path, tickets, duplicate_rate=0.05, seed=seed)
+        seconds["handle_file_xlsx"], _ = timed(handle_file, xlsx_path)
+
+    seconds["handle_file_tsv"], (rows, _) = timed(handle_file, tsv_path)
+    result["rows"] = len(rows)
+
+    elapsed, grouped = timed(group_orders, rows)
+    if "group_orders" in stages:
+        seconds["group_orders"] = elapsed
+    grouped.sort(key=lambda g: g[3])
+    result["grouped"] = len(grouped)
+
+    if "fill_pdf" in stages:
+        output_path = os.path.join(workdir, "single.pdf")
+        sample = [create_ticket_from_group(group) for group in grouped[:50]]
+        elapsed, _ = timed(lambda: [fill_pdf(ticket, TEMPLATE_PATH, output_path) for ticket in sample])
+        seconds["fill_pdf"] = elapsed / len(sample)  # per ticket
+
+    previews = None
+    if "generate_previews" in stages or "rasterize_preview" in stages:
+        elapsed, previews = timed(generate_previews, grouped, TEMPLATE_PATH, None, workers=workers)
+        if "generate_previews" in stages:
+            seconds["generate_previews"] = elapsed
+
+    if "generate_tickets" in stages:
+        output_dir = os.path.join(workdir, f"tickets_{tickets}")
+        seconds["generate_tickets"], _ = timed(generate_tickets, grouped, TEMPLATE_PATH, output_dir, workers=workers)
+
+    if "rasterize_preview" in stages:
+        store = get_artifact_store()
+        sample = [key for key, _, _ in previews[:100]]
+        elapsed, _ = timed(lambda: [render_preview_image(store.get(key)) for key in sample])
+        seconds["rasterize_preview"] = elapsed / len(sample)  # per preview
+
+    for stage in list(seconds):
+        if stage not in stages:
+            del seconds[stage]
+    return result
+
+
+def compare(current, baseline):
+    """
+    Print each stage's time relative to an earlier run.
+
+    Args:
+        current (dict): This run's report.
+        baseline (dict): An earlier report loaded from JSON.
+    """
+    previous = {entry["tickets"]: entry["seconds"] for entry in baseline["results"]}
+    print(f"\nCompared with {baseline['commit']} ({baseline['timestamp']}):")
+    for entry in current["results"]:
+        before = previous.get(entry["tickets"])
+        if not before:
+            continue
+        for stage, seconds in entry["seconds"].items():
+            if stage in before and before[stage]:
+                ratio = seconds / before[stage]
+                flag = "  <-- slower" if ratio > 1.1 else ""
+                print(f"  {entry['tickets']:>6} tickets  {stage:<18} {ratio:6.2f}x{flag}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the ticket pipeline on synthetic exports.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000], help="ticket counts to run")
+    parser.add_argument("--stages", nargs="+", choices=STAGES, default=list(STAGES), help="stages to time")
+    parser.add_argument("--workers", type=int, default=None, help="render processes (default: CPU count)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="JSON file to write (default: benchmarks/results/<timestamp>-<commit>.json)")
+    parser.add_argument("--compare", help="earlier results JSON to compare against")
+    args = parser.parse_args(argv)
+
+    sys.path.insert(0, REPO_ROOT)
+    report = {
+        "commit": git_commit(),
+        "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "workers": args.workers,
+        "results": [],
+    }
+
+    with tempfile.TemporaryDirectory(prefix="ticket_bench_") as workdir:
+        for tickets in args.sizes:
+            entry = run_size(tickets, workdir, tuple(args.stages), args.workers, args.seed)
+            report["results"].append(entry)
+            timings = ", ".join(f"{stage} {seconds:.3f}s" for stage, seconds in entry["seconds"].items())
+            print(f"{tickets} tickets: {timings}")
+
+    output = args.output
+    if not output:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        stamp = report["timestamp"].replace(":", "").replace("-", "")
+        output = os.path.join(RESULTS_DIR, f"{stamp}-{report['commit']}.json")
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            compare(report, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+"""
+Synthetic QuickBooks "Delivery Ticket Report" exports for benchmarking.
+
+Produces files in the two shapes handle_file reads:
+    - .tsv: header line, 5 report rows, line items with continuation and
+      memo lines, 4 trailer rows.
+    - .xlsx: 4 report title rows above the header row, then line items.
+
+Usage:
+    python -m benchmarks.synthetic_export out.tsv --patients 1000
+"""
+
+import argparse
+import csv
+import random
+
+TSV_COLUMNS = (
+    "Date",
+    "Customer first name",
+    "Customer middle name",
+    "Customer last name",
+    "Account number",
+    "Customer ship street",
+    "Customer ship city",
+    "Customer ship state",
+    "Customer ship zip",
+    "Customer phone",
+    "Customer email",
+    "Quantity",
+    "Product/Service",
+    "Product/Service Description",
+    "SKU",
+    "Category",
+)
+
+FIRST_NAMES = ("Mary", "James", "Linda", "Robert", "Patricia", "John", "Barbara", "Michael", "Susan", "David")
+LAST_NAMES = ("Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis", "Wilson", "Moore")
+CITIES = (("Springfield", "IL", "62701"), ("Madison", "WI", "53703"), ("Columbus", "OH", "43215"),
+          ("Salem", "OR", "97301"), ("Dover", "DE", "19901"))
+PRODUCTS = (
+    ("E0100", "Cane, includes canes of all materials, adjustable or fixed, with tip", "CANE-STD"),
+    ("E0143", "Walker, folding, wheeled, adjustable or fixed height", "WLK-FW"),
+    ("E0163", "Commode chair, mobile or stationary, with fixed arms", "CMD-FA"),
+    ("E0260", "Hospital bed, semi-electric, with any type side rails, with mattress", "BED-SE"),
+    ("A4253", "Blood glucose test or reagent strips for home blood glucose monitor, per 50 strips", "GLU-50"),
+    ("E0601", "Continuous positive airway pressure (CPAP) device", "CPAP-01"),
+    ("A7030", "Full face mask used with positive airway pressure device, each", "MASK-FF"),
+    ("K0001", "Standard wheelchair", "WC-STD"),
+)
+
+
+def generate_line_items(patients, lines_per_order=(1, 4), duplicate_rate=0.0, seed=0):
+    """
+    Build the line items of a synthetic export, one order per patient.
+
+    Args:
+        patients (int): Number of patients, which is also the number of tickets.
+        lines_per_order (tuple): Inclusive (min, max) line items per order.
+        duplicate_rate (float): Fraction of line items emitted twice, as re-exported reports do.
+        seed (int): Random seed, so runs are reproducible.
+
+    Returns:
+        list[dict]: Line items keyed by TSV_COLUMNS.
+    """
+    rng = random.Random(seed)
+    items = []
+    for patient in range(patients):
+        city, state, zip_code = rng.choice(CITIES)
+        first = rng.choice(FIRST_NAMES)
+        last = f"{rng.choice(LAST_NAMES)}{patient}"
+        base = {
+            "Date": f"{rng.randint(1, 12):02d}/{rng.randint(1, 28):02d}/2025",
+            "Customer first name": first,
+            "Customer middle name": rng.choice(("", "", "A", "J")),
+            "Customer last name": last,
+            "Account number": str(100000 + patient),
+            "Customer ship street": f"{rng.randint(1, 9999)} Main St",
+            "Customer ship city": city,
+            "Customer ship state": state,
+            "Customer ship zip": zip_code,
+            "Customer phone": f"555-{rng.randint(100, 999)}-{rng.randint(1000, 9999)}",
+            "Customer email": f"{first.lower()}.{last.lower()}@example.com" if rng.random() < 0.5 else "",
+        }
+        for _ in range(rng.randint(*lines_per_order)):
+            code, description, sku = rng.choice(PRODUCTS)
+            item = dict(base)
+            item.update({
+                "Quantity": str(rng.randint(1, 3)),
+                "Product/Service": sku,
+                "Product/Service Description": description,
+                "SKU": sku,
+                "Category": f"{code} {description.split(',')[0]}",
+            })
+            items.append(item)
+            if rng.random() < duplicate_rate:
+                items.append(dict(item))
+    return items
+
+
+def write_tsv(path, items, continuation_rate=0.2, memo_rate=0.05, seed=0):
+    """
+    Write line items as a QuickBooks TSV export.
+
+    Args:
+        path (str): Output file path.
+        items (list[dict]): Line items from generate_line_items.
+        continuation_rate (float): Fraction of items followed by a wrapped description line.
+        memo_rate (float): Fraction of items followed by a memo line.
+        seed (int): Random seed for the extra lines.
+    """
+    rng = random.Random(seed)
+    blank = dict.fromkeys(TSV_COLUMNS, "")
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=TSV_COLUMNS, delimiter="\t")
+        writer.writeheader()
+        for title in ("Delivery Ticket Report", "Synthetic Medical Supply", "All Dates", "", ""):
+            writer.writerow({**blank, "Date": title})
+        for item in items:
+            writer.writerow(item)
+            if rng.random() < continuation_rate:
+                writer.writerow({**blank, "Product/Service Description": "(continued) see order notes"})
+            if rng.random() < memo_rate:
+                writer.writerow({**blank, "Product/Service Description": "Memo: deliver to side door"})
+        for trailer in ("", "TOTAL", "", "Generated by QuickBooks"):
+            writer.writerow({**blank, "Date": trailer})
+
+
+def write_xlsx(path, items):
+    """
+    Write line items as a QuickBooks Excel export.
+
+    Args:
+        path (str): Output file path.
+        items (list[dict]): Line items from generate_line_items.
+    """
+    import openpyxl
+
+    columns = [name for name in TSV_COLUMNS if name != "Product/Service"]
+    workbook = openpyxl.Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    for title in ("Delivery Ticket Report", "Synthetic Medical Supply", "All Dates", ""):
+        sheet.append([title])
+    sheet.append([name if name != "Product/Service Description" else "Product/service description" for name in columns])
+    for item in items:
+        sheet.append([item[name] for name in columns])
+    workbook.save(path)
+
+
+def write_export(path, patients, lines_per_order=(1, 4), duplicate_rate=0.0, seed=0):
+    """
+    Generate a synthetic export, choosing the format from the file extension.
+
+    Args:
+        path (str): Output file path ending in .tsv or .xlsx.
+        patients (int): Number of patients (tickets).
+        lines_per_order (tuple): Inclusive (min, max) line items per order.
+        duplicate_rate (float): Fraction of line items emitted twice.
+        seed (int): Random seed.
+
+    Returns:
+        int: Number of line items written, duplicates included.
+    """
+    items = generate_line_items(patients, lines_per_order, duplicate_rate, seed)
+    if path.endswith(".xlsx"):
+        write_xlsx(path, items)
+    elif path.endswith(".tsv"):
+        write_tsv(path, items, seed=seed)
+    else:
+        raise ValueError("Unsupported file format. Only .tsv and .xlsx are supported.")
+    return len(items)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write a synthetic QuickBooks export.")
+    parser.add_argument("output", help="file to write (.tsv or .xlsx)")
+    parser.add_argument("--patients", type=int, default=100)
+    parser.add_argument("--min-lines", type=int, default=1, help="fewest line items per order")
+    parser.add_argument("--max-lines", type=int, default=4, help="most line items per order")
+    parser.add_argument("--duplicate-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    count = write_export(args.output, args.patients, (args.min_lines, args.max_lines), args.duplicate_rate, args.seed)
+    print(f"Wrote {count} line items for {args.patients} patients to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""
+Headless batch entry point for the Ticket Generator.
+
+Runs the same pipeline as the GUI (read export -> group orders -> render
+tickets) without loading tkinter, so it can be run from a scheduler or on
+a server.
+
+Usage:
+    python cli.py INPUT_FILE -o OUTPUT_DIR [--workers N] [--layout split|flat]
+                  [--merge-mailed] [--json] [--summary-file PATH]
+                  [--metrics-json PATH] [--cache-dir PATH | --no-cache]
+
+Exit codes:
+    0: all tickets were written.
+    1: some rows could not be turned into tickets (see the summary's rejected_rows and errors).
+    2: the input could not be processed at all.
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import sys
+import time
+
+from dotenv import load_dotenv
+
+import metrics
+from pdf_handler import create_ticket_from_group, generate_tickets, group_orders
+from render_cache import RenderCache
+from tsv_handler import RowDeduplicator, iter_file_rows
+
+DEFAULT_TEMPLATE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "delivery_ticket_template.pdf")
+
+
+def build_parser():
+    """
+    Build the command-line argument parser.
+
+    Returns:
+        argparse.ArgumentParser: The parser.
+    """
+    parser = argparse.ArgumentParser(description="Generate delivery tickets from a QuickBooks export.")
+    parser.add_argument("input", help="QuickBooks export (.tsv or .xlsx)")
+    parser.add_argument("-o", "--output", required=True, help="folder to write the tickets to")
+    parser.add_argument("--template", default=DEFAULT_TEMPLATE, help="PDF ticket template")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="render processes (default: TICKET_RENDER_WORKERS or the CPU count; 1 = sequential)")
+    parser.add_argument("--layout", choices=("split", "flat"), default="split",
+                        help="'split' sorts tickets into emailed/ and mailed/ (default), 'flat' writes them all to OUTPUT")
+    parser.add_argument("--merge-mailed", action="store_true",
+                        help="also combine the mailed tickets into one PDF for printing")
+    parser.add_argument("--json", action="store_true", help="print the run summary as JSON")
+    parser.add_argument("--summary-file", help="also write the JSON run summary to this file")
+    parser.add_argument("--metrics-json", metavar="PATH",
+                        help="time every pipeline stage and write the report to this file")
+    cache = parser.add_mutually_exclusive_group()
+    cache.add_argument("--cache-dir", metavar="PATH",
+                       help="render cache folder (default: the per-user cache folder)")
+    cache.add_argument("--no-cache", action="store_true",
+                       help="render every ticket instead of reusing unchanged ones from earlier runs")
+    return parser
+
+
+def run(args):
+    """
+    Run one batch and collect its summary.
+
+    Args:
+        args (argparse.Namespace): Parsed command-line arguments.
+
+    Returns:
+        dict: The run summary.
+    """
+    started = time.perf_counter()
+    dedup = RowDeduplicator()
+    rejected = []
+    memos = []
+    grouped = group_orders(iter_file_rows(args.input, memos, dedup=dedup, rejected=rejected))
+
+    tickets = []
+    errors = []
+    for index, group in enumerate(grouped):
+        try:
+            tickets.append(create_ticket_from_group(group))
+        except ValueError as e:
+            errors.append({"group": index, "error": str(e)})
+    tickets.sort(key=lambda t: t.PatientLastName)
+
+    cache = None if args.no_cache else RenderCache(args.cache_dir)
+    paths = generate_tickets(
+        tickets,
+        args.template,
+        args.output,
+        workers=args.workers,
+        merge_mailed=args.merge_mailed,
+        split_by_delivery=args.layout == "split",
+        cache=cache,
+    )
+
+    emailed = sum(1 for ticket in tickets if ticket.EmailAddress)
+    return {
+        "input": os.path.abspath(args.input),
+        "output": os.path.abspath(args.output),
+        "rows": sum(len(group[11]) for group in grouped),
+        "memos": len(memos),
+        "duplicates_dropped": dedup.dropped,
+        "duplicate_rows": dedup.duplicate_rows,
+        "rejected_rows": rejected,
+        "tickets": len(paths),
+        "emailed": emailed,
+        "mailed": len(tickets) - emailed,
+        "cache_hits": cache.hits if cache else 0,
+        "errors": errors,
+        "files": paths,
+        "elapsed_seconds": round(time.perf_counter() - started, 3),
+    }
+
+
+def main(argv=None):
+    """
+    Command-line entry point.
+
+    Args:
+        argv (list[str] | None): Arguments, defaulting to sys.argv[1:].
+
+    Returns:
+        int: The process exit code.
+    """
+    load_dotenv()
+    args = build_parser().parse_args(argv)
+    if args.metrics_json:
+        metrics.enable()
+        metrics.reset()
+
+    try:
+        # Keep stdout clean for the JSON summary; progress notes from the pipeline go to stderr
+        with contextlib.redirect_stdout(sys.stderr if args.json else sys.stdout):
+            summary = run(args)
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+    if args.metrics_json:
+        metrics.write_report(args.metrics_json)
+
+    if args.summary_file:
+        with open(args.summary_file, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+
+    if args.json:
+        print(json.dumps(summary, indent=2))
+    else:
+        print(f"{summary['tickets']} tickets written to {summary['output']} "
+              f"({summary['emailed']} emailed, {summary['mailed']} mailed) "
+              f"in {summary['elapsed_seconds']}s.")
+        if summary["duplicates_dropped"]:
+            print(f"{summary['duplicates_dropped']} duplicate rows dropped.")
+        for reject in summary["rejected_rows"]:
+            print(f"Rejected row {reject['row']}: {reject['reason']}", file=sys.stderr)
+        for error in summary["errors"]:
+            print(f"Skipped group {error['group']}: {error['error']}", file=sys.stderr)
+
+    return 1 if summary["errors"] or summary["rejected_rows"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
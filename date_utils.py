@@ -0,0 +1,65 @@
+import datetime
+import functools
+import re
+
+# Same shape strptime's "%m/%d/%Y" accepts: 1-2 digit month, 1-2 digit (or space-padded) day, 4 digit year
+_MMDDYYYY = re.compile(r"(\d{1,2})/(\d{1,2}| \d)/(\d{4})")
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_mmddyyyy(text):
+    match = _MMDDYYYY.fullmatch(text)
+    if match is None:
+        return None
+    month, day, year = match.groups()
+    try:
+        return datetime.date(int(year), int(month), int(day))
+    except ValueError:
+        return None
+
+
+def parse_mmddyyyy(value):
+    """
+    Parses an MM/DD/YYYY date string.
+
+    Uses a precompiled pattern instead of strptime, and caches the result
+    per distinct string: an export has thousands of rows but only a few
+    dozen distinct dates.
+
+    Args:
+        value (str): The date string.
+
+    Returns:
+        datetime.date | None: The date, or None if value is not a valid MM/DD/YYYY date.
+    """
+    if not isinstance(value, str):
+        return None
+    return _parse_mmddyyyy(value)
+
+
+def is_mmddyyyy(value):
+    """
+    Checks if a value is a valid MM/DD/YYYY date string.
+
+    Args:
+        value (str): The value to check.
+
+    Returns:
+        bool: True if valid, False otherwise.
+    """
+    return parse_mmddyyyy(value) is not None
+
+
+@functools.lru_cache(maxsize=4096)
+def filename_date_token(value):
+    """
+    Formats an MM/DD/YYYY date string as the MMDDYYYY token used in ticket filenames.
+
+    Args:
+        value (str): The date string; surrounding whitespace is ignored.
+
+    Returns:
+        str: The token, or "unknown_date" if value is not a valid date.
+    """
+    date = parse_mmddyyyy(value.strip()) if isinstance(value, str) else None
+    return date.strftime("%m%d%Y") if date else "unknown_date"
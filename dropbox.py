@@ -1,48 +1,483 @@
+import io
+import json
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Optional
+
+import metrics
+import urllib3
+from app_paths import user_data_dir
 from dropbox_sign import ApiClient, Configuration, apis, models
 from dropbox_sign.rest import ApiException
+from template_index import CHECKBOX, get_template_index
+from template_store import get_template_store
 
+DEFAULT_HOST = "https://api.hellosign.com/v3"
 
-def send_signature_request(api_key=None, signer_name="", signer_email="", pdf_path=""):
-    """ Emails customer a request to sign the ticket through the dropbox_sign API to the email listed in the invoice
-    
-    Args:
-        api_key: A key that allows the app to connect to a specific dropbox sign account
-        signer_name: The name of the person signing for the order on the ticket
-        signer_email: The email of the person signing for the order on the ticket
-        pdf_path: The file path of the filled out ticket pdf
+# How many uploads run at once when the caller does not say
+DEFAULT_CONCURRENCY = 4
+
+# Attempts per ticket before a rate-limited or failing upload is reported as failed
+MAX_ATTEMPTS = 5
+
+# Longest single wait between attempts, in seconds
+MAX_BACKOFF = 60.0
+
+# Name given to tickets uploaded from memory rather than from a file
+UPLOAD_FILENAME = "delivery ticket.pdf"
+
+# Signing modes: upload every rendered ticket, or fill a template registered once
+UPLOAD_MODE = "upload"
+TEMPLATE_MODE = "template"
+
+# Template widget the customer signs in, and the role they sign as
+SIGNATURE_FIELD = "Sign"
+SIGNER_ROLE = "Customer"
+
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+@dataclass
+class SendResult:
     """
+    Outcome of sending one ticket for signature.
+
+    Attributes:
+        signer_name (str): Who was asked to sign.
+        signer_email (str): Where the request was sent.
+        pdf_path (str): The ticket that was uploaded.
+        request_id (Optional[str]): Dropbox Sign's signature_request_id on success.
+        error (Optional[str]): What went wrong otherwise.
+        attempts (int): Upload attempts made, including rate-limited ones.
+    """
+    signer_name: str
+    signer_email: str
+    pdf_path: str
+    request_id: Optional[str] = None
+    error: Optional[str] = None
+    attempts: int = 0
+
+    @property
+    def ok(self):
+        return self.request_id is not None
+
+
+def api_host():
+    """
+    Base URL of the Dropbox Sign API.
+
+    Reads DROPBOX_SIGN_HOST from the environment (or .env), so the app can be
+    pointed at dropbox_sign_stub.py for offline testing.
+
+    Returns:
+        str: The API base URL.
+    """
+    return os.getenv("DROPBOX_SIGN_HOST") or DEFAULT_HOST
+
+
+def default_concurrency():
+    """
+    Uploads in flight at once when the caller does not say.
+
+    Reads DROPBOX_SIGN_CONCURRENCY from the environment (or .env).
+
+    Returns:
+        int: Concurrency limit, at least 1.
+    """
+    configured = os.getenv("DROPBOX_SIGN_CONCURRENCY", "").strip()
+    if configured.isdigit() and int(configured) > 0:
+        return int(configured)
+    return DEFAULT_CONCURRENCY
+
+
+def signing_mode():
+    """
+    How tickets are sent for signature.
+
+    Reads DROPBOX_SIGN_MODE from the environment (or .env): "template" fills a
+    template registered once with each ticket's field values; anything else
+    uploads the rendered PDF of every ticket.
+
+    Returns:
+        str: TEMPLATE_MODE or UPLOAD_MODE.
+    """
+    return TEMPLATE_MODE if os.getenv("DROPBOX_SIGN_MODE", "").strip().lower() == TEMPLATE_MODE else UPLOAD_MODE
+
+
+def _resolve_api_key(api_key):
     if not api_key:
         api_key = os.getenv("DROPBOX_SIGN_API_KEY")
 
     if not api_key:
         raise ValueError("Dropbox Sign API key is not set.")
-    
-    config = Configuration()
-    config.username = api_key  # ✅ this is what Dropbox Sign expects
+    return api_key
+
 
+class SignatureClient:
+    """
+    One pooled connection to the Dropbox Sign API, safe to share between threads.
+
+    Attributes:
+        host (str): API base URL.
+        api_client (ApiClient): The SDK client holding the connection pool.
+        signature_api (SignatureRequestApi): Signature request endpoints.
+    """
+
+    def __init__(self, api_key=None, host=None, max_connections=DEFAULT_CONCURRENCY):
+        config = Configuration(host=host or api_host())
+        config.username = _resolve_api_key(api_key)  # ✅ this is what Dropbox Sign expects
+        config.connection_pool_maxsize = max_connections
+        self.host = config.host
+        self.api_client = ApiClient(config)
+        self.signature_api = apis.SignatureRequestApi(self.api_client)
 
-    with ApiClient(config) as api_client:
-        signature_api = apis.SignatureRequestApi(api_client)
+    def send(self, signer_name, signer_email, pdf, filename=UPLOAD_FILENAME, metadata=None):
+        """
+        Upload one ticket and ask the signer to sign it.
 
+        Args:
+            signer_name (str): The name of the person signing for the order on the ticket.
+            signer_email (str): The email of the person signing for the order on the ticket.
+            pdf (str | bytes): The file path of the filled out ticket pdf, or its contents.
+            filename (str): Name the upload is given when pdf is bytes.
+            metadata (dict | None): Key/value pairs stored with the request, to find it again later.
+
+        Returns:
+            str: The signature_request_id.
+
+        Raises:
+            ApiException: If the API rejects the request.
+        """
         signer = models.SubSignatureRequestSigner(
             email_address=signer_email,
             name=signer_name,
             order=0
         )
 
-        try:
-            with open(pdf_path, "rb") as pdf_file:
-                request_data = models.SignatureRequestSendRequest(
-                    title="Please sign your ticket",
-                    subject="Sign your delivery ticket",
-                    message="Please review and sign this document.",
-                    signers=[signer],
-                    files=[pdf_file],  # Pass open file, not path string
-                    test_mode=True
+        if isinstance(pdf, bytes):
+            pdf_file = io.BytesIO(pdf)
+            pdf_file.name = filename  # The SDK names the upload after the file object
+        else:
+            pdf_file = open(pdf, "rb")
+
+        with pdf_file:
+            request_data = models.SignatureRequestSendRequest(
+                title="Please sign your ticket",
+                subject="Sign your delivery ticket",
+                message="Please review and sign this document.",
+                signers=[signer],
+                files=[pdf_file],  # Pass open file, not path string
+                metadata=metadata,
+                test_mode=True
+            )
+
+            with metrics.stage("upload"):
+                response = self.signature_api.signature_request_send(request_data)
+        metrics.count("signature_requests_sent")
+        return response.signature_request.signature_request_id
+
+    def template_id_for(self, template_path):
+        """
+        Return the id of the signing template made from a ticket template, registering it on first use.
+
+        Ids are remembered per API host and template digest in the per-user
+        data folder, so a template is registered once, not once per session,
+        and again only when the PDF changes.
+
+        Args:
+            template_path (str): Path to the PDF ticket template.
+
+        Returns:
+            str: The template_id.
+        """
+        digest = get_template_store(template_path).digest
+        key = f"{self.host}|{digest}"
+        with _template_ids_lock:
+            template_ids = _load_template_ids()
+            template_id = template_ids.get(key)
+            if template_id is None:
+                template_id = self.register_template(template_path)
+                template_ids[key] = template_id
+                _save_template_ids(template_ids)
+            return template_id
+
+    def register_template(self, template_path):
+        """
+        Upload a ticket template and register it as a signing template.
+
+        Every handled field becomes a merge field named after the widget, so
+        requests fill it through custom_fields; the SIGNATURE_FIELD widget
+        becomes the signer's signature box.
+
+        Args:
+            template_path (str): Path to the PDF ticket template.
+
+        Returns:
+            str: The new template_id.
+        """
+        merge_fields, form_fields = template_form_fields(template_path)
+        template_file = io.BytesIO(get_template_store(template_path).data)
+        template_file.name = os.path.basename(template_path)
+        request_data = models.TemplateCreateRequest(
+            title="Delivery ticket",
+            files=[template_file],
+            signer_roles=[models.SubTemplateRole(name=SIGNER_ROLE, order=0)],
+            merge_fields=merge_fields,
+            form_fields_per_document=form_fields,
+            test_mode=True
+        )
+        with metrics.stage("register_template"):
+            response = apis.TemplateApi(self.api_client).template_create(request_data)
+        return response.template.template_id
+
+    def send_with_template(self, signer_name, signer_email, template_id, field_values, metadata=None):
+        """
+        Ask a signer to sign a ticket filled from a registered template; only the field values are sent.
+
+        Args:
+            signer_name (str): The name of the person signing for the order on the ticket.
+            signer_email (str): The email of the person signing for the order on the ticket.
+            template_id (str): From template_id_for().
+            field_values (dict): Field name -> value (template_field_values()).
+            metadata (dict | None): Key/value pairs stored with the request, to find it again later.
+
+        Returns:
+            str: The signature_request_id.
+
+        Raises:
+            ApiException: If the API rejects the request.
+        """
+        request_data = models.SignatureRequestSendWithTemplateRequest(
+            title="Please sign your ticket",
+            subject="Sign your delivery ticket",
+            message="Please review and sign this document.",
+            template_ids=[template_id],
+            signers=[models.SubSignatureRequestTemplateSigner(
+                role=SIGNER_ROLE, name=signer_name, email_address=signer_email)],
+            custom_fields=[models.SubCustomField(name=name, value=value) for name, value in field_values.items()],
+            metadata=metadata,
+            test_mode=True
+        )
+        with metrics.stage("upload"):
+            response = self.signature_api.signature_request_send_with_template(request_data)
+        metrics.count("signature_requests_sent")
+        return response.signature_request.signature_request_id
+
+    def close(self):
+        # This SDK's ApiClient has no close(); drop the pooled connections directly
+        self.api_client.rest_client.pool_manager.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+_template_ids_lock = threading.Lock()
+
+
+def _template_ids_path():
+    return os.path.join(user_data_dir(), "sign_templates.json")
+
+
+def _load_template_ids():
+    try:
+        with open(_template_ids_path(), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_template_ids(template_ids):
+    with open(_template_ids_path(), "w", encoding="utf-8") as f:
+        json.dump(template_ids, f, indent=2)
+
+
+def template_form_fields(template_path):
+    """
+    Describe a ticket template's fields the way the template endpoint expects them.
+
+    Args:
+        template_path (str): Path to the PDF ticket template.
+
+    Returns:
+        tuple: (merge_fields, form_fields_per_document) lists of SDK models.
+    """
+    index = get_template_index(template_path)
+    merge_fields = []
+    form_fields = []
+    with get_template_store(template_path).open() as doc:
+        for page_number in index.widget_pages:
+            for widget in doc[page_number].widgets():
+                rect = widget.rect
+                placement = dict(
+                    document_index=0,
+                    api_id=widget.field_name,
+                    name=widget.field_name,
+                    page=page_number + 1,
+                    x=int(rect.x0),
+                    y=int(rect.y0),
+                    width=max(1, int(rect.width)),
+                    height=max(1, int(rect.height)),
                 )
+                if widget.field_name == SIGNATURE_FIELD:
+                    form_fields.append(models.SubFormFieldsPerDocumentSignature(
+                        type="signature", signer=0, required=True, **placement))
+                    continue
+
+                handler = index.handler_for(widget)
+                if handler is None:
+                    continue
+                if handler.kind == CHECKBOX:
+                    merge_fields.append(models.SubMergeField(name=widget.field_name, type="checkbox"))
+                    form_fields.append(models.SubFormFieldsPerDocumentCheckbox(
+                        type="checkbox", signer="sender", required=False, is_checked=False, **placement))
+                else:
+                    merge_fields.append(models.SubMergeField(name=widget.field_name, type="text"))
+                    form_fields.append(models.SubFormFieldsPerDocumentText(
+                        type="text", signer="sender", required=False, **placement))
+    return merge_fields, form_fields
+
+
+def get_client(api_key=None, host=None):
+    """
+    Return the session-wide client for an API key and host, creating it on first use.
+
+    Args:
+        api_key (str | None): Dropbox Sign API key; defaults to DROPBOX_SIGN_API_KEY.
+        host (str | None): API base URL; defaults to api_host().
+
+    Returns:
+        SignatureClient: The shared client.
+    """
+    key = (_resolve_api_key(api_key), host or api_host())
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = SignatureClient(*key, max_connections=default_concurrency())
+            _clients[key] = client
+        return client
+
+
+def retry_delay(error, attempt):
+    """
+    How long to wait before retrying a failed upload.
+
+    Rate-limit responses say when to come back, via Retry-After (seconds) or
+    X-Ratelimit-Reset (a Unix timestamp); otherwise back off exponentially.
+
+    Args:
+        error (ApiException): The failure.
+        attempt (int): Attempts made so far, starting at 1.
 
-                response = signature_api.signature_request_send(request_data)
-                return response.signature_request.signature_request_id
+    Returns:
+        float | None: Seconds to wait, or None if the error is not worth retrying.
+    """
+    status = error.status or 0
+    if status != 429 and status < 500:
+        return None
+
+    headers = error.headers or {}
+    retry_after = headers.get("Retry-After")
+    if retry_after and str(retry_after).strip().isdigit():
+        return min(float(retry_after), MAX_BACKOFF)
+    reset = headers.get("X-Ratelimit-Reset")
+    if reset and str(reset).strip().isdigit():
+        return min(max(0.0, int(reset) - time.time()), MAX_BACKOFF)
+    return min(2.0 ** (attempt - 1), MAX_BACKOFF)
+
+
+def send_with_retry(client, signer_name, signer_email, pdf_path, max_attempts=MAX_ATTEMPTS):
+    """
+    Send one ticket, waiting out rate limits, transient server errors and dropped connections.
+
+    Connection failures are retried with exponential backoff too. A dropped
+    connection may hide an upload that did get through; callers that must
+    never send twice go through SignatureQueue, which reconciles by metadata.
+
+    Args:
+        client (SignatureClient): The client to send with.
+        signer_name (str): The name of the person signing.
+        signer_email (str): The email of the person signing.
+        pdf_path (str): The file path of the filled out ticket pdf.
+        max_attempts (int): Attempts before giving up.
+
+    Returns:
+        SendResult: The outcome; never raises for API, connection or file errors.
+    """
+    result = SendResult(signer_name, signer_email, pdf_path)
+    while True:
+        result.attempts += 1
+        try:
+            result.request_id = client.send(signer_name, signer_email, pdf_path)
+            return result
         except ApiException as e:
-            return f"Error: {e}"
+            delay = retry_delay(e, result.attempts)
+            if delay is None or result.attempts >= max_attempts:
+                metrics.count("signature_requests_failed")
+                result.error = f"Error: {e.status} {e.reason}: {e.body}"
+                return result
+            if e.status == 429:
+                metrics.count("signature_rate_limited")
+            time.sleep(delay)
+        except urllib3.exceptions.HTTPError as e:
+            if result.attempts >= max_attempts:
+                metrics.count("signature_requests_failed")
+                result.error = f"Error: {e}"
+                return result
+            metrics.count("signature_connection_errors")
+            time.sleep(min(2.0 ** (result.attempts - 1), MAX_BACKOFF))
+        except OSError as e:
+            metrics.count("signature_requests_failed")
+            result.error = f"Error: {e}"
+            return result
+
+
+def send_signature_requests(jobs, api_key=None, host=None, concurrency=None, on_result=None):
+    """
+    Send many tickets for signature concurrently over one pooled client.
+
+    Args:
+        jobs (iterable): (signer_name, signer_email, pdf_path) for each ticket.
+        api_key (str | None): Dropbox Sign API key; defaults to DROPBOX_SIGN_API_KEY.
+        host (str | None): API base URL; defaults to api_host().
+        concurrency (int | None): Uploads in flight at once; defaults to default_concurrency().
+        on_result (function): Called from a worker thread with (index, SendResult)
+            as each ticket finishes, e.g. to drive a progress display.
+
+    Returns:
+        list[SendResult]: One result per job, in the order of jobs.
+    """
+    jobs = list(jobs)
+    client = get_client(api_key, host)
+    if concurrency is None:
+        concurrency = default_concurrency()
+    concurrency = max(1, min(concurrency, len(jobs) or 1))
+
+    def send(index):
+        result = send_with_retry(client, *jobs[index])
+        if on_result:
+            on_result(index, result)
+        return result
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        return list(pool.map(send, range(len(jobs))))
+
+
+def send_signature_request(api_key=None, signer_name="", signer_email="", pdf_path=""):
+    """ Emails customer a request to sign the ticket through the dropbox_sign API to the email listed in the invoice
+
+    Args:
+        api_key: A key that allows the app to connect to a specific dropbox sign account
+        signer_name: The name of the person signing for the order on the ticket
+        signer_email: The email of the person signing for the order on the ticket
+        pdf_path: The file path of the filled out ticket pdf
+    """
+    result = send_with_retry(get_client(api_key), signer_name, signer_email, pdf_path)
+    return result.request_id if result.ok else result.error
@@ -0,0 +1,365 @@
+"""
+Local stand-in for the Dropbox Sign API, for exercising the signing code offline.
+
+Implements just enough of the v3 REST API for dropbox.py and
+signature_sync.py: sending a signature request with an uploaded file,
+registering a template and sending it with custom field values, and
+listing requests page by page, newest first. It can be told to answer
+every Nth call with HTTP 429 to exercise rate-limit handling, or to drop
+every Nth connection without answering to exercise network failures, and
+DropboxSignStub.sign() / decline() stand in for a signer acting on a request.
+
+Usage:
+    python dropbox_sign_stub.py [--port 8765] [--rate-limit-every N]
+
+then point the app at it with DROPBOX_SIGN_HOST=http://127.0.0.1:8765/v3
+(any DROPBOX_SIGN_API_KEY is accepted).
+"""
+
+import argparse
+import json
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+
+class StubState:
+    """
+    Everything the stub has been asked to do, shared by its request handlers.
+
+    Attributes:
+        rate_limit_every (int): Answer every Nth API call with 429; 0 never does.
+        drop_every (int): Close the connection of every Nth API call without answering; 0 never does.
+        retry_after (int): Seconds sent in the Retry-After header of a 429.
+        latency (float): Seconds to sleep before answering, to mimic upload time.
+        calls (int): API calls received, including rate-limited ones.
+        list_calls (int): Calls to the list endpoint that were answered.
+        payload_bytes (dict): Endpoint name -> request body sizes received, to compare modes.
+        templates (dict): template_id -> {"title": ..., "merge_fields": [names]}.
+        rate_limited (int): Calls answered with 429.
+        dropped (int): Calls whose connection was closed without an answer.
+        in_flight (int): Calls being answered right now.
+        max_in_flight (int): Most calls ever answered at once, to check client concurrency.
+        signature_requests (dict): signature_request_id -> request as returned by the API.
+    """
+
+    def __init__(self, rate_limit_every=0, retry_after=1, latency=0.0, drop_every=0):
+        self.rate_limit_every = rate_limit_every
+        self.drop_every = drop_every
+        self.retry_after = retry_after
+        self.latency = latency
+        self.calls = 0
+        self.rate_limited = 0
+        self.dropped = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.list_calls = 0
+        self.payload_bytes = {}
+        self.templates = {}
+        self.signature_requests = {}
+        self.lock = threading.Lock()
+
+    def next_call(self):
+        """Count a call and decide its fate: "drop", "rate_limit" or None to answer it."""
+        with self.lock:
+            self.calls += 1
+            if self.drop_every > 0 and self.calls % self.drop_every == 0:
+                self.dropped += 1
+                return "drop"
+            if self.rate_limit_every > 0 and self.calls % self.rate_limit_every == 0:
+                self.rate_limited += 1
+                return "rate_limit"
+            return None
+
+    def enter_call(self):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+    def exit_call(self):
+        with self.lock:
+            self.in_flight -= 1
+
+
+def _form_fields(content_type, body):
+    """
+    Pull the plain (non-file) fields out of a multipart/form-data or JSON request body.
+
+    Returns:
+        tuple: (fields dict of name -> list of values, number of uploaded files)
+    """
+    if content_type.startswith("application/json"):
+        return {k: [v] for k, v in json.loads(body or b"{}").items()}, 0
+
+    fields = {}
+    files = 0
+    boundary = content_type.partition("boundary=")[2].strip('"').encode()
+    if not boundary:
+        return fields, files
+    for part in body.split(b"--" + boundary):
+        head, _, value = part.partition(b"\r\n\r\n")
+        if b"name=" not in head:
+            continue
+        name = head.split(b'name="', 1)[1].split(b'"', 1)[0].decode()
+        if b"filename=" in head:
+            files += 1
+            continue
+        fields.setdefault(name, []).append(value.rstrip(b"\r\n").decode("utf-8", "replace"))
+    return fields, files
+
+
+def _json_field(fields, name, default):
+    """Decode a form field the SDK sends as JSON (lists and objects are serialized that way)."""
+    values = fields.get(name)
+    if not values:
+        return default
+    value = values[0]
+    return json.loads(value) if isinstance(value, str) else value
+
+
+class _Handler(BaseHTTPRequestHandler):
+    state = None  # StubState, set per server
+
+    def log_message(self, format, *args):
+        pass
+
+    def _reply(self, status, payload, headers=()):
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _error(self, status, name, message, headers=()):
+        self._reply(status, {"error": {"error_name": name, "error_msg": message}}, headers)
+
+    def _guard(self):
+        """Authenticate, rate limit or drop a call. Returns True if it may proceed."""
+        if not self.headers.get("Authorization"):
+            self._error(401, "unauthorized", "Unauthorized api key")
+            return False
+        if self.state.latency:
+            time.sleep(self.state.latency)
+        outcome = self.state.next_call()
+        if outcome == "drop":
+            self.close_connection = True
+            return False
+        if outcome == "rate_limit":
+            reset = int(time.time()) + self.state.retry_after
+            self._error(429, "exceeded_rate", "Rate limit exceeded",
+                        [("Retry-After", str(self.state.retry_after)), ("X-Ratelimit-Reset", str(reset))])
+            return False
+        return True
+
+    def do_GET(self):
+        self.state.enter_call()
+        try:
+            self._get()
+        finally:
+            self.state.exit_call()
+
+    def _get(self):
+        if not self._guard():
+            return
+        url = urlsplit(self.path)
+        if url.path.rstrip("/").endswith("/signature_request/list"):
+            query = parse_qs(url.query)
+            self._list_signature_requests(int(query.get("page", ["1"])[0]), int(query.get("page_size", ["20"])[0]))
+        else:
+            self._error(404, "not_found", f"No stub for GET {url.path}")
+
+    def _list_signature_requests(self, page, page_size):
+        with self.state.lock:
+            self.state.list_calls += 1
+            # Newest first, like the real API
+            ordered = sorted(self.state.signature_requests.values(), key=lambda r: r["created_at"], reverse=True)
+        num_pages = max(1, -(-len(ordered) // page_size))
+        start = (page - 1) * page_size
+        self._reply(200, {
+            "signature_requests": ordered[start:start + page_size],
+            "list_info": {
+                "num_pages": num_pages,
+                "num_results": len(ordered),
+                "page": page,
+                "page_size": page_size,
+            },
+        })
+
+    def do_POST(self):
+        self.state.enter_call()
+        try:
+            self._post()
+        finally:
+            self.state.exit_call()
+
+    def _post(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        if not self._guard():
+            return
+        fields, files = _form_fields(self.headers.get("Content-Type", ""), body)
+        endpoint = self.path.rstrip("/").split("/v3/", 1)[-1]
+        with self.state.lock:
+            self.state.payload_bytes.setdefault(endpoint, []).append(len(body))
+
+        if endpoint == "signature_request/send":
+            self._send_signature_request(fields, files)
+        elif endpoint == "template/create":
+            self._create_template(fields, files)
+        elif endpoint == "signature_request/send_with_template":
+            self._send_with_template(fields)
+        else:
+            self._error(404, "not_found", f"No stub for POST {self.path}")
+
+    def _new_signature_request(self, fields, signers, custom_fields=None, **extra):
+        if custom_fields is not None:
+            # Responses tag every custom field with its type; the SDK needs it to deserialize them
+            extra["custom_fields"] = [{"type": "text", **field} for field in custom_fields]
+        request_id = uuid.uuid4().hex
+        signature_request = {
+            "signature_request_id": request_id,
+            "title": fields.get("title", [""])[0],
+            "subject": fields.get("subject", [""])[0],
+            "message": fields.get("message", [""])[0],
+            "test_mode": str(fields.get("test_mode", ["0"])[0]) in ("1", "true", "True"),
+            "created_at": int(time.time()),
+            "is_complete": False,
+            "is_declined": False,
+            "has_error": False,
+            "metadata": _json_field(fields, "metadata", {}) or {},
+            "signatures": [
+                {
+                    "signer_email_address": signer.get("email_address", ""),
+                    "signer_name": signer.get("name", ""),
+                    "signer_role": signer.get("role"),
+                    "status_code": "awaiting_signature",
+                }
+                for signer in signers
+            ],
+            **extra,
+        }
+        with self.state.lock:
+            self.state.signature_requests[request_id] = signature_request
+        return signature_request
+
+    def _create_template(self, fields, files):
+        if not files:
+            self._error(400, "bad_request", "Must specify files for the template")
+            return
+        template_id = uuid.uuid4().hex
+        merge_fields = [field["name"] for field in _json_field(fields, "merge_fields", [])]
+        with self.state.lock:
+            self.state.templates[template_id] = {"title": fields.get("title", [""])[0], "merge_fields": merge_fields}
+        self._reply(200, {"template": {"template_id": template_id}})
+
+    def _check_template(self, fields, custom_fields):
+        """Validate template_ids and custom field names. Returns the template ids, or None after replying."""
+        template_ids = _json_field(fields, "template_ids", [])
+        with self.state.lock:
+            templates = [self.state.templates.get(template_id) for template_id in template_ids]
+        if not templates or None in templates:
+            self._error(404, "not_found", "Template not found")
+            return None
+        allowed = {name for template in templates for name in template["merge_fields"]}
+        unknown = [field["name"] for field in custom_fields if field["name"] not in allowed]
+        if unknown:
+            self._error(400, "bad_request", f"Unknown custom fields: {', '.join(unknown)}")
+            return None
+        return template_ids
+
+    def _send_with_template(self, fields):
+        custom_fields = _json_field(fields, "custom_fields", [])
+        template_ids = self._check_template(fields, custom_fields)
+        if template_ids is None:
+            return
+        signature_request = self._new_signature_request(
+            fields, _json_field(fields, "signers", []), template_ids=template_ids, custom_fields=custom_fields)
+        self._reply(200, {"signature_request": signature_request})
+
+    def _send_signature_request(self, fields, files):
+        if not files and not _json_field(fields, "file_urls", []):
+            self._error(400, "bad_request", "Must specify files to be sent")
+            return
+
+        signature_request = self._new_signature_request(fields, _json_field(fields, "signers", []))
+        self._reply(200, {"signature_request": signature_request})
+
+
+class DropboxSignStub:
+    """
+    Runs the stub API on a background thread.
+
+    Use as a context manager, or call start() and stop().
+
+    Attributes:
+        state (StubState): What the stub has received so far.
+        host (str): Base URL to pass as the API host, e.g. http://127.0.0.1:8765/v3.
+    """
+
+    def __init__(self, port=0, rate_limit_every=0, retry_after=1, latency=0.0, drop_every=0):
+        self.state = StubState(rate_limit_every, retry_after, latency, drop_every)
+        handler = type("StubHandler", (_Handler,), {"state": self.state})
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self.host = f"http://127.0.0.1:{self._server.server_address[1]}/v3"
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def sign(self, request_id):
+        """Mark a request as signed by all its signers."""
+        with self.state.lock:
+            signature_request = self.state.signature_requests[request_id]
+            signature_request["is_complete"] = True
+            for signature in signature_request["signatures"]:
+                signature["status_code"] = "signed"
+
+    def decline(self, request_id):
+        """Mark a request as declined by its signer."""
+        with self.state.lock:
+            signature_request = self.state.signature_requests[request_id]
+            signature_request["is_declined"] = True
+            for signature in signature_request["signatures"]:
+                signature["status_code"] = "declined"
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+        return False
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local stand-in for the Dropbox Sign API.")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--rate-limit-every", type=int, default=0,
+                        help="answer every Nth call with HTTP 429")
+    parser.add_argument("--drop-every", type=int, default=0,
+                        help="close every Nth connection without answering")
+    parser.add_argument("--retry-after", type=int, default=1)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds to wait before answering")
+    args = parser.parse_args(argv)
+
+    stub = DropboxSignStub(args.port, args.rate_limit_every, args.retry_after, args.latency, args.drop_every)
+    print(f"Dropbox Sign stub listening; set DROPBOX_SIGN_HOST={stub.host}")
+    try:
+        stub._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stub._server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,6 @@
-import fitz  # PyMuPDF
+import metrics
+from template_index import CHECKBOX, DATE, SCALAR, get_template_index
+from template_store import get_template_store
 
 def flatten_once(lst):
     flat = []
@@ -9,86 +11,195 @@ def flatten_once(lst):
             flat.append(el)
     return flat
 
-def fill_pdf(ticket, template_path, output_path, flatten=True):
-    doc = fitz.open(template_path)
-    data = ticket.__dict__.copy()
-    data["PatientName"] = f"{ticket.PatientLastName}, {ticket.PatientFirstName}".strip()
+READONLY_FLAG = 1 << 0  # read-only bit
+
+
+def _widget_value(handler, ticket, derived):
+    """
+    Resolve the text a widget should show for a ticket.
+
+    Args:
+        handler (FieldHandler): The widget's compiled handler.
+        ticket (TicketInfo): The ticket being rendered.
+        derived (dict): Values computed for this render that override ticket attributes.
+
+    Returns:
+        str | None: The value to write, or None to leave the widget as is.
+    """
+    if handler.kind == CHECKBOX:
+        return "Yes"
+
+    key = handler.key
+    value = derived[key] if key in derived else getattr(ticket, key)
+
+    if handler.kind == DATE:
+        return str(value) if value else None
+
+    if handler.kind == SCALAR:
+        return str(value)
+
+    values = value
+    if handler.index >= len(values):
+        return None
+    value = values[handler.index]
+    if handler.key == "Units":
+        try:
+            value = str(int(float(value)))
+        except Exception:
+            value = str(value)
+    return str(value)
 
-    if "HCodes" in data and isinstance(data["HCodes"], list):
-        data["HCodes"] = flatten_once(data["HCodes"])
-    else:
-        data["HCodes"] = []
 
-    list_fields = {
-        "CodeDescription": "CodeDescriptions",
-        "Code": "HCodes",
-        "Item": "ICodes",
-        "Units": "Units"
+def _derived_values(ticket):
+    return {
+        "PatientName": f"{ticket.PatientLastName}, {ticket.PatientFirstName}".strip(),
+        "HCodes": flatten_once(ticket.HCodes) if isinstance(ticket.HCodes, list) else [],
     }
 
-    for page in doc:
-        widgets = page.widgets()
-        if not widgets:
-            continue
 
-        for widget in widgets:
-            field_name = widget.field_name
+def fits_template(ticket, template_path):
+    """
+    Check that every line item of a ticket has a slot on the template.
 
-            # Handle Delivery checkbox (and any checkboxes)
-            if widget.field_type == fitz.PDF_WIDGET_TYPE_CHECKBOX and field_name == "Delivery":
-                widget.field_value = "Yes"
-                widget.update()
-                
-                # Manually draw checkmark over checkbox bounds
-                rect = widget.rect
-                checkmark = "✔"  # Or use "X" or whatever you want
-
-                page.insert_textbox(
-                    rect,
-                    checkmark,
-                    fontsize=12,
-                    align=1,  # Centered
-                )
-                continue
-
-            if field_name in ("ServDate", "Date"):
-                if data.get("Date"):
-                    widget.field_value = str(data["Date"])
-                    widget.update()
-                continue
-
-            if field_name in data and not isinstance(data[field_name], list):
-                widget.field_value = str(data[field_name])
+    Args:
+        ticket (TicketInfo): The ticket.
+        template_path (str): Path to the PDF ticket template.
+
+    Returns:
+        bool: False if any ticket list is longer than the template has rows for.
+    """
+    derived = _derived_values(ticket)
+    for key, slots in get_template_index(template_path).list_capacity().items():
+        values = derived[key] if key in derived else getattr(ticket, key)
+        if len(values) > slots:
+            return False
+    return True
+
+
+def template_field_values(ticket, template_path):
+    """
+    The value of every template field for a ticket, as render_pdf would write it.
+
+    Used to fill a template registered with the signing service instead of
+    uploading a rendered PDF.
+
+    Args:
+        ticket (TicketInfo): The ticket.
+        template_path (str): Path to the PDF ticket template.
+
+    Returns:
+        dict: Field name -> text value; the Delivery checkbox maps to "Yes".
+    """
+    index = get_template_index(template_path)
+    derived = _derived_values(ticket)
+    values = {}
+    for xref, handler in index.handlers.items():
+        value = _widget_value(handler, ticket, derived)
+        if value is not None:
+            values[index.field_names[xref]] = value
+    return values
+
+
+def _finalize(doc):
+    """
+    Bake every widget into its page's content and subset the embedded fonts.
+
+    The widgets, their appearance streams and the unused glyphs of each
+    font are dropped, so a ticket can no longer be edited but takes a
+    fraction of the space to save, upload and rasterize.
+
+    Args:
+        doc (fitz.Document): The filled ticket.
+    """
+    doc.bake()
+    doc.subset_fonts()
+
+
+def render_pdf(ticket, template_path, flatten=True, finalize=True):
+    """
+    Fill the template for one ticket and serialize it in a single pass.
+
+    Every widget is visited once: its value and read-only flag are set
+    together and its appearance stream is generated by a single update(),
+    so the result needs no separate flattening pass.
+
+    Args:
+        ticket (TicketInfo): The ticket to render.
+        template_path (str): Path to the PDF ticket template.
+        flatten (bool): Mark every widget read-only.
+        finalize (bool): Bake the widgets into the page content, subset the
+            fonts and drop unused objects. Pass False to keep the form
+            fields editable.
+
+    Returns:
+        bytes: The rendered PDF.
+    """
+    with metrics.stage("open"):
+        doc = get_template_store(template_path).open()
+        index = get_template_index(template_path)
+    derived = _derived_values(ticket)
+
+    with metrics.stage("fill"):
+        for page_number in index.widget_pages:
+            page = doc[page_number]
+
+            for widget in page.widgets():
+                handler = index.handler_for(widget)
+                value = _widget_value(handler, ticket, derived) if handler is not None else None
+
+                if value is None and not flatten:
+                    continue
+                if value is not None:
+                    widget.field_value = value
+                if flatten:
+                    widget.field_flags = (widget.field_flags or 0) | READONLY_FLAG
                 widget.update()
-                continue
-
-            for prefix, data_key in sorted(list_fields.items(), key=lambda x: -len(x[0])):
-                if field_name.startswith(prefix):
-                    index_str = field_name[len(prefix):]
-                    if index_str.isdigit():
-                        idx = int(index_str)
-                        if data_key in data and idx < len(data[data_key]):
-                            value = data[data_key][idx]
-                            if data_key == "Units":
-                                try:
-                                    value = str(int(float(value)))
-                                except Exception:
-                                    value = str(value)
-                            widget.field_value = str(value)
-                            widget.update()
-                    break
-
-        page.wrap_contents()
-
-    if flatten:
-        READONLY_FLAG = 1 << 0  # read-only bit
-        for page in doc:
-            widgets = page.widgets()
-            if widgets:
-                for widget in widgets:
-                    current_flags = widget.field_flags or 0
-                    widget.field_flags = current_flags | READONLY_FLAG
-                    widget.update()
+
+                if handler is not None and handler.kind == CHECKBOX:
+                    # Manually draw checkmark over checkbox bounds
+                    page.insert_textbox(
+                        widget.rect,
+                        "✔",
+                        fontsize=12,
+                        align=1,  # Centered
+                    )
+
             page.wrap_contents()
 
-    doc.save(output_path, deflate=True)
+    if not finalize:
+        with metrics.stage("serialize"):
+            pdf_bytes = doc.tobytes(deflate=True)
+    else:
+        if metrics.is_enabled():
+            # The size it would have had costs a second serialization, so only when reporting
+            with metrics.stage("measure_finalize"):
+                unfinalized_size = len(doc.tobytes(deflate=True))
+            metrics.record_size("ticket_bytes_before_finalize", unfinalized_size)
+        with metrics.stage("finalize"):
+            _finalize(doc)
+        with metrics.stage("serialize"):
+            pdf_bytes = doc.tobytes(garbage=4, deflate=True, use_objstms=1)
+        if metrics.is_enabled():
+            metrics.count("tickets_finalized")
+            metrics.count("finalize_bytes_saved", unfinalized_size - len(pdf_bytes))
+    doc.close()
+    metrics.count("tickets_rendered")
+    metrics.count("bytes_rendered", len(pdf_bytes))
+    metrics.record_size("ticket_bytes", len(pdf_bytes))
+    return pdf_bytes
+
+
+def fill_pdf(ticket, template_path, output_path, flatten=True, finalize=True):
+    """
+    Render a ticket and write it to output_path.
+
+    Args:
+        ticket (TicketInfo): The ticket to render.
+        template_path (str): Path to the PDF ticket template.
+        output_path (str): Where to write the filled PDF.
+        flatten (bool): Mark every widget read-only.
+        finalize (bool): Bake the widgets into the page content and compact the file.
+    """
+    pdf_bytes = render_pdf(ticket, template_path, flatten=flatten, finalize=finalize)
+    with metrics.stage("write"), open(output_path, "wb") as f:
+        f.write(pdf_bytes)
@@ -1,8 +1,6 @@
 # instructions_window.py
 
 import tkinter as tk
-from PIL import Image, ImageTk
-import requests
 import io
 
 instructions = (
@@ -25,6 +23,10 @@ def load_image_from_github(url):
     Returns:
         A PIL Image object.
     """
+    # Deferred so PIL and requests are not loaded before the welcome screen is drawn
+    import requests
+    from PIL import Image
+
     response = requests.get(url)
     response.raise_for_status()
     return Image.open(io.BytesIO(response.content))
@@ -52,6 +54,8 @@ def show_instructions(root):
     ).pack(pady=(0, 10))
 
     try:
+        from PIL import ImageTk
+
         img = load_image_from_github(
             "https://raw.githubusercontent.com/elsenschild/automatic_ticket_generator/main/assets/qb_instructions.png"
         )
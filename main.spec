@@ -2,19 +2,13 @@
 from PyInstaller.utils.hooks import collect_submodules
 from PyInstaller.utils.hooks import collect_all
 
-datas = [('assets\\delivery_ticket_template.pdf', 'assets'), ('assets\\qb_instructions.png', 'assets'), ('assets\\poppler', 'assets\\poppler')]
+datas = [('assets\\delivery_ticket_template.pdf', 'assets'), ('assets\\qb_instructions.png', 'assets')]
 binaries = []
 hiddenimports = ['dropbox_sign.apis', 'dropbox_sign.models', 'pkg_resources', 'setuptools']
 hiddenimports += collect_submodules('pkg_resources')
 hiddenimports += collect_submodules('setuptools')
-tmp_ret = collect_all('pandas')
-datas += tmp_ret[0]; binaries += tmp_ret[1]; hiddenimports += tmp_ret[2]
-tmp_ret = collect_all('numpy')
-datas += tmp_ret[0]; binaries += tmp_ret[1]; hiddenimports += tmp_ret[2]
 tmp_ret = collect_all('dropbox_sign')
 datas += tmp_ret[0]; binaries += tmp_ret[1]; hiddenimports += tmp_ret[2]
-tmp_ret = collect_all('pdf2image')
-datas += tmp_ret[0]; binaries += tmp_ret[1]; hiddenimports += tmp_ret[2]
 tmp_ret = collect_all('PyMuPDF')
 datas += tmp_ret[0]; binaries += tmp_ret[1]; hiddenimports += tmp_ret[2]
 tmp_ret = collect_all('dotenv')
@@ -0,0 +1,377 @@
+"""
+Lightweight per-stage instrumentation for the ticket pipeline.
+
+Stages are timed with `with metrics.stage("fill"):` and events counted with
+metrics.count("tickets"). Both are no-ops until enable() is called (or the
+TICKET_METRICS / TICKET_METRICS_REPORT environment variables are set), so
+the hooks cost a single flag check when instrumentation is off.
+
+When enabled, every stage keeps a count, total, min, max and a bucketed
+timing histogram, and report() / write_report() export everything as JSON.
+Sizes (e.g. bytes per rendered ticket) are kept the same way with
+record_size(), in byte buckets.
+"""
+
+import atexit
+import bisect
+import json
+import os
+import threading
+import time
+
+# Upper bounds (seconds) of the histogram buckets; the last bucket is open-ended
+BUCKET_BOUNDS = (0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1.0, 2.0, 5.0, 10.0)
+
+# Upper bounds (bytes) of the size histogram buckets; the last bucket is open-ended
+SIZE_BUCKET_BOUNDS = tuple(kib * 1024 for kib in (16, 32, 64, 96, 128, 192, 256, 512, 1024, 4096))
+
+_enabled = False
+_lock = threading.Lock()
+_counters = {}
+_histograms = {}
+_sizes = {}
+_started = time.time()
+
+
+class Histogram:
+    """
+    Timing (or size) distribution of one stage.
+
+    Attributes:
+        bounds (tuple): Upper bounds of the buckets, BUCKET_BOUNDS for timings.
+        count (int): Number of timings recorded.
+        total (float): Sum of all timings in seconds.
+        minimum (float): Fastest timing.
+        maximum (float): Slowest timing.
+        buckets (list[int]): Timings per bounds bucket, plus one overflow bucket.
+    """
+
+    def __init__(self, bounds=BUCKET_BOUNDS):
+        self.bounds = bounds
+        self.count = 0
+        self.total = 0.0
+        self.minimum = float("inf")
+        self.maximum = 0.0
+        self.buckets = [0] * (len(bounds) + 1)
+
+    def add(self, seconds):
+        self.count += 1
+        self.total += seconds
+        self.minimum = min(self.minimum, seconds)
+        self.maximum = max(self.maximum, seconds)
+        self.buckets[bisect.bisect_left(self.bounds, seconds)] += 1
+
+    def merge(self, other):
+        self.count += other["count"]
+        self.total += other["total"]
+        self.minimum = min(self.minimum, other["min"])
+        self.maximum = max(self.maximum, other["max"])
+        self.buckets = [a + b for a, b in zip(self.buckets, other["buckets"])]
+
+    def percentile(self, fraction):
+        """
+        Estimate a percentile from the buckets.
+
+        Args:
+            fraction (float): e.g. 0.95 for the 95th percentile.
+
+        Returns:
+            float: The upper bound of the bucket the percentile falls in, capped at the maximum.
+        """
+        target = fraction * self.count
+        seen = 0
+        for bound, bucket_count in zip(self.bounds + (self.maximum,), self.buckets):
+            seen += bucket_count
+            if seen >= target:
+                return min(bound, self.maximum)
+        return self.maximum
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.total / self.count if self.count else 0.0,
+            "min": self.minimum if self.count else 0.0,
+            "max": self.maximum,
+            "p50": self.percentile(0.5),
+            "p95": self.percentile(0.95),
+            "buckets": list(self.buckets),
+        }
+
+
+class _StageTimer:
+    __slots__ = ("name", "started")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        record(self.name, time.perf_counter() - self.started)
+        return False
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+def enable(flag=True):
+    """
+    Turn instrumentation on or off for this process.
+
+    Args:
+        flag (bool): True to start collecting.
+    """
+    global _enabled
+    _enabled = flag
+
+
+def is_enabled():
+    """bool: Whether instrumentation is collecting."""
+    return _enabled
+
+
+def stage(name):
+    """
+    Time a block of code as one occurrence of a stage.
+
+    Args:
+        name (str): Stage name, e.g. "parse" or "fill".
+
+    Returns:
+        A context manager; a shared no-op one when instrumentation is off.
+    """
+    return _StageTimer(name) if _enabled else _NULL_TIMER
+
+
+def record(name, seconds):
+    """
+    Record one timing of a stage.
+
+    Args:
+        name (str): Stage name.
+        seconds (float): How long it took.
+    """
+    if not _enabled:
+        return
+    with _lock:
+        histogram = _histograms.get(name)
+        if histogram is None:
+            histogram = _histograms[name] = Histogram()
+        histogram.add(seconds)
+
+
+def record_size(name, size):
+    """
+    Record one size, e.g. of a rendered ticket.
+
+    Args:
+        name (str): Size name, e.g. "ticket_bytes".
+        size (int): The size in bytes.
+    """
+    if not _enabled:
+        return
+    with _lock:
+        histogram = _sizes.get(name)
+        if histogram is None:
+            histogram = _sizes[name] = Histogram(SIZE_BUCKET_BOUNDS)
+        histogram.add(size)
+
+
+def count(name, amount=1):
+    """
+    Add to a counter.
+
+    Args:
+        name (str): Counter name, e.g. "tickets_rendered".
+        amount (int): How much to add.
+    """
+    if not _enabled:
+        return
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + amount
+
+
+def snapshot(reset=False):
+    """
+    Capture the collected counters, stage timings and sizes.
+
+    Args:
+        reset (bool): Clear them afterwards, e.g. to ship a worker's delta to its parent.
+
+    Returns:
+        dict | None: {"counters": ..., "stages": ..., "sizes": ...}, or None when
+        instrumentation is off.
+    """
+    if not _enabled:
+        return None
+    with _lock:
+        data = {
+            "counters": dict(_counters),
+            "stages": {name: histogram.to_dict() for name, histogram in _histograms.items()},
+            "sizes": {name: histogram.to_dict() for name, histogram in _sizes.items()},
+        }
+        if reset:
+            _counters.clear()
+            _histograms.clear()
+            _sizes.clear()
+    return data
+
+
+def merge(data):
+    """
+    Fold a snapshot from another process (a render worker) into this one.
+
+    Args:
+        data (dict | None): A snapshot() result.
+    """
+    if not _enabled or not data:
+        return
+    with _lock:
+        for name, amount in data["counters"].items():
+            _counters[name] = _counters.get(name, 0) + amount
+        for name, stats in data["stages"].items():
+            histogram = _histograms.get(name)
+            if histogram is None:
+                histogram = _histograms[name] = Histogram()
+            histogram.merge(stats)
+        for name, stats in data.get("sizes", {}).items():
+            histogram = _sizes.get(name)
+            if histogram is None:
+                histogram = _sizes[name] = Histogram(SIZE_BUCKET_BOUNDS)
+            histogram.merge(stats)
+
+
+def reset():
+    """Clear everything collected so far."""
+    global _started
+    with _lock:
+        _counters.clear()
+        _histograms.clear()
+        _sizes.clear()
+        _started = time.time()
+
+
+def report():
+    """
+    Build the run report.
+
+    Returns:
+        dict: Start time, wall time, bucket bounds, counters, per-stage statistics and sizes.
+    """
+    data = snapshot() or {"counters": {}, "stages": {}, "sizes": {}}
+    return {
+        "started": _started,
+        "wall_seconds": time.time() - _started,
+        "bucket_bounds": list(BUCKET_BOUNDS),
+        "size_bucket_bounds": list(SIZE_BUCKET_BOUNDS),
+        **data,
+    }
+
+
+def write_report(path):
+    """
+    Write the run report as JSON.
+
+    Args:
+        path (str): Output file path.
+    """
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report(), f, indent=2)
+
+
+class IterationTimer:
+    """
+    Wraps an iterable and adds up the time spent producing its items.
+
+    Lets a stage that consumes a stream (e.g. grouping parsed rows) be
+    timed apart from the stage that produces it.
+
+    Attributes:
+        seconds (float): Time spent inside the wrapped iterator so far.
+    """
+
+    __slots__ = ("_iterator", "seconds")
+
+    def __init__(self, iterable):
+        self._iterator = iter(iterable)
+        self.seconds = 0.0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        started = time.perf_counter()
+        try:
+            return next(self._iterator)
+        finally:
+            self.seconds += time.perf_counter() - started
+
+
+class ThroughputMeter:
+    """
+    Tracks how fast a batch is progressing.
+
+    Attributes:
+        total (int): Number of items in the batch.
+        done (int): Items finished so far.
+    """
+
+    def __init__(self, total):
+        self.total = total
+        self.done = 0
+        self._started = time.perf_counter()
+
+    def update(self, done):
+        """
+        Set how many items are finished.
+
+        Args:
+            done (int): Items finished so far.
+        """
+        self.done = done
+
+    @property
+    def rate(self):
+        """float: Items per second since the meter was created."""
+        elapsed = time.perf_counter() - self._started
+        return self.done / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def eta(self):
+        """float | None: Estimated seconds until the batch is done, or None before the first item."""
+        rate = self.rate
+        if not rate:
+            return None
+        return max(0, self.total - self.done) / rate
+
+    def describe(self):
+        """
+        Format the rate and ETA for a status label.
+
+        Returns:
+            str: e.g. "12.5 tickets/s, ETA 0:42"; empty before the first item.
+        """
+        eta = self.eta
+        if eta is None:
+            return ""
+        minutes, seconds = divmod(int(round(eta)), 60)
+        return f"{self.rate:.1f} tickets/s, ETA {minutes}:{seconds:02d}"
+
+
+if os.getenv("TICKET_METRICS") or os.getenv("TICKET_METRICS_REPORT"):
+    enable()
+    if os.getenv("TICKET_METRICS_REPORT"):
+        atexit.register(write_report, os.getenv("TICKET_METRICS_REPORT"))
@@ -1,53 +1,79 @@
 import os
-import tempfile
-from datetime import datetime
+import time
+import metrics
+from artifact_store import get_artifact_store
+from date_utils import filename_date_token
 from ticket_info import TicketInfo  # Your dataclass
-from fill_pdf import fill_pdf      # Your PDF fill function
+from tsv_handler import order_row_from_dict
+from render_engine import RenderQueue, render_tickets
+from render_cache import render_key
+from fill_pdf import render_pdf
+from template_store import get_template_store
 import fitz  # PyMuPDF
 
+# Name of the combined print file written next to the mailed/ folder
+PRINT_BATCH_FILENAME = "mailed delivery tickets.pdf"
+
 # --- PDF Utility Functions --- #
 
-def flatten_pdf(path):
+def append_to_print_batch(batch_doc, pdf_bytes):
     """
-    Flatten form fields in a PDF so filled values become static content.
+    Append an already rendered ticket to a combined print document.
+
+    The ticket's form fields are baked into its page content first, so the
+    identically named fields of every ticket cannot collide in the batch.
 
     Args:
-        path (str): Path to the PDF file.
-    
-    Returns: 
-        str: Path to the flattened PDF file.
+        batch_doc (fitz.Document): The combined document being built.
+        pdf_bytes (bytes): One rendered ticket PDF.
     """
-    doc = fitz.open(path)
+    with metrics.stage("merge"), fitz.open(stream=pdf_bytes, filetype="pdf") as ticket_doc:
+        ticket_doc.bake()
+        batch_doc.insert_pdf(ticket_doc)
 
-    for page in doc:
-        widgets = page.widgets()
-        if widgets:
-            for widget in widgets:
-                # Ensure appearance is generated for all fields, especially checkboxes
-                if widget.field_type == fitz.PDF_WIDGET_TYPE_CHECKBOX:
-                    widget.field_value = widget.field_value  # Force assignment
-                widget.update()
-        page.wrap_contents()
 
-    flat_path = path.replace(".pdf", "_flat.pdf")
-    doc.save(flat_path, incremental=False, deflate=True)
-    return flat_path
+def save_print_batch(batch_doc, output_path):
+    """
+    Save a combined print document with shared fonts and template streams deduplicated.
+
+    Args:
+        batch_doc (fitz.Document): The combined document.
+        output_path (str): Where to write it.
+    """
+    with metrics.stage("merge_save"):
+        batch_doc.save(output_path, garbage=4, deflate=True)
+
+
+def render_preview_image(pdf, max_width=600):
+    """
+    Rasterize the first page of a PDF at the exact width it will be displayed.
+
+    Args:
+        pdf (str | bytes): Path to the PDF file, or its contents.
+        max_width (int): Width of the image in pixels.
+
+    Returns:
+        bytes: The page as binary PPM data, which tk.PhotoImage reads directly.
+    """
+    opened = fitz.open(stream=pdf, filetype="pdf") if isinstance(pdf, bytes) else fitz.open(pdf)
+    with metrics.stage("rasterize"), opened as doc:
+        page = doc[0]
+        zoom = max_width / page.rect.width
+        pixmap = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False)
+        return pixmap.tobytes("ppm")
 
 
 def format_date(date_str):
     """
-    Format a date string into a human-readable format.
+    Format a date string into the token used in ticket filenames.
 
     Args:
-        date_str (str): Date string in the format 'YYYY-MM-DD'.
+        date_str (str): Date string in the format 'MM/DD/YYYY'.
 
     Returns:
-        str: Formatted date string in the format 'Month Day, Year'.
+        str: Formatted date string in the format 'MMDDYYYY', or 'unknown_date'.
     """
-    try:
-        return datetime.strptime(date_str.strip(), "%m/%d/%Y").strftime("%m%d%Y")
-    except Exception:
-        return "unknown_date"
+    return filename_date_token(date_str)
 
 
 def sanitize_filename(name):
@@ -66,48 +92,65 @@ def sanitize_filename(name):
     return "".join(c for c in name if c.isalnum() or c in (" ", "_", "-")).rstrip()
 
 
-def same_order(order1, order2):
-    """ Checks if two rows in the invoice tsv are a part of the same ticket. 
+def order_key(row):
+    """ Builds the key that identifies which ticket a row of the invoice export belongs to.
+
+    Two rows are part of the same ticket when their first 10 fields (date,
+    patient name, account, address and phone) are equal.
 
     Args:
-        order1 (list): The first row of the invoice tsv being examined.
-        order2 (list): The second row of the invoice tsv being examined.
-    
-    Returns: 
-        bool: True if the two rows are a part of the same ticket, False otherwise.
+        row (list): One positional row of the invoice export.
+
+    Returns:
+        tuple: The row's order key.
     """
-    return all(order1[i] == order2[i] for i in range(10))
+    return tuple(row[:10])
 
 
 def group_orders(orders):
     """ Groups rows in the invoice csv file by their first 10 fields to combine all the data from one order together
 
+    Rows are bucketed by order_key in a single pass, so rows of the same
+    order are merged wherever they appear in the input, which may be an
+    unsorted list or a stream. Tickets come out in the order their first
+    row was seen and line items keep their input order.
+
     Args:
-        orders: A list of 13 entries from each invoice
+        orders: An iterable of rows, either positional lists from an Excel export
+            or dictionaries from a TSV export
 
     Returns: 
         list: A list of lists, where each sublist contains all the data from one order
     """
-    grouped = []
-    i = 0
-    while i < len(orders):
-        j = i + 1
-        base = orders[i][:11]  # Shared patient/order info
-        units = [orders[i][11]]
-        hcodes = [orders[i][12]]
-        descriptions = [orders[i][13]]
-        icodes = [orders[i][14]]
-
-        while j < len(orders) and same_order(orders[i], orders[j]):
-            units.append(orders[j][11])
-            hcodes.append(orders[j][12])
-            descriptions.append(orders[j][13])
-            icodes.append(orders[j][14])
-            j += 1
-
-        group = base + [units, hcodes, descriptions, icodes]
-        grouped.append(group)
-        i = j
+    if metrics.is_enabled():
+        # Rows may be parsed as they are pulled; that time belongs to the "parse" stage
+        started = time.perf_counter()
+        source = metrics.IterationTimer(orders)
+        grouped = _group_rows(source)
+        metrics.record("group", time.perf_counter() - started - source.seconds)
+    else:
+        grouped = _group_rows(orders)
+    metrics.count("orders_grouped", len(grouped))
+    return list(grouped.values())
+
+
+def _group_rows(orders):
+    grouped = {}
+    for row in orders:
+        if isinstance(row, dict):
+            row = order_row_from_dict(row)
+
+        key = order_key(row)
+        group = grouped.get(key)
+        if group is None:
+            # Shared patient/order info, then units, hcodes, descriptions, icodes
+            group = list(row[:11]) + [[], [], [], []]
+            grouped[key] = group
+
+        group[11].append(row[11])
+        group[12].append(row[12])
+        group[13].append(row[13])
+        group[14].append(row[14])
 
     return grouped
 
@@ -116,12 +159,18 @@ def create_ticket_from_group(row):
     """
     Create a ticket from a group of orders.
 
+    Tickets that were already built are passed through, so callers can
+    hand the same TicketInfo batch from grouping through to rendering.
+
     Args:
-        row: One row from the inputed tsv file.
+        row: One row from the inputed tsv file, or a TicketInfo.
     
     Returns: 
         dict (TicketInfo): A dictionary containing the ticket information.
     """
+    if isinstance(row, TicketInfo):
+        return row
+
     if len(row) < 15:
         raise ValueError("Each row in a group must have at least 15 columns.")
     
@@ -151,26 +200,33 @@ def create_ticket_from_group(row):
         ICodes=row[14]
     )
 
-def generate_previews(grouped_orders, pdf_template_path, progress_callback):
+def generate_previews(grouped_orders, pdf_template_path, progress_callback, workers=None, store=None):
     """
-    Generate temporary flattened PDFs for preview. Returns list of (path, group).
+    Render preview PDFs into the artifact store. Returns list of (artifact key, group, email).
+
+    Each ticket is filled, finalized and serialized once and kept as bytes
+    in the session's artifact store rather than written to a temp file.
+    Tickets are rendered in parallel by render_engine and come back in the
+    order of grouped_orders.
 
     Args:
         grouped_orders (list): List of groups of invoices combined into a single order.
         pdf_template_path (str): Path to PDF template ticket file.
         progress_callback (function): Function to call with progress updates.
+        workers (int | None): Render processes to use; 1 renders sequentially.
+        store (ArtifactStore | None): Where to keep the PDFs; defaults to the session's store.
 
     Returns:
-        list: List of tuples containing the path to the temporary preview PDF and the corresponding group of orders
+        list: List of tuples containing the preview's artifact key and the corresponding group of orders
     """
+    if store is None:
+        store = get_artifact_store()
     preview_pairs = []
+    tickets = [create_ticket_from_group(group) for group in grouped_orders]
+    rendered = render_tickets(tickets, pdf_template_path, flatten=True, workers=workers)
 
-    for index, group in enumerate(grouped_orders):
-        ticket = create_ticket_from_group(group)
-        temp_path = os.path.join(tempfile.gettempdir(), f"preview_{index}.pdf")
-        fill_pdf(ticket, pdf_template_path, temp_path, flatten=True)
-        flat_path = flatten_pdf(temp_path)
-        preview_pairs.append((flat_path, group, ticket.EmailAddress))
+    for index, (group, ticket, pdf_bytes) in enumerate(zip(grouped_orders, tickets, rendered)):
+        preview_pairs.append((store.add(pdf_bytes, "preview"), group, ticket.EmailAddress))
 
         if progress_callback:
             progress = ((index + 1) / len(grouped_orders)) * 100
@@ -178,23 +234,146 @@ def generate_previews(grouped_orders, pdf_template_path, progress_callback):
 
     return preview_pairs
 
-def generate_tickets(orders, pdf_template_path, output_dir="output"):
+def start_previews(grouped_orders, pdf_template_path, on_ready, on_error=None, workers=None, store=None):
+    """
+    Start rendering preview PDFs in the background and report each one as soon as it is stored.
+
+    Tickets render in order unless the returned queue is asked to
+    prioritize() one, which lets the preview window open on the first
+    ticket while the rest stream in behind it.
+
+    Args:
+        grouped_orders (list): List of groups of invoices combined into a single order.
+        pdf_template_path (str): Path to PDF template ticket file.
+        on_ready (function): Called from a background thread with (index, artifact key).
+        on_error (function): Called from a background thread with (index, exception).
+        workers (int | None): Render processes to use; 1 renders on a single thread.
+        store (ArtifactStore | None): Where to keep the PDFs; defaults to the session's store.
+
+    Returns:
+        RenderQueue: The running queue, addressed by index into grouped_orders.
+    """
+    if store is None:
+        store = get_artifact_store()
+    tickets = [create_ticket_from_group(group) for group in grouped_orders]
+
+    def store_preview(index, pdf_bytes):
+        on_ready(index, store.add(pdf_bytes, "preview"))
+
+    return RenderQueue(tickets, pdf_template_path, store_preview, on_error=on_error, workers=workers).start()
+
+def generate_tickets(orders, pdf_template_path, output_dir="output", workers=None, progress_callback=None,
+                     merge_mailed=False, split_by_delivery=True, cache=None, artifacts=None):
     """
     Fill and save final tickets into the specified output folder.
+
+    With merge_mailed, every mailed ticket is also appended, in the same
+    order, to a single PRINT_BATCH_FILENAME document in output_dir so the
+    print room can spool one job instead of one file per patient.
+
+    With a cache, tickets whose data and template are unchanged since an
+    earlier run are copied from it instead of being rendered again; only
+    the rest go through the render pool, and they are stored for next time.
+    Tickets already rendered for preview are read from the artifact store
+    instead: previews are rendered with the same options as final tickets.
+
+    Args:
+        orders (list): Groups of invoices combined into a single order, or TicketInfo objects.
+        pdf_template_path (str): Path to PDF template ticket file.
+        output_dir (str): Folder the tickets are written to.
+        workers (int | None): Render processes to use; 1 renders sequentially.
+        progress_callback (function): Optional function to call with progress updates.
+        merge_mailed (bool): Also write the mailed tickets into one combined PDF.
+        split_by_delivery (bool): Sort tickets into emailed/ and mailed/ subfolders
+            of output_dir; otherwise write them all to output_dir.
+        cache (RenderCache | None): Cache of previously rendered tickets to reuse and fill.
+        artifacts (list | None): Artifact key of each order's rendered PDF in the session's
+            artifact store, or None for orders that have not been rendered, in the order of orders.
+
+    Returns:
+        list: Paths of the written tickets, in the order of orders.
     """
-    for order in orders:
-        os.makedirs(output_dir, exist_ok=True)
+    os.makedirs(output_dir, exist_ok=True)
+    tickets = []
+    output_paths = []
+    artifact_keys = []
+    if artifacts is None:
+        artifacts = [None] * len(orders)
+    store = get_artifact_store()
+    for order, artifact_key in zip(orders, artifacts):
         try:
             ticket = create_ticket_from_group(order)
         except ValueError as e:
             print(f"Skipping group  due to error: {e}")
+            continue
         
         name = f"{ticket.PatientLastName}, {ticket.PatientFirstName}"
         if len(ticket.PatientMiddleIntial):
             name = f"{ticket.PatientLastName} {ticket.PatientMiddleIntial}, {ticket.PatientFirstName}"
         subfolder = "emailed" if ticket.EmailAddress else "mailed"
         filename = f"{sanitize_filename(name)} delivery ticket {format_date(ticket.Date)}.pdf"
-        folder_path = os.path.join(output_dir, subfolder)
+        folder_path = os.path.join(output_dir, subfolder) if split_by_delivery else output_dir
         os.makedirs(folder_path, exist_ok=True)
-        output_path = os.path.join(folder_path, filename)
-        fill_pdf(ticket, pdf_template_path, output_path)
\ No newline at end of file
+        tickets.append(ticket)
+        output_paths.append(os.path.join(folder_path, filename))
+        artifact_keys.append(artifact_key if artifact_key is not None and artifact_key in store else None)
+
+    keys = [None] * len(tickets)
+    if cache is not None:
+        digest = get_template_store(pdf_template_path).digest
+        keys = [render_key(ticket, digest) for ticket in tickets]
+    cached = [artifact_key is None and key is not None and cache.contains(key)
+              for key, artifact_key in zip(keys, artifact_keys)]
+    to_render = [ticket for ticket, hit, artifact_key in zip(tickets, cached, artifact_keys)
+                 if not hit and artifact_key is None]
+
+    batch_doc = fitz.open() if merge_mailed else None
+    rendered = render_tickets(to_render, pdf_template_path, flatten=True, workers=workers)
+    for index, (ticket, output_path, key) in enumerate(zip(tickets, output_paths, keys)):
+        in_batch = batch_doc is not None and not ticket.EmailAddress
+        pdf_bytes = None
+        hit = False
+        if artifact_keys[index] is not None:
+            pdf_bytes = store.get(artifact_keys[index])
+            if pdf_bytes is None:
+                # Discarded since the lookup; render it here instead
+                pdf_bytes = render_pdf(ticket, pdf_template_path, flatten=True)
+            else:
+                metrics.count("artifacts_reused")
+        elif cached[index]:
+            if in_batch:
+                # The print batch needs the bytes anyway, so read them once and write them out
+                pdf_bytes = cache.get(key)
+                hit = pdf_bytes is not None
+                if hit:
+                    with metrics.stage("write"), open(output_path, "wb") as f:
+                        f.write(pdf_bytes)
+            else:
+                hit = cache.copy_to(key, output_path)
+            if not hit:
+                # Evicted by another run since the lookup; render it here instead
+                pdf_bytes = render_pdf(ticket, pdf_template_path, flatten=True)
+        else:
+            pdf_bytes = next(rendered)
+
+        if not hit:
+            with metrics.stage("write"), open(output_path, "wb") as f:
+                f.write(pdf_bytes)
+            if cache is not None and not (artifact_keys[index] is not None and cache.contains(key)):
+                cache.put(key, pdf_bytes)
+        metrics.count("tickets_written")
+        if in_batch:
+            append_to_print_batch(batch_doc, pdf_bytes)
+
+        if progress_callback:
+            progress_callback(((index + 1) / len(output_paths)) * 100)
+
+    if batch_doc is not None:
+        if batch_doc.page_count:
+            save_print_batch(batch_doc, os.path.join(output_dir, PRINT_BATCH_FILENAME))
+        batch_doc.close()
+
+    if cache is not None:
+        cache.evict()
+
+    return output_paths
@@ -0,0 +1,134 @@
+import threading
+from collections import OrderedDict, deque
+
+
+class PreviewCache:
+    """
+    Bounded LRU cache of rendered preview images with a background render worker.
+
+    Navigation asks for one key at a time through request(). A miss is
+    handed to the worker, which always renders the most recently requested
+    key first (older misses are dropped, so holding an arrow key never
+    builds a backlog) and then prefetches the neighbours given with that
+    request while it is otherwise idle.
+
+    Attributes:
+        render (function): Called on the worker thread with a key; returns the image data.
+        capacity (int): Maximum number of rendered images kept.
+        on_ready (function): Called on the worker thread with (key, data) when the
+            latest requested key has been rendered; data is None if rendering failed.
+    """
+
+    def __init__(self, render, capacity=64, on_ready=None):
+        self.render = render
+        self.capacity = capacity
+        self.on_ready = on_ready
+        self._images = OrderedDict()
+        self._wanted = None
+        self._prefetch = deque()
+        self._closed = False
+        self._condition = threading.Condition()
+        self._worker = threading.Thread(target=self._run, daemon=True)
+        self._worker.start()
+
+    def get(self, key):
+        """
+        Return a cached image and mark it most recently used.
+
+        Args:
+            key: The image's key.
+
+        Returns:
+            The cached image data, or None on a miss.
+        """
+        with self._condition:
+            data = self._images.get(key)
+            if data is not None:
+                self._images.move_to_end(key)
+            return data
+
+    def request(self, key, prefetch=()):
+        """
+        Ask for the image to display next.
+
+        Args:
+            key: The key the user navigated to.
+            prefetch (iterable): Keys to render ahead of time, most useful first.
+
+        Returns:
+            The image data on a cache hit; None if it will be delivered via on_ready.
+        """
+        with self._condition:
+            data = self._images.get(key)
+            if data is not None:
+                self._images.move_to_end(key)
+                self._wanted = None
+            else:
+                self._wanted = key
+            self._prefetch = deque(k for k in prefetch if k not in self._images and k != key)
+            self._condition.notify()
+            return data
+
+    def discard(self, key):
+        """
+        Drop a key from the cache and from any pending work.
+
+        Args:
+            key: The key to forget.
+        """
+        with self._condition:
+            self._images.pop(key, None)
+            if self._wanted == key:
+                self._wanted = None
+            if key in self._prefetch:
+                self._prefetch.remove(key)
+
+    def close(self):
+        """Stop the worker thread and release cached images."""
+        with self._condition:
+            self._closed = True
+            self._images.clear()
+            self._condition.notify()
+
+    def _store(self, key, data):
+        self._images[key] = data
+        self._images.move_to_end(key)
+        while len(self._images) > self.capacity:
+            self._images.popitem(last=False)
+
+    def _next_job(self):
+        with self._condition:
+            while not self._closed:
+                if self._wanted is not None:
+                    return self._wanted
+                while self._prefetch:
+                    key = self._prefetch.popleft()
+                    if key not in self._images:
+                        return key
+                self._condition.wait()
+            return None
+
+    def _run(self):
+        while True:
+            key = self._next_job()
+            if key is None:
+                return
+
+            try:
+                data = self.render(key)
+            except Exception as e:
+                print(f"Preview render failed for {key}: {e}")
+                data = None
+
+            with self._condition:
+                if self._closed:
+                    return
+                if data is not None:
+                    self._store(key, data)
+                # Only report the render if the user is still waiting for this key
+                deliver = self._wanted == key
+                if deliver:
+                    self._wanted = None
+
+            if deliver and self.on_ready:
+                self.on_ready(key, data)
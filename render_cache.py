@@ -0,0 +1,216 @@
+import dataclasses
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+
+import metrics
+from app_paths import user_cache_dir
+
+# Bump whenever a change to fill_pdf alters the PDFs it produces, so old entries stop matching
+RENDER_VERSION = 2
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+
+def default_max_bytes():
+    """
+    Size budget of the render cache when the caller does not say.
+
+    Reads TICKET_RENDER_CACHE_MB from the environment (or .env).
+
+    Returns:
+        int: Budget in bytes.
+    """
+    configured = os.getenv("TICKET_RENDER_CACHE_MB", "").strip()
+    if configured.isdigit():
+        return int(configured) * 1024 * 1024
+    return DEFAULT_MAX_BYTES
+
+
+def ticket_fields(ticket):
+    """
+    Every TicketInfo field value, in declaration order.
+
+    Args:
+        ticket (TicketInfo): The ticket.
+
+    Returns:
+        list: The values, ready to be serialized canonically.
+    """
+    return [getattr(ticket, f.name) for f in dataclasses.fields(ticket)]
+
+
+def render_key(ticket, template_digest, flatten=True, finalize=True):
+    """
+    Content address of a rendered ticket.
+
+    Hashes the template's bytes (via its digest), every TicketInfo field in
+    declaration order and the render options, so any change to the data,
+    the template or the renderer yields a different key.
+
+    Args:
+        ticket (TicketInfo): The ticket.
+        template_digest (str): SHA-256 hex digest of the template (TemplateStore.digest).
+        flatten (bool): Whether widgets are made read-only.
+        finalize (bool): Whether widgets are baked into the page and the file compacted.
+
+    Returns:
+        str: SHA-256 hex digest.
+    """
+    canonical = json.dumps(
+        [RENDER_VERSION, template_digest, bool(flatten), bool(finalize), ticket_fields(ticket)],
+        default=str,
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(canonical.encode("utf-8", "surrogatepass")).hexdigest()
+
+
+class RenderCache:
+    """
+    Persistent on-disk cache of rendered ticket PDFs, addressed by render_key().
+
+    Entries are plain files named after their key. A hit refreshes the
+    entry's mtime, and evict() removes the least recently used entries
+    until the cache fits in max_bytes.
+
+    Attributes:
+        directory (str): Folder holding the cached PDFs.
+        max_bytes (int): Size budget enforced by evict().
+        hits (int): Tickets served from the cache.
+        misses (int): Tickets that had to be rendered and stored.
+    """
+
+    def __init__(self, directory=None, max_bytes=None):
+        self.directory = directory or user_cache_dir("render_cache")
+        os.makedirs(self.directory, exist_ok=True)
+        self.max_bytes = default_max_bytes() if max_bytes is None else max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.pdf")
+
+    def _touch(self, path):
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    def _count(self, hit):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+        metrics.count("render_cache_hits" if hit else "render_cache_misses")
+
+    def contains(self, key):
+        """
+        Check whether a ticket is cached, without reading it.
+
+        Args:
+            key (str): The ticket's key.
+
+        Returns:
+            bool: True if an entry exists (it may still be evicted before it is read).
+        """
+        return os.path.exists(self._path(key))
+
+    def get(self, key):
+        """
+        Read a cached PDF.
+
+        Args:
+            key (str): The ticket's key.
+
+        Returns:
+            bytes | None: The PDF, or None on a miss.
+        """
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+        self._touch(path)
+        self._count(True)
+        return data
+
+    def copy_to(self, key, output_path):
+        """
+        Copy a cached PDF to output_path without reading it into memory.
+
+        Args:
+            key (str): The ticket's key.
+            output_path (str): Where the ticket belongs.
+
+        Returns:
+            bool: True on a hit, False if the ticket has to be rendered.
+        """
+        path = self._path(key)
+        try:
+            shutil.copyfile(path, output_path)
+        except OSError:
+            return False
+        self._touch(path)
+        self._count(True)
+        return True
+
+    def put(self, key, pdf_bytes):
+        """
+        Store a rendered PDF. The write is atomic, so concurrent runs never see a partial entry.
+
+        Args:
+            key (str): The ticket's key.
+            pdf_bytes (bytes): The rendered PDF.
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(pdf_bytes)
+            os.replace(tmp_path, self._path(key))
+            self._count(False)
+        except OSError as e:
+            print(f"Could not cache rendered ticket: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    def evict(self):
+        """
+        Delete least recently used entries until the cache fits in max_bytes.
+
+        Returns:
+            int: Number of entries removed.
+        """
+        entries = []
+        total = 0
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if not entry.name.endswith(".pdf"):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+
+        removed = 0
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        return removed
@@ -0,0 +1,256 @@
+import os
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import metrics
+from fill_pdf import render_pdf
+from template_index import get_template_index
+
+# Template each worker process renders against, set once by _init_worker
+_worker_template_path = None
+
+
+def default_workers():
+    """
+    Number of render processes to use when the caller does not say.
+
+    Reads TICKET_RENDER_WORKERS from the environment (or .env) and falls
+    back to the number of CPU cores.
+
+    Returns:
+        int: Worker count, at least 1.
+    """
+    configured = os.getenv("TICKET_RENDER_WORKERS", "").strip()
+    if configured.isdigit() and int(configured) > 0:
+        return int(configured)
+    return os.cpu_count() or 1
+
+
+def _init_worker(template_path, collect_metrics=False):
+    """
+    Warm a worker process: load the template into memory and compile its index once.
+
+    Args:
+        template_path (str): Path to the PDF ticket template.
+        collect_metrics (bool): Time the render stages, as the parent process does.
+    """
+    global _worker_template_path
+    _worker_template_path = template_path
+    # Start empty: a forked worker inherits the parent's counters and would report them twice
+    metrics.reset()
+    metrics.enable(collect_metrics)
+    get_template_index(template_path)
+
+
+def _render_job(job):
+    ticket, flatten, finalize = job
+    pdf_bytes = render_pdf(ticket, _worker_template_path, flatten=flatten, finalize=finalize)
+    # Ship this job's timings back so the parent's report covers every worker
+    return pdf_bytes, metrics.snapshot(reset=True)
+
+
+def _job_result(future):
+    pdf_bytes, worker_metrics = future.result()
+    metrics.merge(worker_metrics)
+    return pdf_bytes
+
+
+def render_tickets(tickets, template_path, flatten=True, workers=None, finalize=True):
+    """
+    Render tickets across a process pool, yielding PDFs in the original ticket order.
+
+    At most two jobs per worker are in flight ahead of the ticket being
+    yielded, so memory stays bounded however long the batch is. With one
+    worker (or one ticket) everything runs in-process, which gives a
+    deterministic reference to compare the parallel output against.
+
+    Args:
+        tickets (list[TicketInfo]): Tickets to render.
+        template_path (str): Path to the PDF ticket template.
+        flatten (bool): Mark every widget read-only.
+        workers (int | None): Process count; defaults to default_workers().
+        finalize (bool): Bake the widgets into the page content and compact each PDF.
+
+    Yields:
+        bytes: The rendered PDF of each ticket, in input order.
+    """
+    if workers is None:
+        workers = default_workers()
+    workers = max(1, min(workers, len(tickets)))
+
+    if workers == 1:
+        for ticket in tickets:
+            yield render_pdf(ticket, template_path, flatten=flatten, finalize=finalize)
+        return
+
+    jobs = iter(tickets)
+    pending = deque()
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(template_path, metrics.is_enabled()),
+    ) as pool:
+        def submit_next():
+            ticket = next(jobs, None)
+            if ticket is not None:
+                pending.append(pool.submit(_render_job, (ticket, flatten, finalize)))
+
+        for _ in range(workers * 2):
+            submit_next()
+
+        while pending:
+            pdf_bytes = _job_result(pending.popleft())
+            submit_next()
+            yield pdf_bytes
+
+
+class RenderQueue:
+    """
+    Renders tickets in the background, handing each one over as soon as it is done.
+
+    Tickets are rendered in input order, except that any ticket passed to
+    prioritize() jumps the queue (the most recent call first). Only one job
+    per worker is in flight, so a prioritized ticket starts as soon as the
+    next worker frees up.
+
+    Attributes:
+        tickets (list[TicketInfo]): Tickets to render, addressed by index.
+        template_path (str): Path to the PDF ticket template.
+        on_ready (function): Called on the queue's thread with (index, pdf_bytes).
+        on_error (function): Called on the queue's thread with (index, exception).
+        flatten (bool): Mark every widget read-only.
+        finalize (bool): Bake the widgets into the page content and compact each PDF.
+        workers (int): Process count; 1 renders on the queue's own thread.
+    """
+
+    def __init__(self, tickets, template_path, on_ready, on_error=None, flatten=True, workers=None,
+                 finalize=True):
+        self.tickets = tickets
+        self.template_path = template_path
+        self.on_ready = on_ready
+        self.on_error = on_error
+        self.flatten = flatten
+        self.finalize = finalize
+        if workers is None:
+            workers = default_workers()
+        self.workers = max(1, min(workers, len(tickets)))
+        self._lock = threading.Lock()
+        self._order = deque(range(len(tickets)))
+        self._priority = []
+        self._taken = set()
+        self._finished = 0
+        self._cancelled = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        """
+        Start rendering in the background.
+
+        Returns:
+            RenderQueue: self, for chaining.
+        """
+        self._thread.start()
+        return self
+
+    def prioritize(self, index):
+        """
+        Render a ticket next, ahead of the tickets still waiting in order.
+
+        Args:
+            index (int): Position of the ticket in tickets.
+        """
+        with self._lock:
+            if index not in self._taken:
+                self._priority.append(index)
+
+    def discard(self, index):
+        """
+        Skip a ticket that has not started rendering yet.
+
+        Args:
+            index (int): Position of the ticket in tickets.
+        """
+        with self._lock:
+            if index not in self._taken:
+                self._taken.add(index)
+                self._finished += 1
+
+    def cancel(self):
+        """Stop handing out new jobs; jobs already running still finish."""
+        with self._lock:
+            self._cancelled = True
+
+    @property
+    def pending(self):
+        """int: Tickets not yet rendered (or discarded)."""
+        with self._lock:
+            return len(self.tickets) - self._finished
+
+    def _take_next(self):
+        with self._lock:
+            if self._cancelled:
+                return None
+            while self._priority:
+                index = self._priority.pop()
+                if index not in self._taken:
+                    self._taken.add(index)
+                    return index
+            while self._order:
+                index = self._order.popleft()
+                if index not in self._taken:
+                    self._taken.add(index)
+                    return index
+            return None
+
+    def _finish(self, index, pdf_bytes=None, error=None):
+        with self._lock:
+            self._finished += 1
+        if error is not None:
+            if self.on_error:
+                self.on_error(index, error)
+            else:
+                print(f"Rendering ticket {index + 1} failed: {error}")
+        else:
+            self.on_ready(index, pdf_bytes)
+
+    def _run(self):
+        if self.workers == 1:
+            while True:
+                index = self._take_next()
+                if index is None:
+                    return
+                try:
+                    pdf_bytes = render_pdf(self.tickets[index], self.template_path, flatten=self.flatten,
+                                           finalize=self.finalize)
+                except Exception as e:
+                    self._finish(index, error=e)
+                    continue
+                self._finish(index, pdf_bytes)
+
+        in_flight = {}
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(self.template_path, metrics.is_enabled()),
+        ) as pool:
+            def fill():
+                while len(in_flight) < self.workers:
+                    index = self._take_next()
+                    if index is None:
+                        return
+                    job = (self.tickets[index], self.flatten, self.finalize)
+                    in_flight[pool.submit(_render_job, job)] = index
+
+            fill()
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = in_flight.pop(future)
+                    try:
+                        pdf_bytes = _job_result(future)
+                    except Exception as e:
+                        self._finish(index, error=e)
+                        continue
+                    self._finish(index, pdf_bytes)
+                fill()
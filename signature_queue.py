@@ -0,0 +1,488 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from app_paths import user_data_dir
+from render_cache import ticket_fields
+
+# Job statuses, in the order a job normally moves through them
+QUEUED = "queued"
+SENDING = "sending"
+SENT = "sent"
+FAILED = "failed"
+
+# Where a sent request stands with its signer, as last seen by signature_sync
+AWAITING_SIGNATURE = "awaiting_signature"
+SIGNED = "signed"
+DECLINED = "declined"
+SIGNING_ERROR = "error"
+
+# Signing statuses that no longer change, so the request need not be checked again
+FINAL_SIGNING_STATUSES = (SIGNED, DECLINED)
+
+DEFAULT_WORKERS = 4
+
+# Attempts per job before it is marked failed
+MAX_ATTEMPTS = 6
+
+# First retry delay in seconds; each further attempt doubles it, up to MAX_DELAY
+BASE_DELAY = 5.0
+MAX_DELAY = 15 * 60.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    ticket_key TEXT NOT NULL,
+    signer_name TEXT NOT NULL,
+    signer_email TEXT NOT NULL,
+    pdf BLOB NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL,
+    request_id TEXT,
+    error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    template_path TEXT,
+    field_values TEXT,
+    in_flight_since REAL
+);
+CREATE INDEX IF NOT EXISTS jobs_due ON jobs (status, next_attempt_at);
+CREATE INDEX IF NOT EXISTS jobs_ticket ON jobs (ticket_key);
+CREATE INDEX IF NOT EXISTS jobs_request ON jobs (request_id);
+CREATE TABLE IF NOT EXISTS request_status (
+    request_id TEXT PRIMARY KEY,
+    signing_status TEXT NOT NULL,
+    checked_at REAL NOT NULL
+);
+"""
+
+# Columns added after the first release, created on databases that predate them
+_ADDED_COLUMNS = (
+    ("template_path", "TEXT"),
+    ("field_values", "TEXT"),
+    ("in_flight_since", "REAL"),
+)
+
+_JOB_SELECT = (
+    "SELECT jobs.id, jobs.ticket_key, jobs.signer_name, jobs.signer_email, jobs.status, jobs.attempts,"
+    " jobs.next_attempt_at, jobs.request_id, jobs.error, jobs.updated_at, request_status.signing_status"
+    " FROM jobs LEFT JOIN request_status ON request_status.request_id = jobs.request_id"
+)
+
+
+@dataclass
+class SignatureJob:
+    """
+    One ticket waiting to be, or already, sent for signature.
+
+    Attributes:
+        id (int): Row id in the queue database.
+        ticket_key (str): Identifies the ticket across sessions (see ticket_key()).
+        signer_name (str): Who is asked to sign.
+        signer_email (str): Where the request is sent.
+        status (str): QUEUED, SENDING, SENT or FAILED.
+        attempts (int): Upload attempts made so far.
+        next_attempt_at (float): Unix time the job becomes due again.
+        request_id (Optional[str]): Dropbox Sign's signature_request_id once sent.
+        error (Optional[str]): The last failure, if any.
+        updated_at (float): Unix time of the last status change.
+        signing_status (Optional[str]): For sent jobs, AWAITING_SIGNATURE, SIGNED, DECLINED
+            or SIGNING_ERROR as of the last status sync; None before the first one.
+    """
+    id: int
+    ticket_key: str
+    signer_name: str
+    signer_email: str
+    status: str
+    attempts: int
+    next_attempt_at: float
+    request_id: Optional[str]
+    error: Optional[str]
+    updated_at: float
+    signing_status: Optional[str] = None
+
+
+def ticket_key(ticket):
+    """
+    Stable identity of a ticket's contents, so its send status survives restarts.
+
+    Args:
+        ticket (TicketInfo): The ticket.
+
+    Returns:
+        str: SHA-256 hex digest of every TicketInfo field.
+    """
+    canonical = json.dumps(ticket_fields(ticket), default=str, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8", "surrogatepass")).hexdigest()
+
+
+def job_metadata(job):
+    """
+    Metadata a job's signature request is sent with, so a send whose outcome was lost can be found.
+
+    Args:
+        job (SignatureJob): The job.
+
+    Returns:
+        dict: Metadata for the signature request.
+    """
+    return {"ticket_key": job.ticket_key, "queue_job": str(job.id)}
+
+
+def default_db_path():
+    """str: Location of the queue database in the per-user data folder."""
+    return os.path.join(user_data_dir(), "signature_queue.sqlite3")
+
+
+def backoff_delay(attempts):
+    """
+    Seconds to wait before the next attempt.
+
+    Args:
+        attempts (int): Attempts made so far, starting at 1.
+
+    Returns:
+        float: BASE_DELAY doubled per attempt, capped at MAX_DELAY.
+    """
+    return min(BASE_DELAY * 2 ** (attempts - 1), MAX_DELAY)
+
+
+class SignatureQueue:
+    """
+    Durable queue of signature requests, sent by a pool of background threads.
+
+    Jobs and the PDF bytes they upload (or, in template mode, the field
+    values that fill the registered template) live in SQLite, so a queued send
+    survives closing the app. A job is marked in flight before its upload
+    starts and stays marked until the API has answered; when an upload is
+    cut off (by a crash or a dropped connection) the request is looked up
+    by its metadata (job_metadata()) before the job is sent again, so it is
+    not sent twice. Rate limits and network failures are
+    retried with exponential backoff (or the delay the API asked for);
+    errors the API will not accept on retry fail the job straight away.
+
+    Attributes:
+        db_path (str): Path of the SQLite database.
+        workers (int): Sending threads.
+        on_status (function): Called from a sending thread with each SignatureJob
+            whose status changed.
+        max_attempts (int): Attempts before a job is marked failed.
+    """
+
+    def __init__(self, db_path=None, client=None, workers=DEFAULT_WORKERS, on_status=None,
+                 max_attempts=MAX_ATTEMPTS):
+        self.db_path = db_path or default_db_path()
+        self.workers = workers
+        self.on_status = on_status
+        self.max_attempts = max_attempts
+        self._client = client
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._stopped = False
+        self._threads = []
+
+        self._db = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(_SCHEMA)
+        existing = {row[1] for row in self._db.execute("PRAGMA table_info(jobs)")}
+        for column, column_type in _ADDED_COLUMNS:
+            if column not in existing:
+                self._db.execute(f"ALTER TABLE jobs ADD COLUMN {column} {column_type}")
+        # Nothing is sending right after opening; a job in that state was cut off mid-upload.
+        # It keeps in_flight_since, so it is looked up before being sent again.
+        self._db.execute(
+            "UPDATE jobs SET status = ?, next_attempt_at = ? WHERE status = ?",
+            (QUEUED, time.time(), SENDING),
+        )
+
+    def start(self):
+        """
+        Start the sending threads.
+
+        Returns:
+            SignatureQueue: self, for chaining.
+        """
+        for _ in range(self.workers):
+            thread = threading.Thread(target=self._run, daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        return self
+
+    def stop(self, timeout=5.0):
+        """
+        Stop the sending threads and close the database. Unsent jobs stay queued for next time.
+
+        Args:
+            timeout (float): Seconds to wait for the uploads in progress.
+        """
+        with self._wakeup:
+            self._stopped = True
+            self._wakeup.notify_all()
+        deadline = time.monotonic() + timeout
+        for thread in self._threads:
+            thread.join(max(0.0, deadline - time.monotonic()))
+        if not any(thread.is_alive() for thread in self._threads):
+            # A thread still uploading will record its result; leave the connection open for it
+            with self._lock:
+                self._db.close()
+
+    def enqueue(self, key, signer_name, signer_email, pdf=None, template_path=None, field_values=None):
+        """
+        Queue a ticket for signature, either as a PDF upload or as field values for a template.
+
+        Args:
+            key (str): The ticket's ticket_key().
+            signer_name (str): Who is asked to sign.
+            signer_email (str): Where the request is sent.
+            pdf (str | bytes | None): Path of the ticket PDF, or its contents. The bytes are
+                stored in the queue, so the file may be deleted afterwards.
+            template_path (str | None): Ticket template to sign through instead of uploading.
+            field_values (dict | None): The ticket's template field values, with template_path.
+
+        Returns:
+            SignatureJob: The new job.
+        """
+        if pdf is not None and not isinstance(pdf, bytes):
+            with open(pdf, "rb") as f:
+                pdf = f.read()
+        if field_values is not None:
+            field_values = json.dumps(field_values, ensure_ascii=False)
+
+        now = time.time()
+        with self._wakeup:
+            cursor = self._db.execute(
+                "INSERT INTO jobs (ticket_key, signer_name, signer_email, pdf, status, next_attempt_at,"
+                " created_at, updated_at, template_path, field_values) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, signer_name, signer_email, sqlite3.Binary(pdf or b""), QUEUED, now, now, now,
+                 template_path, field_values),
+            )
+            job = self._job(cursor.lastrowid)
+            self._wakeup.notify()
+        self._notify(job)
+        return job
+
+    def retry(self, job_id):
+        """
+        Queue a failed job again, with a fresh set of attempts.
+
+        Args:
+            job_id (int): The job's id.
+        """
+        with self._wakeup:
+            self._db.execute(
+                "UPDATE jobs SET status = ?, attempts = 0, next_attempt_at = ?, updated_at = ?"
+                " WHERE id = ? AND status = ?",
+                (QUEUED, time.time(), time.time(), job_id, FAILED),
+            )
+            job = self._job(job_id)
+            self._wakeup.notify()
+        self._notify(job)
+
+    def latest(self, keys):
+        """
+        Look up the most recent job of each ticket.
+
+        Args:
+            keys (iterable[str]): ticket_key() values.
+
+        Returns:
+            dict: ticket_key -> SignatureJob, for tickets that were ever queued.
+        """
+        keys = list(set(keys))
+        latest = {}
+        with self._lock:
+            # Stay well under SQLite's bound-parameter limit
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                rows = self._db.execute(
+                    f"{_JOB_SELECT} WHERE jobs.ticket_key IN ({','.join('?' * len(chunk))}) ORDER BY jobs.id",
+                    chunk,
+                )
+                for row in rows:
+                    latest[row[1]] = SignatureJob(*row)
+        return latest
+
+    def counts(self):
+        """
+        dict: Number of jobs in each status.
+        """
+        with self._lock:
+            return dict(self._db.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status"))
+
+    def outstanding_requests(self):
+        """
+        Sent requests whose signing status may still change.
+
+        Returns:
+            dict: signature_request_id -> Unix time the request was sent.
+        """
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT jobs.request_id, jobs.updated_at FROM jobs"
+                " LEFT JOIN request_status ON request_status.request_id = jobs.request_id"
+                f" WHERE jobs.status = ? AND (request_status.signing_status IS NULL"
+                f" OR request_status.signing_status NOT IN ({','.join('?' * len(FINAL_SIGNING_STATUSES))}))",
+                (SENT, *FINAL_SIGNING_STATUSES),
+            )
+            return dict(rows)
+
+    def record_signing_statuses(self, statuses):
+        """
+        Store the signing status of sent requests and report the jobs whose status changed.
+
+        Args:
+            statuses (dict): signature_request_id -> signing status.
+
+        Returns:
+            list[SignatureJob]: The jobs whose signing status changed.
+        """
+        changed = []
+        now = time.time()
+        with self._lock:
+            for request_id, signing_status in statuses.items():
+                row = self._db.execute(
+                    "SELECT signing_status FROM request_status WHERE request_id = ?", (request_id,)
+                ).fetchone()
+                self._db.execute(
+                    "INSERT INTO request_status (request_id, signing_status, checked_at) VALUES (?, ?, ?)"
+                    " ON CONFLICT (request_id) DO UPDATE SET signing_status = excluded.signing_status,"
+                    " checked_at = excluded.checked_at",
+                    (request_id, signing_status, now),
+                )
+                if row is None or row[0] != signing_status:
+                    changed.extend(
+                        SignatureJob(*job)
+                        for job in self._db.execute(f"{_JOB_SELECT} WHERE jobs.request_id = ?", (request_id,))
+                    )
+        for job in changed:
+            self._notify(job)
+        return changed
+
+    def _job(self, job_id):
+        row = self._db.execute(f"{_JOB_SELECT} WHERE jobs.id = ?", (job_id,)).fetchone()
+        return SignatureJob(*row) if row else None
+
+    def _notify(self, job):
+        if job is not None and self.on_status:
+            try:
+                self.on_status(job)
+            except Exception as e:
+                print(f"Signature status callback failed: {e}")
+
+    def _claim(self):
+        """
+        Wait for a due job and mark it sending and in flight.
+
+        Returns:
+            tuple | None: (job, payload, unconfirmed_since), or None when stopped. unconfirmed_since
+            is when an earlier upload with an unknown outcome started, or None.
+        """
+        with self._wakeup:
+            while not self._stopped:
+                now = time.time()
+                row = self._db.execute(
+                    "SELECT id, pdf, template_path, field_values, in_flight_since FROM jobs"
+                    " WHERE status = ? AND next_attempt_at <= ?"
+                    " ORDER BY next_attempt_at, id LIMIT 1",
+                    (QUEUED, now),
+                ).fetchone()
+                if row is not None:
+                    job_id, pdf, template_path, field_values, unconfirmed_since = row
+                    self._db.execute(
+                        "UPDATE jobs SET status = ?, attempts = attempts + 1, updated_at = ?,"
+                        " in_flight_since = COALESCE(in_flight_since, ?) WHERE id = ?",
+                        (SENDING, now, now, job_id),
+                    )
+                    if field_values is not None:
+                        payload = (template_path, json.loads(field_values))
+                    else:
+                        payload = bytes(pdf)
+                    return self._job(job_id), payload, unconfirmed_since
+
+                upcoming = self._db.execute(
+                    "SELECT MIN(next_attempt_at) FROM jobs WHERE status = ?", (QUEUED,)
+                ).fetchone()[0]
+                self._wakeup.wait(None if upcoming is None else max(0.05, upcoming - now))
+            return None
+
+    def _finish(self, job_id, status, request_id=None, error=None, next_attempt_at=None, confirmed=True):
+        """
+        Record the outcome of an attempt.
+
+        confirmed is False when the upload may have reached the API without
+        an answer coming back; the job then stays in flight.
+        """
+        with self._lock:
+            if self._stopped and status == QUEUED:
+                next_attempt_at = time.time()
+            self._db.execute(
+                "UPDATE jobs SET status = ?, request_id = COALESCE(?, request_id), error = ?,"
+                " next_attempt_at = COALESCE(?, next_attempt_at), updated_at = ?,"
+                " in_flight_since = CASE WHEN ? THEN NULL ELSE in_flight_since END WHERE id = ?",
+                (status, request_id, error, next_attempt_at, time.time(), confirmed, job_id),
+            )
+            job = self._job(job_id)
+        self._notify(job)
+
+    def _get_client(self):
+        if self._client is None:
+            from dropbox import get_client
+
+            self._client = get_client()
+        return self._client
+
+    def _run(self):
+        from dropbox import retry_delay
+        from dropbox_sign.rest import ApiException
+        from signature_sync import find_sent_request
+
+        while True:
+            claimed = self._claim()
+            if claimed is None:
+                return
+            job, payload, unconfirmed_since = claimed
+            self._notify(job)
+
+            # An earlier upload with an unknown outcome must be looked for before sending again
+            looked_up = unconfirmed_since is None
+            try:
+                client = self._get_client()
+                metadata = job_metadata(job)
+                request_id = None
+                if not looked_up:
+                    request_id = find_sent_request(client, metadata, unconfirmed_since)
+                    looked_up = True
+                if request_id is None:
+                    if isinstance(payload, tuple):
+                        template_path, field_values = payload
+                        request_id = client.send_with_template(
+                            job.signer_name, job.signer_email, client.template_id_for(template_path), field_values,
+                            metadata=metadata)
+                    else:
+                        request_id = client.send(job.signer_name, job.signer_email, payload, metadata=metadata)
+            except ApiException as e:
+                # The API answered, so this attempt created nothing; earlier ones were looked for
+                confirmed = looked_up
+                delay = retry_delay(e, job.attempts)
+                error = f"{e.status} {e.reason}: {e.body}"
+            except ValueError as e:
+                confirmed = looked_up
+                delay, error = None, str(e)  # No API key configured; retrying will not help
+            except Exception as e:
+                confirmed = False  # Network trouble: the upload may have got through
+                delay, error = backoff_delay(job.attempts), str(e)
+            else:
+                self._finish(job.id, SENT, request_id=request_id)
+                continue
+
+            if delay is None or job.attempts >= self.max_attempts:
+                self._finish(job.id, FAILED, error=error, confirmed=confirmed)
+            else:
+                delay = max(delay, backoff_delay(job.attempts))
+                self._finish(job.id, QUEUED, error=error, next_attempt_at=time.time() + delay, confirmed=confirmed)
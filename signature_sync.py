@@ -0,0 +1,189 @@
+import time
+from dataclasses import dataclass
+
+import metrics
+from signature_queue import AWAITING_SIGNATURE, DECLINED, SIGNED, SIGNING_ERROR
+
+# Largest page the list endpoint returns
+PAGE_SIZE = 100
+
+# Slack between our clock and the API's when deciding a page is older than anything outstanding
+CLOCK_SKEW = 60 * 60
+
+# Attempts per page before a rate-limited or failing sync gives up until next time
+MAX_ATTEMPTS = 5
+
+
+@dataclass
+class SyncResult:
+    """
+    What one status sync did.
+
+    Attributes:
+        outstanding (int): Sent requests whose status could still change.
+        found (int): Outstanding requests seen in the listed pages.
+        changed (int): Jobs whose signing status changed.
+        pages (int): List pages fetched, i.e. API round-trips.
+    """
+    outstanding: int = 0
+    found: int = 0
+    changed: int = 0
+    pages: int = 0
+
+
+def list_page(client, page, page_size=PAGE_SIZE):
+    """
+    Fetch one page of the account's signature requests, newest first, waiting out rate limits.
+
+    Args:
+        client (SignatureClient): The API client.
+        page (int): Page number, starting at 1.
+        page_size (int): Requests per page.
+
+    Returns:
+        SignatureRequestListResponse: The page.
+
+    Raises:
+        ApiException: If the API keeps refusing the call.
+    """
+    from dropbox import retry_delay
+    from dropbox_sign.rest import ApiException
+
+    attempt = 0
+    while True:
+        attempt += 1
+        try:
+            with metrics.stage("status_sync_page"):
+                return client.signature_api.signature_request_list(page=page, page_size=page_size)
+        except ApiException as e:
+            delay = retry_delay(e, attempt)
+            if delay is None or attempt >= MAX_ATTEMPTS:
+                raise
+            time.sleep(delay)
+
+
+def find_sent_request(client, metadata, since, page_size=PAGE_SIZE):
+    """
+    Look for a request that was sent with the given metadata, e.g. by an upload whose outcome was lost.
+
+    Pages are walked newest first and the walk stops at requests created
+    more than CLOCK_SKEW before since.
+
+    Args:
+        client (SignatureClient): The API client.
+        metadata (dict): Metadata the request was sent with; every item must match.
+        since (float): Unix time of the first attempt that may have created it.
+        page_size (int): Requests per list call.
+
+    Returns:
+        str | None: The signature_request_id, or None if no such request exists.
+
+    Raises:
+        ApiException: If the API keeps refusing the list call.
+    """
+    watermark = since - CLOCK_SKEW
+    page = 1
+    while True:
+        response = list_page(client, page, page_size)
+        oldest = None
+        for signature_request in response.signature_requests or []:
+            found = signature_request.metadata or {}
+            if all(str(found.get(name)) == str(value) for name, value in metadata.items()):
+                return signature_request.signature_request_id
+            if signature_request.created_at is not None:
+                oldest = signature_request.created_at if oldest is None else min(oldest, signature_request.created_at)
+
+        if response.list_info is None or page >= (response.list_info.num_pages or 0):
+            return None
+        if oldest is not None and oldest < watermark:
+            return None
+        page += 1
+
+
+def signing_status(signature_request):
+    """
+    Collapse a signature request's flags into one signing status.
+
+    Args:
+        signature_request (SignatureRequestResponse): One request from the API.
+
+    Returns:
+        str: SIGNED, DECLINED, SIGNING_ERROR or AWAITING_SIGNATURE.
+    """
+    if signature_request.is_declined:
+        return DECLINED
+    if signature_request.has_error:
+        return SIGNING_ERROR
+    if signature_request.is_complete:
+        return SIGNED
+    return AWAITING_SIGNATURE
+
+
+class StatusSync:
+    """
+    Refreshes the signing status of every outstanding request with paged list calls.
+
+    The list endpoint returns requests newest first, up to PAGE_SIZE per
+    call, so one sync costs one call per page of requests sent since the
+    oldest one still outstanding rather than one call per request. Paging
+    stops as soon as every outstanding request has been seen or the pages
+    are older than the oldest of them: that watermark moves forward as
+    requests are signed, so each sync only walks what changed recently.
+
+    Attributes:
+        queue (SignatureQueue): Where the sent requests and their statuses are kept.
+        page_size (int): Requests per list call.
+    """
+
+    def __init__(self, queue, client=None, page_size=PAGE_SIZE):
+        self.queue = queue
+        self.page_size = page_size
+        self._client = client
+
+    def _get_client(self):
+        if self._client is None:
+            from dropbox import get_client
+
+            self._client = get_client()
+        return self._client
+
+    def sync(self):
+        """
+        Fetch the current status of the outstanding requests and store it in the queue.
+
+        Returns:
+            SyncResult: Counts of what was checked and changed.
+
+        Raises:
+            ApiException: If the API keeps refusing the list call.
+        """
+        outstanding = self.queue.outstanding_requests()
+        result = SyncResult(outstanding=len(outstanding))
+        if not outstanding:
+            return result
+
+        watermark = min(outstanding.values()) - CLOCK_SKEW
+        statuses = {}
+        page = 1
+        while True:
+            response = list_page(self._get_client(), page, self.page_size)
+            result.pages += 1
+            oldest = None
+            for signature_request in response.signature_requests or []:
+                if signature_request.signature_request_id in outstanding:
+                    statuses[signature_request.signature_request_id] = signing_status(signature_request)
+                if signature_request.created_at is not None:
+                    oldest = signature_request.created_at if oldest is None else min(oldest, signature_request.created_at)
+
+            if len(statuses) == len(outstanding):
+                break
+            if response.list_info is None or page >= (response.list_info.num_pages or 0):
+                break
+            if oldest is not None and oldest < watermark:
+                break
+            page += 1
+
+        result.found = len(statuses)
+        result.changed = len(self.queue.record_signing_statuses(statuses))
+        metrics.count("status_sync_pages", result.pages)
+        return result
@@ -0,0 +1,187 @@
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+import fitz  # PyMuPDF
+from template_store import get_template_store
+
+# Handler kinds a template widget can resolve to
+SCALAR = "scalar"
+DATE = "date"
+CHECKBOX = "checkbox"
+LIST_SLOT = "list"
+
+# Ticket fields that are written as a single value
+SCALAR_FIELDS = (
+    "PatientName",
+    "PatientFirstName",
+    "PatientMiddleIntial",
+    "PatientLastName",
+    "AccountNum",
+    "StreetAddress",
+    "City",
+    "State",
+    "Zip",
+    "Date",
+    "Telephone",
+    "EmailAddress",
+)
+
+# Widget name prefix -> ticket list attribute, longest prefix first so
+# "CodeDescription3" is never mistaken for "Code" + "Description3".
+LIST_PREFIXES = sorted(
+    {
+        "CodeDescription": "CodeDescriptions",
+        "Code": "HCodes",
+        "Item": "ICodes",
+        "Units": "Units",
+    }.items(),
+    key=lambda x: -len(x[0]),
+)
+
+_index_cache = {}
+
+
+@dataclass(frozen=True)
+class FieldHandler:
+    """
+    How a single template widget is filled.
+
+    Attributes:
+        kind (str): One of SCALAR, DATE, CHECKBOX or LIST_SLOT.
+        key (str): Ticket attribute the value is read from.
+        index (int): Position in the ticket list for LIST_SLOT handlers.
+    """
+    kind: str
+    key: str = ""
+    index: int = 0
+
+
+@dataclass
+class TemplateIndex:
+    """
+    Compiled field layout of a PDF ticket template.
+
+    Attributes:
+        path (str): Absolute path of the template file.
+        signature (tuple): (mtime_ns, size) of the file the index was built from.
+        handlers (Dict[int, FieldHandler]): Widget xref -> resolved handler.
+        widget_pages (List[int]): Page numbers that carry at least one widget.
+        field_names (Dict[int, str]): Widget xref -> field name, for the handled widgets.
+    """
+    path: str
+    signature: tuple
+    handlers: Dict[int, FieldHandler]
+    widget_pages: List[int]
+    field_names: Dict[int, str] = field(default_factory=dict)
+
+    def handler_for(self, widget):
+        """
+        Look up the handler of a widget from a document opened on this template.
+
+        Args:
+            widget (fitz.Widget): Widget of the filled document.
+
+        Returns:
+            FieldHandler | None: The handler, or None if the widget is left untouched.
+        """
+        return self.handlers.get(widget.xref)
+
+    def list_capacity(self):
+        """
+        Count the numbered slots the template has for each ticket list.
+
+        Returns:
+            dict: Ticket list attribute (e.g. "HCodes") -> number of slots.
+        """
+        capacity = {}
+        for handler in self.handlers.values():
+            if handler.kind == LIST_SLOT:
+                capacity[handler.key] = max(capacity.get(handler.key, 0), handler.index + 1)
+        return capacity
+
+
+def resolve_field(field_name, field_type):
+    """
+    Resolve a widget name to the handler that fills it.
+
+    Mirrors the precedence fill_pdf has always used: the Delivery checkbox,
+    then the date fields, then scalar ticket attributes, then numbered list slots.
+
+    Args:
+        field_name (str): The widget's field name.
+        field_type (int): The widget's PyMuPDF field type.
+
+    Returns:
+        FieldHandler | None: The handler, or None if the field is not fillable.
+    """
+    if not field_name:
+        return None
+
+    if field_type == fitz.PDF_WIDGET_TYPE_CHECKBOX and field_name == "Delivery":
+        return FieldHandler(CHECKBOX)
+
+    if field_name in ("ServDate", "Date"):
+        return FieldHandler(DATE, "Date")
+
+    if field_name in SCALAR_FIELDS:
+        return FieldHandler(SCALAR, field_name)
+
+    for prefix, data_key in LIST_PREFIXES:
+        if field_name.startswith(prefix):
+            index_str = field_name[len(prefix):]
+            if index_str.isdigit():
+                return FieldHandler(LIST_SLOT, data_key, int(index_str))
+            break
+
+    return None
+
+
+def compile_template(template_path):
+    """
+    Walk every widget of a template once and resolve its handler.
+
+    Args:
+        template_path (str): Path to the PDF ticket template.
+
+    Returns:
+        TemplateIndex: The compiled index.
+    """
+    store = get_template_store(template_path)
+    data, signature, _ = store.snapshot()
+    handlers = {}
+    field_names = {}
+    widget_pages = []
+
+    with fitz.open(stream=data, filetype="pdf") as doc:
+        for page in doc:
+            has_widgets = False
+            for widget in page.widgets():
+                has_widgets = True
+                handler = resolve_field(widget.field_name, widget.field_type)
+                if handler is not None:
+                    handlers[widget.xref] = handler
+                    field_names[widget.xref] = widget.field_name
+            if has_widgets:
+                widget_pages.append(page.number)
+
+    return TemplateIndex(store.path, signature, handlers, widget_pages, field_names)
+
+
+def get_template_index(template_path):
+    """
+    Return the compiled index for a template, rebuilding it only when the file changed.
+
+    Args:
+        template_path (str): Path to the PDF ticket template.
+
+    Returns:
+        TemplateIndex: The cached or freshly compiled index.
+    """
+    store = get_template_store(template_path)
+    cached = _index_cache.get(store.path)
+    if cached is not None and cached.signature == store.signature:
+        return cached
+
+    index = compile_template(store.path)
+    _index_cache[store.path] = index
+    return index
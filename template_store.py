@@ -0,0 +1,100 @@
+import hashlib
+import os
+import threading
+import time
+
+import fitz  # PyMuPDF
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+class TemplateStore:
+    """
+    Keeps a PDF template in memory and hands out fresh documents parsed from those bytes.
+
+    The file is read once; later opens only stat it (at most once per
+    check_interval seconds) and re-read it when its mtime or size changed.
+
+    Attributes:
+        path (str): Absolute path of the template file.
+        check_interval (float): Minimum seconds between on-disk change checks.
+    """
+
+    def __init__(self, path, check_interval=1.0):
+        self.path = os.path.abspath(path)
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._data = None
+        self._signature = None
+        self._digest = None
+        self._checked_at = 0.0
+
+    def _refresh(self):
+        now = time.monotonic()
+        if self._data is not None and now - self._checked_at < self.check_interval:
+            return
+
+        stat = os.stat(self.path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if signature != self._signature:
+            with open(self.path, "rb") as f:
+                self._data = f.read()
+            self._signature = signature
+            self._digest = hashlib.sha256(self._data).hexdigest()
+        self._checked_at = now
+
+    def snapshot(self):
+        """
+        Return the current template contents, reloading them if the file changed.
+
+        Returns:
+            tuple: (data, signature, digest) where data is the file's bytes,
+            signature is (mtime_ns, size) and digest is the SHA-256 hex digest.
+        """
+        with self._lock:
+            self._refresh()
+            return self._data, self._signature, self._digest
+
+    @property
+    def data(self):
+        """bytes: The template file's contents."""
+        return self.snapshot()[0]
+
+    @property
+    def signature(self):
+        """tuple: (mtime_ns, size) of the loaded template."""
+        return self.snapshot()[1]
+
+    @property
+    def digest(self):
+        """str: SHA-256 hex digest of the loaded template."""
+        return self.snapshot()[2]
+
+    def open(self):
+        """
+        Open a fresh, independent document on the in-memory template.
+
+        Returns:
+            fitz.Document: A new document the caller may fill and close.
+        """
+        return fitz.open(stream=self.data, filetype="pdf")
+
+
+def get_template_store(template_path):
+    """
+    Return the session-wide store for a template path, creating it on first use.
+
+    Args:
+        template_path (str): Path to the PDF template.
+
+    Returns:
+        TemplateStore: The shared store.
+    """
+    path = os.path.abspath(template_path)
+    with _stores_lock:
+        store = _stores.get(path)
+        if store is None:
+            store = TemplateStore(path)
+            _stores[path] = store
+        return store
@@ -0,0 +1,55 @@
+import os
+import sys
+import time
+
+import pytest
+
+# The app is a flat set of modules run from the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dropbox_sign_stub import DropboxSignStub  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def user_dirs(tmp_path, monkeypatch):
+    """Keep per-user state (template ids, caches, queue db) out of the real home folder."""
+    monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path / "data"))
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.setenv("DROPBOX_SIGN_API_KEY", "test-key")
+    for name in ("DROPBOX_SIGN_HOST", "DROPBOX_SIGN_CONCURRENCY", "DROPBOX_SIGN_MODE"):
+        monkeypatch.delenv(name, raising=False)
+    return tmp_path
+
+
+@pytest.fixture
+def stub():
+    """A Dropbox Sign stub that never rate limits; tests tune stub.state as needed."""
+    with DropboxSignStub(retry_after=0) as server:
+        yield server
+
+
+@pytest.fixture
+def client(stub):
+    """The session's Dropbox Sign client, pointed at the stub."""
+    from dropbox import get_client
+
+    return get_client(host=stub.host)
+
+
+@pytest.fixture
+def queue(tmp_path, client):
+    """A signature queue in a temporary database that sends through the stub."""
+    from signature_queue import SignatureQueue
+
+    signature_queue = SignatureQueue(str(tmp_path / "queue.sqlite3"), client=client).start()
+    yield signature_queue
+    signature_queue.stop()
+
+
+def wait_for(condition, timeout=10.0):
+    """Poll condition() until it is true; fail the test after timeout seconds."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            pytest.fail("Timed out waiting for the signature queue")
+        time.sleep(0.02)
@@ -0,0 +1,90 @@
+import socket
+
+import dropbox
+
+PDF = b"%PDF-1.4\n% delivery ticket\n"
+
+
+def jobs(count):
+    return [(f"Patient {i}", f"patient{i}@example.com", PDF) for i in range(count)]
+
+
+def test_send_signature_requests_runs_sends_concurrently(stub):
+    stub.state.latency = 0.2
+    finished = []
+
+    results = dropbox.send_signature_requests(
+        jobs(8), host=stub.host, concurrency=4, on_result=lambda index, result: finished.append(index))
+
+    assert all(result.ok for result in results)
+    assert [result.signer_email for result in results] == [f"patient{i}@example.com" for i in range(8)]
+    assert sorted(finished) == list(range(8))
+    assert len(stub.state.signature_requests) == 8
+    assert 1 < stub.state.max_in_flight <= 4
+
+
+def test_send_signature_requests_respects_concurrency_of_one(stub):
+    stub.state.latency = 0.05
+
+    results = dropbox.send_signature_requests(jobs(3), host=stub.host, concurrency=1)
+
+    assert all(result.ok for result in results)
+    assert stub.state.max_in_flight == 1
+
+
+def test_rate_limited_sends_are_retried_until_they_succeed(stub):
+    stub.state.rate_limit_every = 2
+
+    results = dropbox.send_signature_requests(jobs(6), host=stub.host, concurrency=3)
+
+    assert all(result.ok for result in results)
+    assert len({result.request_id for result in results}) == 6
+    assert stub.state.rate_limited > 0
+    assert sum(result.attempts for result in results) == 6 + stub.state.rate_limited
+    assert len(stub.state.signature_requests) == 6
+
+
+def test_dropped_connections_are_retried_until_the_send_succeeds(stub, monkeypatch):
+    monkeypatch.setattr(dropbox.time, "sleep", lambda seconds: None)
+    stub.state.drop_every = 3
+
+    results = dropbox.send_signature_requests(jobs(6), host=stub.host, concurrency=2)
+
+    assert all(result.ok for result in results)
+    assert stub.state.dropped > 0
+    assert sum(result.attempts for result in results) == 6 + stub.state.dropped
+    assert len(stub.state.signature_requests) == 6
+
+
+def test_unreachable_api_fails_each_ticket_without_aborting_the_batch(monkeypatch):
+    monkeypatch.setattr(dropbox.time, "sleep", lambda seconds: None)
+    with socket.socket() as unused:
+        unused.bind(("127.0.0.1", 0))
+        host = f"http://127.0.0.1:{unused.getsockname()[1]}/v3"  # Nothing listens once it is closed
+
+    results = dropbox.send_signature_requests(jobs(3), host=host, concurrency=2)
+
+    assert [result.ok for result in results] == [False] * 3
+    assert all(result.attempts == dropbox.MAX_ATTEMPTS for result in results)
+    assert all(result.error.startswith("Error: ") for result in results)
+
+
+def test_send_gives_up_after_max_attempts(stub):
+    stub.state.rate_limit_every = 1
+
+    result = dropbox.send_with_retry(dropbox.get_client(host=stub.host), "Patient", "p@example.com", PDF,
+                                     max_attempts=3)
+
+    assert not result.ok
+    assert result.attempts == 3
+    assert result.error.startswith("Error: 429")
+    assert not stub.state.signature_requests
+
+
+def test_retry_delay_honours_retry_after():
+    error = dropbox.ApiException(status=429)
+    error.headers = {"Retry-After": "7"}
+    assert dropbox.retry_delay(error, 1) == 7.0
+
+    error = dropbox.ApiException(status=400)
+    assert dropbox.retry_delay(error, 1) is None
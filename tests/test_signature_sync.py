@@ -0,0 +1,95 @@
+import time
+
+from conftest import wait_for
+from signature_queue import AWAITING_SIGNATURE, DECLINED, SENT, SIGNED
+from signature_sync import StatusSync, find_sent_request
+
+PDF = b"%PDF-1.4\n% delivery ticket\n"
+DAY = 24 * 60 * 60
+
+
+def send_old_requests(stub, client, count):
+    """Requests sent well before anything in the queue, as from earlier days of use."""
+    for i in range(count):
+        request_id = client.send(f"Old {i}", f"old{i}@example.com", PDF)
+        stub.state.signature_requests[request_id]["created_at"] -= 2 * DAY
+
+
+def send_through_queue(queue, count):
+    keys = [f"ticket-{i}" for i in range(count)]
+    for key in keys:
+        queue.enqueue(key, f"Patient {key}", f"{key}@example.com", pdf=PDF)
+    wait_for(lambda: queue.counts().get(SENT) == count)
+    return [queue.latest(keys)[key] for key in keys]
+
+
+def test_sync_updates_statuses_and_stops_paging_at_the_watermark(stub, client, queue):
+    send_old_requests(stub, client, 25)
+    jobs = send_through_queue(queue, 12)
+    for job in jobs[:3]:
+        stub.sign(job.request_id)
+    for job in jobs[3:5]:
+        stub.decline(job.request_id)
+    # A request that no longer shows up in the list must not make the sync walk every page
+    del stub.state.signature_requests[jobs[-1].request_id]
+    stub.state.list_calls = 0
+
+    result = StatusSync(queue, client, page_size=5).sync()
+
+    # 11 queued requests, then old ones from page 3 on: nothing older can be outstanding
+    assert result.outstanding == 12
+    assert result.found == 11
+    assert result.pages == stub.state.list_calls == 3
+    assert result.changed == 11
+    latest = queue.latest(job.ticket_key for job in jobs)
+    statuses = [latest[job.ticket_key].signing_status for job in jobs]
+    assert statuses == [SIGNED] * 3 + [DECLINED] * 2 + [AWAITING_SIGNATURE] * 6 + [None]
+
+
+def test_sync_stops_once_every_outstanding_request_is_found(stub, client, queue):
+    jobs = send_through_queue(queue, 4)
+    send_old_requests(stub, client, 20)
+    stub.sign(jobs[0].request_id)
+    stub.state.list_calls = 0
+
+    result = StatusSync(queue, client, page_size=5).sync()
+
+    assert result.pages == stub.state.list_calls == 1
+    assert result.found == 4
+    assert result.changed == 4
+
+
+def test_signed_and_declined_requests_are_not_synced_again(stub, client, queue):
+    jobs = send_through_queue(queue, 6)
+    stub.sign(jobs[0].request_id)
+    stub.decline(jobs[1].request_id)
+    sync = StatusSync(queue, client, page_size=5)
+    sync.sync()
+
+    stub.sign(jobs[2].request_id)
+    result = sync.sync()
+
+    assert result.outstanding == 4
+    assert result.changed == 1
+    assert queue.latest([jobs[2].ticket_key])[jobs[2].ticket_key].signing_status == SIGNED
+
+
+def test_sync_without_outstanding_requests_makes_no_calls(stub, client, queue):
+    result = StatusSync(queue, client, page_size=5).sync()
+
+    assert result.outstanding == result.pages == 0
+    assert stub.state.list_calls == 0
+
+
+def test_find_sent_request_matches_metadata_and_stops_at_the_watermark(stub, client):
+    send_old_requests(stub, client, 12)
+    request_id = client.send("Patient", "p@example.com", PDF, metadata={"ticket_key": "abc", "queue_job": "7"})
+    stub.state.list_calls = 0
+
+    assert find_sent_request(client, {"ticket_key": "abc", "queue_job": "7"}, time.time(), page_size=5) == request_id
+    assert stub.state.list_calls == 1
+
+    stub.state.list_calls = 0
+    assert find_sent_request(client, {"ticket_key": "abc", "queue_job": "8"}, time.time(), page_size=5) is None
+    # Page 1 already reaches requests older than since - CLOCK_SKEW
+    assert stub.state.list_calls == 1
@@ -0,0 +1,96 @@
+import os
+from types import SimpleNamespace
+
+import pytest
+
+import dropbox
+from artifact_store import get_artifact_store
+from conftest import wait_for
+from dropbox_sign.rest import ApiException
+from fill_pdf import fits_template, render_pdf, template_field_values
+from signature_queue import SENT
+from ticket_app import TicketApp
+from ticket_info import TicketInfo
+
+TEMPLATE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "assets",
+                        "delivery_ticket_template.pdf")
+
+
+def make_ticket(line_items, last_name="Smith"):
+    return TicketInfo(
+        PatientFirstName="Barbara", PatientMiddleIntial="J", PatientLastName=last_name, AccountNum="100000",
+        StreetAddress="6635 Main St", City="Salem", State="OR", Zip="97301", Date="05/17/2025",
+        Telephone="555-902-5969", EmailAddress=f"{last_name.lower()}@example.com",
+        Units=[str(i + 1) for i in range(line_items)],
+        HCodes=[f"E0{260 + i} Item {i}" for i in range(line_items)],
+        CodeDescriptions=[f"Description {i}" for i in range(line_items)],
+        ICodes=[f"SKU-{i}" for i in range(line_items)],
+    )
+
+
+def test_template_is_registered_once_per_host(stub, client):
+    template_id = client.template_id_for(TEMPLATE)
+
+    assert client.template_id_for(TEMPLATE) == template_id
+    # Another session finds the id saved in the per-user data folder
+    with dropbox.SignatureClient(host=stub.host) as other:
+        assert other.template_id_for(TEMPLATE) == template_id
+    assert list(stub.state.templates) == [template_id]
+    assert len(stub.state.payload_bytes["template/create"]) == 1
+
+
+def test_template_has_a_merge_field_for_every_ticket_field(stub, client):
+    template_id = client.template_id_for(TEMPLATE)
+
+    field_values = template_field_values(make_ticket(8), TEMPLATE)
+    assert set(field_values) <= set(stub.state.templates[template_id]["merge_fields"])
+
+
+def test_send_with_template_maps_field_values_to_custom_fields(stub, client):
+    ticket = make_ticket(3)
+    field_values = template_field_values(ticket, TEMPLATE)
+
+    request_id = client.send_with_template("Barbara Smith", "smith@example.com", client.template_id_for(TEMPLATE),
+                                           field_values, metadata={"ticket_key": "abc"})
+
+    signature_request = stub.state.signature_requests[request_id]
+    sent = {field["name"]: field["value"] for field in signature_request["custom_fields"]}
+    assert sent == field_values
+    assert sent["PatientName"] == "Smith, Barbara"
+    assert [sent[f"Units{i}"] for i in range(3)] == ["1", "2", "3"]
+    assert "Units3" not in sent
+    assert signature_request["signatures"][0]["signer_role"] == dropbox.SIGNER_ROLE
+    assert signature_request["metadata"] == {"ticket_key": "abc"}
+
+
+def test_unknown_custom_fields_are_rejected(stub, client):
+    template_id = client.template_id_for(TEMPLATE)
+
+    with pytest.raises(ApiException) as error:
+        client.send_with_template("Barbara Smith", "smith@example.com", template_id, {"NotAField": "x"})
+
+    assert error.value.status == 400
+    assert not stub.state.signature_requests
+
+
+def test_tickets_longer_than_the_template_do_not_fit():
+    assert fits_template(make_ticket(8), TEMPLATE)
+    assert not fits_template(make_ticket(9), TEMPLATE)
+
+
+def test_template_mode_falls_back_to_upload_for_long_tickets(stub, queue, monkeypatch):
+    monkeypatch.setenv("DROPBOX_SIGN_MODE", dropbox.TEMPLATE_MODE)
+    # Just the state _queue_signature reads, so no Tk window is needed
+    app = SimpleNamespace(get_signature_queue=lambda: queue, signature_status={}, pdf_path=TEMPLATE)
+    short, long = make_ticket(3, "Short"), make_ticket(9, "Long")
+    for ticket in (short, long):
+        key = get_artifact_store().add(render_pdf(ticket, TEMPLATE), "test")
+        TicketApp._queue_signature(app, ticket, ticket.PatientLastName, ticket.EmailAddress, key)
+
+    wait_for(lambda: queue.counts().get(SENT) == 2)
+
+    sent = {request["signatures"][0]["signer_name"]: request for request in stub.state.signature_requests.values()}
+    assert sent["Short"]["template_ids"] == list(stub.state.templates)
+    assert "template_ids" not in sent["Long"]
+    assert len(stub.state.payload_bytes["signature_request/send_with_template"]) == 1
+    assert len(stub.state.payload_bytes["signature_request/send"]) == 1
@@ -0,0 +1,112 @@
+import cli
+import metrics
+from benchmarks.synthetic_export import TSV_COLUMNS, generate_line_items, write_tsv, write_xlsx
+from pdf_handler import group_orders
+from tsv_handler import handle_file, iter_file_rows
+
+BLANK = dict.fromkeys(TSV_COLUMNS, "")
+# Line (TSV) or worksheet row (Excel) of the first line item
+FIRST_TSV_LINE = 7
+FIRST_XLSX_ROW = 6
+
+
+def line_items():
+    return generate_line_items(2, lines_per_order=(2, 2))
+
+
+def dated_memo(item):
+    """A description-only line, as QuickBooks exports an order's memo."""
+    return {**BLANK, "Date": item["Date"], "Product/Service Description": "Memo: leave at door"}
+
+
+def test_dated_memo_line_is_merged_not_rejected(tmp_path):
+    items = line_items()
+    items.insert(1, dated_memo(items[0]))
+    path = str(tmp_path / "export.tsv")
+    write_tsv(path, items, continuation_rate=0, memo_rate=0)
+
+    rejected = []
+    rows, _ = handle_file(path, rejected=rejected)
+
+    assert rejected == []
+    assert len(rows) == 4
+    assert rows[0]["Product/Service Description"].endswith(" Memo: leave at door")
+
+
+def test_invalid_quantity_and_date_are_rejected(tmp_path):
+    items = line_items()
+    items[1] = {**items[1], "Quantity": "two"}
+    items[2] = {**items[2], "Date": "13/45/2025"}
+    path = str(tmp_path / "export.tsv")
+    write_tsv(path, items, continuation_rate=0, memo_rate=0)
+
+    rejected = []
+    rows, _ = handle_file(path, rejected=rejected)
+
+    assert rejected == [
+        {"row": FIRST_TSV_LINE + 1, "reason": "invalid quantity"},
+        {"row": FIRST_TSV_LINE + 2, "reason": "invalid date"},
+    ]
+    assert len(rows) == 2
+
+
+def test_excel_memo_and_total_rows_are_skipped_not_rejected(tmp_path):
+    items = line_items()
+    items.insert(1, dated_memo(items[0]))
+    items.append({**BLANK, "Date": "TOTAL", "Quantity": "8"})
+    path = str(tmp_path / "export.xlsx")
+    write_xlsx(path, items)
+
+    rejected = []
+    rows, _ = handle_file(path, rejected=rejected)
+
+    assert rejected == []
+    assert len(rows) == 4
+
+
+def test_excel_invalid_quantity_is_rejected(tmp_path):
+    items = line_items()
+    items[3] = {**items[3], "Quantity": "two"}
+    path = str(tmp_path / "export.xlsx")
+    write_xlsx(path, items)
+
+    rejected = []
+    rows, _ = handle_file(path, rejected=rejected)
+
+    assert rejected == [{"row": FIRST_XLSX_ROW + 3, "reason": "invalid quantity"}]
+    assert len(rows) == 3
+
+
+def test_cli_exits_zero_for_an_export_with_memo_lines(tmp_path):
+    items = line_items()
+    items.insert(1, dated_memo(items[0]))
+    path = str(tmp_path / "export.tsv")
+    write_tsv(path, items, continuation_rate=0, memo_rate=0)
+
+    assert cli.main([path, "-o", str(tmp_path / "tickets"), "--no-cache"]) == 0
+
+
+def test_cli_exits_one_for_rejected_rows(tmp_path):
+    items = line_items()
+    items[1] = {**items[1], "Quantity": "two"}
+    path = str(tmp_path / "export.tsv")
+    write_tsv(path, items, continuation_rate=0, memo_rate=0)
+
+    assert cli.main([path, "-o", str(tmp_path / "tickets"), "--no-cache"]) == 1
+
+
+def test_streamed_parsing_is_timed_apart_from_grouping(tmp_path):
+    path = str(tmp_path / "export.tsv")
+    write_tsv(path, line_items(), continuation_rate=0, memo_rate=0)
+
+    metrics.enable()
+    metrics.reset()
+    try:
+        grouped = group_orders(iter_file_rows(path))
+        stages = metrics.snapshot()["stages"]
+    finally:
+        metrics.reset()
+        metrics.enable(False)
+
+    assert len(grouped) == 2
+    assert stages["parse"]["count"] == stages["group"]["count"] == 1
@@ -1,19 +1,23 @@
 import tkinter as tk
+import importlib
 import os
 import threading
 from tkinter import messagebox, filedialog
 from instructions_window import show_instructions
-from tsv_handler import handle_file
-from pdf_handler import generate_tickets, generate_previews, group_orders
-from pdf2image import convert_from_path
-from PIL import Image, ImageTk
-from dropbox_sign import ApiClient, Configuration, apis, models
-from dropbox_sign.rest import ApiException
 from tkinter import ttk
 from tkinter.simpledialog import askstring
-from dropbox import send_signature_request
+from preview_cache import PreviewCache
+from metrics import ThroughputMeter
 import sys
 
+# Modules that pull in heavy dependencies (PyMuPDF, openpyxl, dropbox_sign, PIL, requests).
+# They are imported where first used, never before the first window is drawn,
+# and warm_up() loads them in the background once the GUI is up.
+DEFERRED_MODULES = ("pdf_handler", "tsv_handler", "dropbox", "PIL.ImageTk", "requests")
+
+# How often the signing status of sent tickets is refreshed while the app is open
+SIGNATURE_SYNC_INTERVAL_MS = 5 * 60 * 1000
+
 class TicketApp:
     def __init__(self, root):
         """ 
@@ -28,9 +32,97 @@ class TicketApp:
         self.data_path = ""
         self.pdf_path = os.path.join(os.path.dirname(__file__), "assets", "delivery_ticket_template.pdf")
         self.status_label = None
+        self.signature_queue = None
+        self.signature_status = {}
+        self.preview_queue = None
+        self.preview_batch = 0
+        self._signature_queue_lock = threading.Lock()
+        self.root.protocol("WM_DELETE_WINDOW", self.close)
 
         self.setup_welcome_screen()
 
+    def close(self):
+        """
+        Stop the background work and close the app.
+
+        The signature queue is stopped so an upload in progress can finish and
+        be recorded; jobs that did not get their turn stay queued for next time.
+        """
+        if self.preview_queue is not None:
+            self.preview_queue.cancel()
+        with self._signature_queue_lock:
+            if self.signature_queue is not None:
+                self.signature_queue.stop()
+        self.root.destroy()
+
+    def warm_up(self):
+        """
+        Import the heavy feature modules on a background thread.
+
+        Called once the first frame is on screen, so the first click on
+        Generate or Send does not pay for loading PyMuPDF or dropbox_sign.
+        """
+        def load():
+            for name in DEFERRED_MODULES:
+                try:
+                    importlib.import_module(name)
+                except Exception as e:
+                    print(f"Background import of {name} failed: {e}")
+
+            # Pick up sends left unfinished by the last session
+            from signature_queue import default_db_path
+            if os.path.exists(default_db_path()):
+                self.get_signature_queue()
+
+        threading.Thread(target=load, daemon=True).start()
+
+    def get_signature_queue(self):
+        """
+        Open the persistent signature queue and start sending, on first use.
+
+        Returns:
+            SignatureQueue: The running queue.
+        """
+        with self._signature_queue_lock:
+            if self.signature_queue is None:
+                from dropbox import default_concurrency
+                from signature_queue import SignatureQueue
+
+                def on_status(job):
+                    self.root.after(0, lambda: self._on_signature_status(job))
+
+                self.signature_queue = SignatureQueue(workers=default_concurrency(), on_status=on_status).start()
+                self.root.after(0, self._sync_signature_statuses)
+            return self.signature_queue
+
+    def _sync_signature_statuses(self):
+        """
+        Refresh the signing status of outstanding requests in the background, then again
+        every SIGNATURE_SYNC_INTERVAL_MS. Changes arrive through the queue's status callback.
+        """
+        def sync():
+            from signature_sync import StatusSync
+
+            try:
+                StatusSync(self.signature_queue).sync()
+            except Exception as e:
+                print(f"Signature status sync failed: {e}")
+
+        threading.Thread(target=sync, daemon=True).start()
+        self.root.after(SIGNATURE_SYNC_INTERVAL_MS, self._sync_signature_statuses)
+
+    def _on_signature_status(self, job):
+        """
+        Record a send status change and refresh the preview if it shows that ticket.
+
+        Args:
+            job (SignatureJob): The job whose status changed.
+        """
+        self.signature_status[job.ticket_key] = job
+        preview_window = getattr(self, "preview_window", None)
+        if preview_window is not None and preview_window.winfo_exists() and self.preview_data:
+            self._update_page_label()
+
     def hide_all_frames(self):
         """
         Hide all frame widgets in the application.
@@ -120,63 +212,155 @@ class TicketApp:
             filename = os.path.basename(self.data_path)
             self.status_label.config(text=f"Quickbook Data file(s) Loaded. Loaded: {filename}")
     
-    def _show_preview_and_close_loader(self, pdf_paths):
+    def _show_preview_and_close_loader(self, preview_keys):
         """
         Close the loading window and display the preview of generated PDF tickets.
 
         Args:
-            pdf_paths (list[str]): List of file paths to the generated preview PDFs.
+            preview_keys (list[str]): Artifact keys of the generated preview PDFs.
         """
         self.loading_window.destroy()
-        self.preview_tickets(pdf_paths)
+        self.preview_tickets(preview_keys)
 
-    def _generate_in_background_with_progress(self):
+    def _on_ticket_rendered(self, batch, ticket_id, preview_key):
         """
-        Generate preview tickets in a background thread while updating progress UI.
+        Record a preview PDF that finished rendering in the background.
+
+        The first ticket to finish closes the loading window and opens the
+        preview window; later ones fill in their slot and refresh the display
+        if the user is waiting on them. Results of an earlier batch are dropped.
+
+        Args:
+            batch (int): The preview batch the ticket was rendered for.
+            ticket_id (int): Position of the ticket in the grouped orders.
+            preview_key (str | None): Artifact key of the preview PDF, or None if rendering failed.
+        """
+        from artifact_store import get_artifact_store
+
+        position = None
+        if batch == self.preview_batch and ticket_id in self.preview_ids:
+            position = self.preview_ids.index(ticket_id)  # Otherwise removed while it rendered
+        if position is None or not (self.loading_window.winfo_exists() or self.preview_window.winfo_exists()):
+            if preview_key:
+                get_artifact_store().discard(preview_key)
+            return
+
+        self.render_meter.update(self.render_meter.done + 1)
+        if preview_key:
+            self.preview_keys[position] = preview_key
+            _, ticket, email = self.preview_data[position]
+            self.preview_data[position] = (preview_key, ticket, email)
+
+        if self.loading_window.winfo_exists():
+            self._show_preview_and_close_loader(self.preview_keys)
+        elif position == self.current_pdf_index:
+            self.show_current_image()
+        else:
+            self._update_page_label()
+
+    def _on_ticket_render_failed(self, batch, ticket_id, error):
+        """
+        Record a ticket whose preview could not be rendered.
+
+        Args:
+            batch (int): The preview batch the ticket was rendered for.
+            ticket_id (int): Position of the ticket in the grouped orders.
+            error (Exception): What went wrong.
+        """
+        if batch == self.preview_batch:
+            self.preview_errors[ticket_id] = str(error)
+        self._on_ticket_rendered(batch, ticket_id, None)
+
+    def _start_preview_batch(self, batch, tickets):
+        """
+        Start rendering the previews of a batch, unless a newer batch replaced it.
+
+        Runs on the Tk thread, so the preview state is complete before the
+        first render callback can arrive.
+
+        Args:
+            batch (int): The batch the tickets belong to.
+            tickets (list[TicketInfo]): The batch's tickets, in display order.
+        """
+        from pdf_handler import start_previews
+
+        if batch != self.preview_batch:
+            return
+
+        self.orders_for_preview = tickets
+        self.preview_ids = list(range(len(tickets)))
+        self.preview_keys = [None] * len(tickets)
+        self.preview_errors = {}
+        self.render_meter = ThroughputMeter(len(tickets))
+        self.preview_data = [(None, ticket, ticket.EmailAddress) for ticket in tickets]
+
+        def on_ready(ticket_id, preview_key):
+            self.root.after(0, lambda: self._on_ticket_rendered(batch, ticket_id, preview_key))
+
+        def on_error(ticket_id, error):
+            self.root.after(0, lambda: self._on_ticket_render_failed(batch, ticket_id, error))
+
+        self.preview_queue = start_previews(tickets, self.pdf_path, on_ready, on_error=on_error)
+
+    def _generate_in_background_with_progress(self, batch):
+        """
+        Start preview generation in a background thread while updating progress UI.
 
         - Processes the loaded Excel/TSV file,
         - Groups and sorts orders,
-        - Generates previews with a progress callback,
-        - Displays the preview once done.
+        - Starts streaming previews in the background,
+        - Displays the preview window as soon as the first ticket is ready.
 
         On failure, shows an error message and closes the loader window.
+
+        Args:
+            batch (int): The preview batch being generated.
         """
-        #orders, _ = handle_file(self.data_path)
-        #orders.sort(key=lambda o: o[3].lower())
-        #self.orders_for_preview = orders
+        from tsv_handler import iter_file_rows
+        from pdf_handler import create_ticket_from_group, group_orders
+
         try:
-            orders, _ = handle_file(self.data_path)
-            orders.sort(key=lambda o: o[3].lower())
-            self.orders_for_preview = orders
- 
-            grouped = group_orders(orders)
+            grouped = group_orders(iter_file_rows(self.data_path))
             grouped.sort(key=lambda g: g[3])
 
-            def update_progress(progress):
-                # Update the progress bar value
-                self.root.after(0, lambda: self.progress_var.set(progress))
-                # Update the percentage label text, rounding to int for display
-                self.root.after(0, lambda: self.progress_label.config(text=f"{int(progress)}%"))
-
-            self.preview_data = generate_previews(grouped, self.pdf_path, progress_callback=update_progress)
+            if not grouped:
+                self.root.after(0, lambda: batch == self.preview_batch and self._show_preview_and_close_loader([]))
+                return
 
-            pdf_paths = [p[0] for p in self.preview_data]
-            self.root.after(0, lambda: self._show_preview_and_close_loader(pdf_paths))
+            # Keep the built tickets rather than the raw groups; saving renders from the same batch
+            tickets = [create_ticket_from_group(group) for group in grouped]
+            self.root.after(0, lambda: self._start_preview_batch(batch, tickets))
 
         except Exception as e:
-            self.root.after(0, lambda e=e: messagebox.showerror("Error", str(e)))
-            self.root.after(0, self.loading_window.destroy)
+            def fail(e=e):
+                if batch == self.preview_batch:
+                    messagebox.showerror("Error", str(e))
+                    self.loading_window.destroy()
+
+            self.root.after(0, fail)
 
     def generate(self):
         """
         Start the ticket generation process.
 
         Verifies required files are selected, then opens a loading window
-        with a progress bar and starts background ticket generation.
+        with a progress bar and starts background ticket generation. The
+        loading window is replaced by the preview as soon as the first ticket is ready.
         """
         if not self.data_path or not self.pdf_path:
             messagebox.showerror("Missing Files", "Please select Excel/TSV and PDF template.")
             return
+
+        # A new batch replaces the previous one; its renders still in flight are dropped
+        preview_window = getattr(self, "preview_window", None)
+        if preview_window is not None and preview_window.winfo_exists():
+            self._close_preview_window()
+        elif self.preview_queue is not None:
+            self.preview_queue.cancel()
+        loading_window = getattr(self, "loading_window", None)
+        if loading_window is not None and loading_window.winfo_exists():
+            loading_window.destroy()
+        self.preview_batch += 1
         
         self.loading_window = tk.Toplevel(self.root)
         self.loading_window.title("Generating Tickets...")
@@ -186,17 +370,13 @@ class TicketApp:
 
         tk.Label(self.loading_window, text="Generating tickets, please wait...").pack(pady=(10, 5))
 
-        # Progress bar widget
-        self.progress_var = tk.DoubleVar()
-        self.progress_bar = ttk.Progressbar(self.loading_window, variable=self.progress_var, maximum=100)
+        # Progress bar widget; spins until the first ticket is ready and the preview opens
+        self.progress_bar = ttk.Progressbar(self.loading_window, mode="indeterminate", maximum=100)
         self.progress_bar.pack(pady=(5, 10), fill='x', padx=20)
-
-        # Percentage label
-        self.progress_label = tk.Label(self.loading_window, text="0%")
-        self.progress_label.pack(pady=(0, 10))
+        self.progress_bar.start(10)
 
         # Start generation in background
-        threading.Thread(target=self._generate_in_background_with_progress).start()
+        threading.Thread(target=self._generate_in_background_with_progress, args=(self.preview_batch,)).start()
 
     def resource_path(self, relative_path):
         """
@@ -215,50 +395,105 @@ class TicketApp:
             base_path = os.path.abspath(".")
         return os.path.join(base_path, relative_path)
     
-    def get_poppler_path(self):
+    def load_pdf_images(self, preview_key):
         """
-        Returns the path to Poppler's bin folder.
-        Works both when running main.py and when running as a PyInstaller exe.
+        Render the first page of a PDF file as preview image data.
+
+        Rasterizes the first page in-process with PyMuPDF directly at the
+        600px display width, reading the PDF from the artifact store. Runs on
+        the preview cache's worker thread.
+        
+        Args:
+            preview_key (str): Artifact key of the PDF to preview.
+
+        Returns:
+            bytes: PPM image data for tk.PhotoImage.
         """
-        # Use resource_path to get the correct path whether in exe or script
-        poppler_dir = self.resource_path(os.path.join("assets", "poppler", "Library", "bin"))
+        from artifact_store import get_artifact_store
+        from pdf_handler import render_preview_image
 
-        if not os.path.exists(poppler_dir):
-            raise FileNotFoundError(f"Poppler not found at {poppler_dir}")
+        pdf_bytes = get_artifact_store().get(preview_key)
+        if pdf_bytes is None:
+            raise KeyError(f"Preview {preview_key} is no longer available")
+        return render_preview_image(pdf_bytes, max_width=600)
 
-        return poppler_dir
+    def _on_preview_ready(self, preview_key, ppm_data):
+        """
+        Receive a preview rendered in the background and hand it to the Tk thread.
 
-    def load_pdf_images(self, pdf_path):
+        Args:
+            preview_key (str): The ticket the image belongs to.
+            ppm_data (bytes | None): The rendered image, or None if rendering failed.
         """
-        Load the first page of a PDF file as a resized preview image.
+        self.root.after(0, lambda: self._show_ready_preview(preview_key, ppm_data))
+
+    def _show_ready_preview(self, preview_key, ppm_data):
+        """
+        Display a background-rendered preview if its ticket is still the current one.
+
+        Args:
+            preview_key (str): The ticket the image belongs to.
+            ppm_data (bytes | None): The rendered image, or None if rendering failed.
+        """
+        if not self.preview_window.winfo_exists() or not self.preview_keys:
+            return
+        if self.preview_keys[self.current_pdf_index] != preview_key:
+            return
+        if ppm_data is None:
+            self.preview_label.config(image="", text="Preview unavailable")
+            return
+        self._display_preview(ppm_data)
+
+    def _display_preview(self, ppm_data):
+        """
+        Put rendered preview image data on screen.
 
-        Converts the first page of the specified PDF to an image,
-        resizes it to fit within 600px width, and stores it in `self.preview_images`.
-        
         Args:
-            pdf_path (str): Path to the PDF file to preview.
+            ppm_data (bytes): PPM image data.
+        """
+        self.preview_images = [tk.PhotoImage(data=ppm_data)]
+        self.preview_label.config(image=self.preview_images[0], text="")
+        self.preview_label.image = self.preview_images[0]  # keep reference
+        self.preview_label.update_idletasks()  # Force update
+
+    def _neighbour_keys(self):
+        """
+        Tickets next to the current one, nearest first, for prefetching.
+
+        Returns:
+            list[str]: Artifact keys to render ahead of navigation.
+        """
+        count = len(self.preview_keys)
+        offsets = (1, -1, 2, -2, 3)
+        indices = dict.fromkeys((self.current_pdf_index + o) % count for o in offsets)
+        indices.pop(self.current_pdf_index, None)
+        return [self.preview_keys[i] for i in indices if self.preview_keys[i]]
+
+    def _close_preview_window(self):
+        """
+        Stop background ticket and preview rendering, drop the rendered PDFs and close the preview window.
         """
-        poppler_path = self.get_poppler_path()
-        pages = convert_from_path(pdf_path, dpi=150, poppler_path=poppler_path)
-        first_page = pages[0]
-        max_width = 600
-        w_percent = max_width / float(first_page.size[0])
-        h_size = int(float(first_page.size[1]) * w_percent)
-        first_page = first_page.resize((max_width, h_size), Image.Resampling.LANCZOS)
-        self.preview_images = [ImageTk.PhotoImage(first_page)]
+        from artifact_store import get_artifact_store
+
+        self.preview_queue.cancel()
+        self.preview_cache.close()
+        store = get_artifact_store()
+        for preview_key in self.preview_keys:
+            if preview_key is not None:
+                store.discard(preview_key)
+        self.preview_window.destroy()
 
     def next_ticket(self):
         """
         Navigate to the next ticket in the preview list.
 
         Loops back to the first ticket if the end is reached.
-        Loads and displays the corresponding preview image.
+        Displays the corresponding preview image.
         """
-        if self.current_pdf_index + 1 < len(self.pdf_paths):
+        if self.current_pdf_index + 1 < len(self.preview_keys):
             self.current_pdf_index += 1
         else:
             self.current_pdf_index = 0
-        self.load_pdf_images(self.pdf_paths[self.current_pdf_index])
         self.show_current_image()
 
     def prev_ticket(self):
@@ -266,13 +501,12 @@ class TicketApp:
         Navigate to the previous ticket in the preview list.
 
         Loops to the last ticket if the beginning is passed.
-        Loads and displays the corresponding preview image.
+        Displays the corresponding preview image.
         """
         if self.current_pdf_index > 0:
             self.current_pdf_index -= 1
         else: 
-            self.current_pdf_index = len(self.pdf_paths) - 1
-        self.load_pdf_images(self.pdf_paths[self.current_pdf_index])
+            self.current_pdf_index = len(self.preview_keys) - 1
         self.show_current_image()
 
     def remove_ticket(self):
@@ -280,29 +514,39 @@ class TicketApp:
         Remove the currently previewed ticket from the list.
 
         Prompts for confirmation. If confirmed, deletes the current ticket
-        from both `self.pdf_paths` and `self.preview_data`.
+        from both `self.preview_keys` and `self.preview_data`.
 
         Closes the preview window if no tickets remain.
         """
-        if not self.pdf_paths or not self.preview_data:
+        if not self.preview_keys or not self.preview_data:
             return
 
         confirm = messagebox.askyesno("Remove Ticket", f"Are you sure you want to remove ticket {self.current_pdf_index + 1}?")
         if not confirm:
             return
 
-        del self.pdf_paths[self.current_pdf_index]
+        if self.preview_keys[self.current_pdf_index] is None and \
+                self.preview_ids[self.current_pdf_index] not in self.preview_errors:
+            self.render_meter.total -= 1  # Will never render, so it no longer counts towards the ETA
+        self.preview_queue.discard(self.preview_ids[self.current_pdf_index])
+        self.preview_errors.pop(self.preview_ids[self.current_pdf_index], None)
+        if self.preview_keys[self.current_pdf_index] is not None:
+            from artifact_store import get_artifact_store
+
+            self.preview_cache.discard(self.preview_keys[self.current_pdf_index])
+            get_artifact_store().discard(self.preview_keys[self.current_pdf_index])
+        del self.preview_ids[self.current_pdf_index]
+        del self.preview_keys[self.current_pdf_index]
         del self.preview_data[self.current_pdf_index]
 
-        if not self.pdf_paths:
+        if not self.preview_keys:
             messagebox.showinfo("Done", "All tickets removed.")
-            self.preview_window.destroy()
+            self._close_preview_window()
             return
 
-        if self.current_pdf_index >= len(self.pdf_paths):
-            self.current_pdf_index = len(self.pdf_paths) - 1
+        if self.current_pdf_index >= len(self.preview_keys):
+            self.current_pdf_index = len(self.preview_keys) - 1
 
-        self.load_pdf_images(self.pdf_paths[self.current_pdf_index])
         self.show_current_image()
 
     def choose_output_directory(self):
@@ -319,7 +563,10 @@ class TicketApp:
         Save all remaining tickets to a user-selected directory.
 
         Validates that orders are loaded and prompts for output folder.
-        Uses the ticket template to generate and save final PDF tickets.
+        Uses the ticket template to generate and save final PDF tickets, optionally
+        combining the mailed ones into a single print file. Tickets already rendered
+        for preview are written from the artifact store, and tickets unchanged since
+        an earlier save are copied from the render cache instead of being re-rendered.
         """
         if not self.orders_for_preview:
             messagebox.showerror("Error", "No orders loaded")
@@ -329,22 +576,63 @@ class TicketApp:
         if not output_dir:
             return
 
-        orders_remaining = [group for _, group, _ in self.preview_data]
-        generate_tickets(orders_remaining, self.pdf_path, output_dir)
+        merge_mailed = messagebox.askyesno(
+            "Print Batch", "Also combine all mailed tickets into a single PDF for printing?")
+
+        from pdf_handler import generate_tickets
+        from render_cache import RenderCache
+
+        orders_remaining = [ticket for _, ticket, _ in self.preview_data]
+        generate_tickets(orders_remaining, self.pdf_path, output_dir, merge_mailed=merge_mailed,
+                         cache=RenderCache(), artifacts=self.preview_keys)
         messagebox.showinfo("Saved", f"All tickets saved to:\n{output_dir}")
 
+    def _update_page_label(self):
+        """
+        Show the current position and, while tickets are still rendering,
+        how many are left, the render rate and the estimated time remaining.
+        """
+        text = f"Ticket {self.current_pdf_index + 1} of {len(self.preview_keys)}"
+        pending = self.preview_keys.count(None) - len(self.preview_errors)
+        if pending > 0:
+            throughput = self.render_meter.describe()
+            text += f" ({pending} still rendering, {throughput})" if throughput else f" ({pending} still rendering)"
+
+        # Send status comes from the local queue records, never from the API
+        from signature_queue import FAILED, ticket_key
+        job = self.signature_status.get(ticket_key(self.preview_data[self.current_pdf_index][1]))
+        if job is not None:
+            text += f" · Signature: {job.signing_status or job.status}".replace("_", " ")
+            if job.status == FAILED and job.error:
+                text += f" ({job.error[:60]})"
+        self.page_label.config(text=text)
+
     def show_current_image(self):
         """
-        Display the currently loaded preview image in the preview UI.
+        Display the current ticket's preview image in the preview UI.
 
-        Updates both the image and the page label showing current index.
+        Updates the page label immediately. A ticket that has not been
+        rendered yet is moved to the front of the render queue. The image
+        comes from the preview cache; on a miss a placeholder is shown and
+        the image is rendered in the background, while the neighbouring
+        tickets are prefetched.
         """
-        self.preview_label.config(image=self.preview_images[0])
-        self.preview_label.image = self.preview_images[0]  # keep reference
-        self.page_label.config(
-            text=f"Ticket {self.current_pdf_index + 1} of {len(self.pdf_paths)}"
-        )
-        self.preview_label.update_idletasks()  # Force update
+        self._update_page_label()
+        preview_key = self.preview_keys[self.current_pdf_index]
+        if preview_key is None:
+            ticket_id = self.preview_ids[self.current_pdf_index]
+            if ticket_id in self.preview_errors:
+                self.preview_label.config(image="", text=f"Rendering failed: {self.preview_errors[ticket_id]}")
+                return
+            self.preview_queue.prioritize(ticket_id)
+            self.preview_label.config(image="", text="Rendering ticket...")
+            return
+
+        ppm_data = self.preview_cache.request(preview_key, prefetch=self._neighbour_keys())
+        if ppm_data is None:
+            self.preview_label.config(image="", text="Loading preview...")
+            return
+        self._display_preview(ppm_data)
 
     def send_to_docusign(self):
         """
@@ -352,12 +640,12 @@ class TicketApp:
 
         - Retrieves the ticket info and signer email from the preview data.
         - Prompts the user for the signer's name (and email if missing).
-        - Calls `send_signature_request()` with the signer info and PDF path.
-        - Displays a success or error message based on the result.
+        - Queues the ticket on the persistent signature queue, which uploads it in
+          the background; the page label shows its status as it changes.
         
         If required data is missing or invalid, displays appropriate error dialogs.
         """
-        if not self.pdf_paths:
+        if not self.preview_keys:
             messagebox.showerror("Error", "No tickets available to send.")
             return
 
@@ -381,28 +669,102 @@ class TicketApp:
             if not signer_email:
                 return
 
-        current_pdf_path = self.pdf_paths[self.current_pdf_index]
+        preview_key = self.preview_keys[self.current_pdf_index]
+        if preview_key is None:
+            messagebox.showerror("Error", "This ticket has not finished rendering yet.")
+            return
 
         try:
-            request_id = send_signature_request(
-                signer_name=signer_name,
-                signer_email=signer_email,
-                pdf_path=current_pdf_path
-            )
-
-            if "Error:" in str(request_id):
-                messagebox.showerror("Error", request_id)
-            else:
-                messagebox.showinfo("Success", f"Sent to {signer_email}.\nRequest ID:\n{request_id}")
+            _, ticket, _ = self.preview_data[self.current_pdf_index]
+            self._queue_signature(ticket, signer_name, signer_email, preview_key)
         except Exception as e:
             messagebox.showerror("Error", str(e))
 
-    def preview_tickets(self, pdf_paths):
+    def _queue_signature(self, ticket, signer_name, signer_email, preview_key):
+        """
+        Add one ticket to the signature queue.
+
+        In template mode (DROPBOX_SIGN_MODE=template) a ticket that fits the
+        template is queued as field values for the registered template; any
+        other ticket is queued as its rendered PDF. A ticket whose last send to
+        the same address failed is retried instead of queued again.
+
+        Args:
+            ticket (TicketInfo): The ticket.
+            signer_name (str): Who is asked to sign.
+            signer_email (str): Where the request is sent.
+            preview_key (str): Artifact key of the rendered ticket.
+
+        Raises:
+            ValueError: If the rendered ticket was discarded in the meantime.
+        """
+        from artifact_store import get_artifact_store
+        from dropbox import TEMPLATE_MODE, signing_mode
+        from fill_pdf import fits_template, template_field_values
+        from signature_queue import FAILED, ticket_key
+
+        queue = self.get_signature_queue()
+        key = ticket_key(ticket)
+        job = self.signature_status.get(key)
+        if job is not None and job.status == FAILED and job.signer_email == signer_email:
+            queue.retry(job.id)
+        elif signing_mode() == TEMPLATE_MODE and fits_template(ticket, self.pdf_path):
+            queue.enqueue(key, signer_name, signer_email, template_path=self.pdf_path,
+                          field_values=template_field_values(ticket, self.pdf_path))
+        else:
+            pdf_bytes = get_artifact_store().get(preview_key)
+            if pdf_bytes is None:
+                raise ValueError(f"The rendered ticket for {signer_name} is no longer available.")
+            queue.enqueue(key, signer_name, signer_email, pdf_bytes)
+
+    def send_all_emailed(self):
+        """
+        Queue every rendered ticket that has an email address for signature in one go.
+
+        - Collects the emailed tickets whose preview PDF is ready and that were not
+          already sent or queued.
+        - Asks for confirmation, then adds them to the persistent signature queue on a
+          background thread; the queue uploads them concurrently and retries failures.
+        """
+        from signature_queue import FAILED, ticket_key
+
+        jobs = []
+        for preview_key, ticket, email in self.preview_data:
+            if not (email and preview_key):
+                continue
+            key = ticket_key(ticket)
+            job = self.signature_status.get(key)
+            if job is not None and job.status != FAILED:
+                continue
+            signer_name = f"{ticket.PatientFirstName} {ticket.PatientLastName}".strip()
+            jobs.append((ticket, signer_name, email, preview_key))
+
+        if not jobs:
+            messagebox.showinfo("Nothing to Send", "No rendered, unsent tickets have an email address.")
+            return
+
+        waiting = sum(1 for preview_key, _, email in self.preview_data if email and not preview_key)
+        prompt = f"Send {len(jobs)} emailed tickets for signature?"
+        if waiting:
+            prompt += f"\n\n{waiting} emailed tickets are still rendering and will not be sent."
+        if not messagebox.askyesno("Send All Emailed", prompt):
+            return
+
+        def enqueue():
+            try:
+                for job in jobs:
+                    self._queue_signature(*job)
+            except Exception as e:
+                self.root.after(0, lambda e=e: messagebox.showerror("Error", str(e)))
+
+        threading.Thread(target=enqueue, daemon=True).start()
+
+    def preview_tickets(self, preview_keys):
         """
         Launch a new window to preview, navigate, delete, save, or send tickets.
 
         Args:
-            pdf_paths (list[str]): List of file paths to generated preview PDFs.
+            preview_keys (list[str]): Artifact keys of the generated preview PDFs.
 
         Creates a scrollable preview interface with:
         - PDF image display,
@@ -412,7 +774,7 @@ class TicketApp:
 
         Also binds arrow keys for easier navigation.
         """
-        if not pdf_paths:
+        if not preview_keys:
             messagebox.showerror("Error", "No PDFs to preview.")
             return
 
@@ -421,11 +783,17 @@ class TicketApp:
         self.preview_window.geometry("850x900")
         self.preview_window.configure(bg="#f5f5f5")
         self.preview_window.focus_set()
+        self.preview_window.protocol("WM_DELETE_WINDOW", self._close_preview_window)
 
-        self.pdf_paths = pdf_paths
+        self.preview_keys = preview_keys
         self.current_pdf_index = 0
         self.preview_images = []
         self.current_page = 0
+        self.preview_cache = PreviewCache(self.load_pdf_images, on_ready=self._on_preview_ready)
+        if self.signature_queue is not None:
+            from signature_queue import ticket_key
+            self.signature_status.update(
+                self.signature_queue.latest(ticket_key(ticket) for _, ticket, _ in self.preview_data))
 
         header = tk.Label(self.preview_window, text="PDF Ticket Preview",
                           font=("Segoe UI", 14, "bold"), bg="#f5f5f5")
@@ -444,7 +812,7 @@ class TicketApp:
         self.image_container = tk.Frame(self.canvas, bg="#f5f5f5")
         self.canvas.create_window((0, 0), window=self.image_container, anchor="nw")
 
-        self.preview_label = tk.Label(self.image_container, bg="#f5f5f5")
+        self.preview_label = tk.Label(self.image_container, bg="#f5f5f5", font=("Segoe UI", 10))
         self.preview_label.pack(pady=10)
 
         def resize_canvas(event):
@@ -480,9 +848,9 @@ class TicketApp:
         styled_button("🗑 Remove", self.remove_ticket).pack(side=tk.LEFT, padx=5)
         styled_button("💾 Save All", self.save_all_tickets).pack(side=tk.LEFT, padx=5)
         styled_button("✉️ Send to DocuSign", self.send_to_docusign).pack(side=tk.LEFT, padx=5)
+        styled_button("📨 Send All Emailed", self.send_all_emailed).pack(side=tk.LEFT, padx=5)
 
         self.preview_window.bind("<Left>", lambda event: self.prev_ticket())
         self.preview_window.bind("<Right>", lambda event: self.next_ticket())
 
-        self.load_pdf_images(self.pdf_paths[self.current_pdf_index])
         self.show_current_image()
@@ -1,11 +1,13 @@
 from dataclasses import dataclass, field
 from typing import List, Optional
 
-@dataclass
+@dataclass(slots=True)
 class TicketInfo:
     """
     Data model representing a patient's delivery ticket information.
 
+    Slotted, so a batch of thousands of tickets carries no per-instance __dict__.
+
     Attributes:
         PatientFirstName (str): Patient's first name.
         PatientLastName (str): Patient's last name.
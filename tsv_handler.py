@@ -1,7 +1,37 @@
+import collections
 import csv
 import datetime
-import pandas as pd
+import functools
+import hashlib
+import itertools
 import math
+import sys
+
+import metrics
+from date_utils import is_mmddyyyy
+
+# Columns read from an Excel export, in the order of each cleaned row
+XLSX_COLUMNS = (
+    "Date",
+    "Customer first name",
+    "Customer middle name",
+    "Customer last name",
+    "Account number",
+    "Customer ship street",
+    "Customer ship city",
+    "Customer ship state",
+    "Customer ship zip",
+    "Customer phone",
+    "Customer email",
+    "Quantity",
+    "Category",
+    "Product/service description",
+    "SKU",
+)
+
+# Positions of cleaned-row values that repeat across a batch (date, city, state,
+# category, description, SKU, HCPCS) and are interned so every ticket shares one copy
+INTERNED_POSITIONS = (0, 6, 7, 12, 13, 14, 15)
 
 def safe_str(value):
     """
@@ -33,11 +63,7 @@ def is_safe_mmddyyyy(line):
     Returns:
         bool: True if valid, False otherwise.
     """
-    try:
-        datetime.datetime.strptime(line, "%m/%d/%Y")
-        return True
-    except (IndexError, ValueError, TypeError):
-        return False
+    return is_mmddyyyy(line)
 
 
 def is_valid_quantity(value):
@@ -74,119 +100,448 @@ def is_memo(row):
     )
 
 
-def remove_duplicates(rows):
+class RowDeduplicator:
+    """
+    Drops repeated rows while remembering only a 16-byte fingerprint of each unique row.
+
+    Rows are canonicalized before hashing: dictionaries by sorted key, so
+    two dict rows with the same values are duplicates whatever their key
+    order, and every value by its string form.
+
+    Attributes:
+        dropped (int): Number of duplicate rows seen so far.
+        duplicate_rows (list): Row numbers (as given to is_duplicate) of the dropped rows.
+    """
+
+    def __init__(self):
+        self._fingerprints = set()
+        self.dropped = 0
+        self.duplicate_rows = []
+
+    @staticmethod
+    def fingerprint(row):
+        """
+        Computes the fixed-size digest of a row's canonical form.
+
+        Parameters:
+            row (dict | list | tuple): The row.
+
+        Returns:
+            bytes: A 16-byte BLAKE2b digest.
+        """
+        if isinstance(row, dict):
+            fields = sorted((str(key), str(value)) for key, value in row.items())
+            canonical = '\x1f'.join(f"{key}\x1e{value}" for key, value in fields)
+        else:
+            canonical = '\x1f'.join(str(value) for value in row)
+        return hashlib.blake2b(canonical.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+
+    def is_duplicate(self, row, row_number=None):
+        """
+        Checks a row against every row seen before and records it if it is new.
+
+        Parameters:
+            row (dict | list | tuple): The row.
+            row_number (int | None): Where the row came from, for the duplicate report.
+
+        Returns:
+            bool: True if an identical row was already seen.
+        """
+        fingerprint = self.fingerprint(row)
+        if fingerprint in self._fingerprints:
+            self.dropped += 1
+            if row_number is not None:
+                self.duplicate_rows.append(row_number)
+            return True
+        self._fingerprints.add(fingerprint)
+        return False
+
+
+def remove_duplicates(rows, dedup=None):
     """
     Removes duplicate rows from a list of lists or dicts.
 
     Parameters:
         rows (list): A list of rows (each row is a list or dict).
+        dedup (RowDeduplicator | None): Tracker to use, e.g. to read its report afterwards.
 
     Returns:
         list: A list containing only unique rows.
     """
-    seen = set()
-    unique_rows = []
-    for row in rows:
-        row_tuple = tuple(row.items()) if isinstance(row, dict) else tuple(row)
-        if row_tuple not in seen:
-            seen.add(row_tuple)
-            unique_rows.append(row)
-    return unique_rows
+    if dedup is None:
+        dedup = RowDeduplicator()
+    return [row for number, row in enumerate(rows, start=1) if not dedup.is_duplicate(row, number)]
 
 
-def handle_file(input_path):
+def _reject(rejected, row_number, reason):
     """
-    Reads, cleans, and processes a TSV or Excel (.xlsx) file of QuickBooks exports.
-    Removes duplicates and separates memo lines.
+    Records a row that looked like a line item but could not be used.
 
     Parameters:
-        input_path (str): Path to the input file (must be .xlsx or .tsv).
+        rejected (list | None): Where rejected rows are collected, if anywhere.
+        row_number (int): Line (TSV) or worksheet row (Excel) of the row.
+        reason (str): Why it was rejected.
+    """
+    metrics.count("rows_rejected")
+    if rejected is not None:
+        rejected.append({"row": row_number, "reason": reason})
+
+
+def _iter_data_rows(reader, header_rows=5, trailer_rows=4):
+    """
+    Yields the data rows of a QuickBooks TSV export, dropping its header and trailer rows.
+
+    Only header_rows + trailer_rows + 1 rows are ever buffered. As before,
+    exports too short to have both a header and a trailer are passed
+    through whole.
+
+    Parameters:
+        reader (iterable): Row dictionaries from csv.DictReader.
+        header_rows (int): Rows to drop from the start.
+        trailer_rows (int): Rows to drop from the end.
+
+    Yields:
+        tuple: (line_number, row) for each data row, in file order; line 1 is the header.
+    """
+    numbered = enumerate(reader, start=2)
+    head = list(itertools.islice(numbered, header_rows + trailer_rows + 1))
+    if len(head) <= header_rows + trailer_rows:
+        yield from head
+        return
+
+    lookahead = collections.deque(head[header_rows:])
+    for item in numbered:
+        lookahead.append(item)
+        yield lookahead.popleft()
+    for _ in range(trailer_rows):
+        lookahead.pop()
+    yield from lookahead
+
+
+def _finish_row(row, continuation):
+    """
+    Applies the buffered continuation lines to a row and derives its HCPCS code.
+
+    Parameters:
+        row (dict): The row that started a line item.
+        continuation (list): Text of the continuation lines that followed it.
 
     Returns:
-        tuple:
-            - cleaned_rows (list): A list of cleaned data rows (list of values for Excel, dicts for TSV).
-            - memos (list): A list of memo rows (only for TSV).
+        dict: The completed row.
     """
-    cleaned_rows = []
-    memos = []
+    if continuation:
+        row['Product/Service Description'] = (
+            row.get('Product/Service Description', '') + ''.join(' ' + text for text in continuation)
+        )
+    return row
 
-    if input_path.endswith(".xlsx"):
-        df = pd.read_excel(input_path, skiprows=4)
-        df.dropna(how="all", inplace=True)
-        df.columns = [col.strip() for col in df.columns]
-
-        for i, row in df.iterrows():
-            quantity = row.get("Quantity", "")
-            sku = str(row.get("SKU", "")).strip()
-            category = str(row.get("Category", "")).strip()
-            description = row.get("Product/service description", "")
-
-            if is_valid_quantity(quantity) and sku != '':
-                hcpcs_code = category.split()[0] if category else ''
-
-                new_row = [
-                    row.get("Date", ""),
-                    row.get("Customer first name", ""),
-                    safe_str(row.get("Customer middle name", "")),
-                    row.get("Customer last name", ""),
-                    safe_str(row.get("Account number", "")),
-                    row.get("Customer ship street", ""),
-                    row.get("Customer ship city", ""),
-                    row.get("Customer ship state", ""),
-                    row.get("Customer ship zip", ""),
-                    row.get("Customer phone", ""),
-                    row.get("Customer email", ""),
-                    str(quantity).strip(),
-                    category,
-                    description,
-                    sku,
-                    hcpcs_code
-                ]
-                cleaned_rows.append(new_row)
-
-        return remove_duplicates(cleaned_rows), memos
 
-    elif input_path.endswith(".tsv"):
-        with open(input_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f, delimiter='\t')
-            all_rows = list(reader)
+def iter_tsv_rows(input_path, memos=None, dedup=None, rejected=None):
+    """
+    Streams cleaned line items out of a QuickBooks TSV export.
 
-        data_rows = all_rows[5:-4] if len(all_rows) > 9 else all_rows
+    Rows are read one at a time: header and trailer rows are dropped with a
+    small lookahead buffer, continuation lines are merged into the row they
+    belong to as they are read, memo rows are routed to memos, and
+    duplicates are dropped on the fly, so memory does not grow with the
+    size of the export.
 
-        if not data_rows:
-            print("⚠️ No data rows to process.")
-            return [], []
+    Parameters:
+        input_path (str): Path to the .tsv file.
+        memos (list | None): If given, memo rows are appended to it as they are found.
+        dedup (RowDeduplicator | None): Tracker that drops and reports duplicates;
+            duplicate_rows holds file line numbers.
+        rejected (list | None): If given, rows whose quantity is filled in but not a
+            number, or whose date is filled in but not a date, are appended to it as
+            {"row": line number, "reason": ...}. A memo-shaped row (no quantity or SKU)
+            is never rejected for its date. Memo and continuation lines, dated or not,
+            are merged into the line above as before.
+
+    Yields:
+        dict: Each cleaned, de-duplicated line item with its 'HCPCS' code set.
+    """
+    if dedup is None:
+        dedup = RowDeduplicator()
+
+    def emit(line_number, row, continuation):
+        row = _finish_row(row, continuation)
+        if is_memo(row):
+            if memos is not None:
+                memos.append(row)
+            return None
+        category = row.get('Category', '')
+        row['HCPCS'] = category.split()[0] if category else ''
+        if dedup.is_duplicate(row, line_number):
+            return None
+        return row
+
+    with open(input_path, 'r', encoding='utf-8') as f:
+        reader = csv.DictReader(f, delimiter='\t')
 
         current_row = None
+        current_line = None
+        continuation = []
 
-        for row in data_rows:
-            date_val = row.get('Date', '')
-            quantity_val = row.get('Quantity', '')
+        for line_number, row in _iter_data_rows(reader):
+            date_val = row.get('Date') or ''
+            quantity_val = row.get('Quantity') or ''
+            valid_date = is_safe_mmddyyyy(date_val)
 
-            if is_safe_mmddyyyy(date_val) and is_valid_quantity(quantity_val):
+            if valid_date and is_valid_quantity(quantity_val):
                 if current_row:
-                    if is_memo(current_row):
-                        memos.append(current_row)
-                    else:
-                        cleaned_rows.append(current_row)
+                    finished = emit(current_line, current_row, continuation)
+                    if finished is not None:
+                        yield finished
                 current_row = row
-            else:
-                if current_row:
-                    current_row['Product/Service Description'] = (
-                        current_row.get('Product/Service Description', '') + ' ' + ' '.join(row.values()).strip()
-                    )
+                current_line = line_number
+                continuation = []
+            elif quantity_val.strip() and not is_valid_quantity(quantity_val):
+                _reject(rejected, line_number, "invalid quantity")
+            elif date_val.strip() and not valid_date and (quantity_val.strip() or (row.get('SKU') or '').strip()):
+                _reject(rejected, line_number, "invalid date")
+            elif current_row:
+                continuation.append(' '.join(row.values()).strip())
 
         if current_row:
-            if is_memo(current_row):
-                memos.append(current_row)
-            else:
-                cleaned_rows.append(current_row)
+            finished = emit(current_line, current_row, continuation)
+            if finished is not None:
+                yield finished
+
+
+def compact_row(values):
+    """
+    Freezes a cleaned row into a tuple, interning the values that repeat across a batch.
+
+    Parameters:
+        values (list): Values in XLSX_COLUMNS order followed by the HCPCS code.
+
+    Returns:
+        tuple: The compact row.
+    """
+    for position in INTERNED_POSITIONS:
+        value = values[position]
+        if type(value) is str:
+            values[position] = sys.intern(value)
+    return tuple(values)
+
 
-        for row in cleaned_rows:
-            category = row.get('Category', '')
-            row['HCPCS'] = category.split()[0] if category else ''
+def _xlsx_value(values, position):
+    """
+    Reads one cell of an Excel row by column position.
+
+    Empty and missing cells become "" and dates become MM/DD/YYYY strings,
+    matching what the TSV export contains.
+
+    Parameters:
+        values (tuple): The row's cell values.
+        position (int | None): Column position, or None if the column is absent.
+
+    Returns:
+        The cell value.
+    """
+    if position is None or position >= len(values):
+        return ""
+    value = values[position]
+    if value is None:
+        return ""
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.strftime("%m/%d/%Y")
+    return value
 
-        return remove_duplicates(cleaned_rows), memos
 
+def iter_xlsx_rows(input_path, skip_rows=4, dedup=None, rejected=None):
+    """
+    Streams cleaned line items out of a QuickBooks Excel (.xlsx) export.
+
+    The first worksheet is read in openpyxl's read-only mode one row at a
+    time. Column positions are resolved once from the header row that
+    follows the skipped rows, and duplicates are dropped on the fly.
+
+    Parameters:
+        input_path (str): Path to the .xlsx file.
+        skip_rows (int): Report title rows above the header row.
+        dedup (RowDeduplicator | None): Tracker that drops and reports duplicates;
+            duplicate_rows holds worksheet row numbers.
+        rejected (list | None): If given, rows with a SKU whose quantity is filled in
+            but not a number are appended to it as {"row": worksheet row, "reason": ...}.
+            Rows without a SKU or quantity (blank, memo and total rows) are skipped
+            without being reported.
+
+    Yields:
+        tuple: Each cleaned, de-duplicated line item, with values in XLSX_COLUMNS
+        order followed by the HCPCS code (see compact_row).
+    """
+    import openpyxl  # Deferred: only Excel imports need it
+
+    if dedup is None:
+        dedup = RowDeduplicator()
+
+    workbook = openpyxl.load_workbook(input_path, read_only=True, data_only=True)
+    try:
+        rows = workbook.worksheets[0].iter_rows(values_only=True)
+        for _ in range(skip_rows):
+            next(rows, None)
+
+        header = next(rows, None)
+        if header is None:
+            return
+        positions = {str(name).strip(): i for i, name in enumerate(header) if name is not None}
+        columns = [positions.get(name) for name in XLSX_COLUMNS]
+        quantity_col = columns[XLSX_COLUMNS.index("Quantity")]
+        sku_col = columns[XLSX_COLUMNS.index("SKU")]
+        category_col = columns[XLSX_COLUMNS.index("Category")]
+
+        for row_number, values in enumerate(rows, start=skip_rows + 2):
+            quantity = _xlsx_value(values, quantity_col)
+            sku = safe_str(_xlsx_value(values, sku_col)).strip()
+            if not is_valid_quantity(quantity) or sku == '':
+                if sku and safe_str(quantity).strip() and not is_valid_quantity(quantity):
+                    _reject(rejected, row_number, "invalid quantity")
+                continue
+
+            category = safe_str(_xlsx_value(values, category_col)).strip()
+            hcpcs_code = category.split()[0] if category else ''
+
+            new_row = [_xlsx_value(values, position) for position in columns]
+            new_row[2] = safe_str(new_row[2])    # Customer middle name
+            new_row[4] = safe_str(new_row[4])    # Account number
+            new_row[11] = str(quantity).strip()
+            new_row[12] = category
+            new_row[14] = sku
+            new_row.append(hcpcs_code)
+
+            new_row = compact_row(new_row)
+            if dedup.is_duplicate(new_row, row_number):
+                continue
+            yield new_row
+    finally:
+        workbook.close()
+
+
+@functools.lru_cache(maxsize=None)
+def _dict_row_keys(keys):
+    """
+    Matches the keys of a TSV row dictionary to XLSX_COLUMNS, ignoring case.
+
+    Where two keys differ only in case, the later one wins, which is the
+    description the continuation lines were merged into.
+
+    Parameters:
+        keys (tuple): The row's keys, in order.
+
+    Returns:
+        tuple: For each of XLSX_COLUMNS, the matching key or None.
+    """
+    by_name = {str(key).strip().lower(): key for key in keys if key is not None}
+    return tuple(by_name.get(name.lower()) for name in XLSX_COLUMNS)
+
+
+def order_row_from_dict(row):
+    """
+    Converts a TSV row dictionary into the positional row layout used for Excel rows.
+
+    Parameters:
+        row (dict): A cleaned TSV row.
+
+    Returns:
+        tuple: Values in XLSX_COLUMNS order followed by the HCPCS code (see compact_row).
+    """
+    keys = _dict_row_keys(tuple(row))
+    values = [row.get(key, '') if key is not None else '' for key in keys]
+    values.append(row.get('HCPCS', ''))
+    return compact_row(values)
+
+
+def iter_file_rows(input_path, memos=None, dedup=None, rejected=None):
+    """
+    Streams the cleaned line items of a TSV or Excel (.xlsx) QuickBooks export.
+
+    Meant to be fed straight into group_orders(), so no list of every row is
+    ever built. The time spent reading rows is recorded as the "parse" stage
+    once the file has been read.
+
+    Parameters:
+        input_path (str): Path to the input file (must be .xlsx or .tsv).
+        memos (list | None): If given, memo rows are appended to it (only for TSV).
+        dedup (RowDeduplicator | None): Tracker to use, to read how many duplicates
+            were dropped and from which rows afterwards.
+        rejected (list | None): Filled with the rows that looked like line items but
+            had an invalid date or quantity (see iter_tsv_rows / iter_xlsx_rows).
+
+    Yields:
+        Cleaned rows: dicts for TSV, tuples of values in XLSX_COLUMNS order plus the
+        HCPCS code for Excel.
+
+    Raises:
+        ValueError: If the file is neither .tsv nor .xlsx.
+    """
+    if memos is None:
+        memos = []
+    if dedup is None:
+        dedup = RowDeduplicator()
+    if rejected is None:
+        rejected = []
+
+    if input_path.endswith(".xlsx"):
+        source = iter_xlsx_rows(input_path, dedup=dedup, rejected=rejected)
+    elif input_path.endswith(".tsv"):
+        source = iter_tsv_rows(input_path, memos, dedup=dedup, rejected=rejected)
     else:
         raise ValueError("Unsupported file format. Only .tsv and .xlsx are supported.")
+
+    if metrics.is_enabled():
+        source = metrics.IterationTimer(source)
+
+    rows = 0
+    for row in source:
+        rows += 1
+        yield row
+
+    if isinstance(source, metrics.IterationTimer):
+        metrics.record("parse", source.seconds)
+
+    if input_path.endswith(".tsv") and not rows and not memos:
+        print("⚠️ No data rows to process.")
+
+    _count_parsed(rows, memos, dedup)
+
+
+def _count_parsed(rows, memos, dedup):
+    """
+    Counts what was read from an export. Reporting duplicates and rejected
+    rows is left to the caller, which holds the dedup tracker and the list.
+
+    Parameters:
+        rows (int): Line items kept.
+        memos (list): Memo rows found.
+        dedup (RowDeduplicator): The duplicate tracker used.
+    """
+    metrics.count("rows_parsed", rows)
+    metrics.count("memos_parsed", len(memos))
+    metrics.count("duplicates_dropped", dedup.dropped)
+
+
+def handle_file(input_path, dedup=None, rejected=None):
+    """
+    Reads, cleans, and processes a TSV or Excel (.xlsx) file of QuickBooks exports.
+    Removes duplicates and separates memo lines.
+
+    Kept for callers that need every row at once; the pipeline streams rows
+    with iter_file_rows() instead.
+
+    Parameters:
+        input_path (str): Path to the input file (must be .xlsx or .tsv).
+        dedup (RowDeduplicator | None): Tracker to use, to read how many duplicates
+            were dropped and from which rows afterwards.
+        rejected (list | None): Filled with the rows that looked like line items but
+            had an invalid date or quantity (see iter_tsv_rows / iter_xlsx_rows).
+
+    Returns:
+        tuple:
+            - cleaned_rows (list): A list of cleaned data rows (tuples of values in XLSX_COLUMNS
+              order plus the HCPCS code for Excel, dicts for TSV).
+            - memos (list): A list of memo rows (only for TSV).
+    """
+    memos = []
+    cleaned_rows = list(iter_file_rows(input_path, memos, dedup=dedup, rejected=rejected))
+    return cleaned_rows, memos